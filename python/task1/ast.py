@@ -1,11 +1,54 @@
 from __future__ import annotations
+import os
+import sys
 from dataclasses import dataclass
+from functools import partial
 from typing import List, Optional, Union
 
-@dataclass
+# Kompakt düğüm düzeni: __slots__ (per-instance __dict__ yok).
+# V3_AST_FROZEN=1 ile düğümler immutable (frozen) olur.
+_FROZEN = os.environ.get("V3_AST_FROZEN", "").strip().lower() in ("1", "true", "yes", "on")
+if sys.version_info >= (3, 10):
+    node = partial(dataclass, slots=True, frozen=_FROZEN)
+else:
+    node = partial(dataclass, frozen=_FROZEN)
+
+# satır/sütun tek int içinde: line << _COL_BITS | column (satır sınırsız, sütun < 2**32)
+_COL_BITS = 32
+_COL_MASK = (1 << _COL_BITS) - 1
+
+
 class SrcPos:
-    line: int
-    column: int
+    __slots__ = ("packed",)
+
+    def __init__(self, line: int, column: int) -> None:
+        if not 0 <= column <= _COL_MASK or line < 0:
+            # maskelemek sessizce yanlış konum üretirdi
+            raise ValueError(f"source position out of range: line={line}, column={column}")
+        self.packed = (line << _COL_BITS) | column
+
+    @classmethod
+    def from_packed(cls, packed: int) -> "SrcPos":
+        p = cls.__new__(cls)
+        p.packed = packed
+        return p
+
+    @property
+    def line(self) -> int:
+        return self.packed >> _COL_BITS
+
+    @property
+    def column(self) -> int:
+        return self.packed & _COL_MASK
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SrcPos) and other.packed == self.packed
+
+    def __hash__(self) -> int:
+        return hash(self.packed)
+
+    def __repr__(self) -> str:
+        return f"SrcPos(line={self.line}, column={self.column})"
 
 @dataclass
 class ParseError:
@@ -14,104 +57,108 @@ class ParseError:
     column: int
 
 # ---- Types ----
-@dataclass
-class TypeRef: pass
+@node
+class TypeRef:
+    pass
 
-@dataclass
+@node
 class BuiltinType(TypeRef):
     name: str
 
-@dataclass
+@node
 class CustomType(TypeRef):
     name: str
 
-@dataclass
+@node
 class ArrayType(TypeRef):
     base: TypeRef
     rank: int  # 1 for (), 2 for (,), etc.
 
 # ---- Program ----
-@dataclass
+@node
 class Program:
     items: List["FuncDef"]
 
-@dataclass
+@node
 class ArgDef:
     name: str
     type_ref: Optional[TypeRef]
 
-@dataclass
+@node
 class FuncSignature:
     name: str
     args: List[ArgDef]
     return_type: Optional[TypeRef]
 
-@dataclass
+@node
 class FuncDef:
     signature: FuncSignature
     body: Optional[List["Stmt"]]  # None = only declaration
 
 # ---- Statements ----
-class Stmt: pass
+class Stmt:
+    __slots__ = ()
 
-@dataclass
+@node
 class VarDecl(Stmt):
     names: List[str]
     type_ref: TypeRef
 
-@dataclass
-class Break(Stmt): pass
+@node
+class Break(Stmt):
+    pass
 
-@dataclass
+@node
 class If(Stmt):
     cond: "Expr"
     then_body: List[Stmt]
     else_body: Optional[List[Stmt]]
 
-@dataclass
+@node
 class While(Stmt):
     cond: "Expr"
     body: List[Stmt]
 
-@dataclass
+@node
 class DoLoop(Stmt):
     body: List[Stmt]
     mode: str  # "while"|"until"
     cond: "Expr"
 
-@dataclass
+@node
 class ExprStmt(Stmt):
     expr: "Expr"
 
 # ---- Expressions ----
-class Expr: pass
+class Expr:
+    __slots__ = ()
 
-@dataclass
+@node
 class Place(Expr):
     name: str
 
-@dataclass
+@node
 class Literal(Expr):
     kind: str
     value: str
 
-@dataclass
+@node
 class Unary(Expr):
     op: str
     rhs: Expr
 
-@dataclass
+@node
 class Binary(Expr):
     op: str
     lhs: Expr
     rhs: Expr
 
-@dataclass
+@node
 class Assign(Expr):
     lhs: Expr
     rhs: Expr
 
-@dataclass
+@node
 class CallOrIndexer(Expr):
     callee: Expr
     args: List[Expr]
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import gc
+import hashlib
+import struct
+import sys
+from array import array
+from contextlib import contextmanager
+from dataclasses import fields
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple, Union, get_args, get_origin, get_type_hints
+
+from . import ast as A
+
+# İkili AST formatı (.v3ast), sürüm 1:
+#
+#   header : MAGIC(5) | version u8 | schema hash(8) | str/num typecode u8 u8
+#            | n_strings u32 | strtab_bytes u32 | n_tags u32 | n_sidx u32 | n_nums u32
+#   strtab : UTF-8 stringler, "\0" ile ayrılmış (tekilleştirilmiş)
+#   tags   : düğüm başına 1 byte sınıf tag'i (0 = None), post-order
+#   sidx   : string alanlarının strtab indeksleri
+#   nums   : int alanları ve liste uzunlukları (len + 1; 0 = None)
+#
+# Post-order: bir düğümün tag'inden önce tüm çocukları gelir; yükleme bir değer
+# yığınıyla, özyinelemesiz yapılır. sidx/nums typecode'u (B/H/I/Q) en büyük
+# değere göre seçilir, diziler little-endian.
+MAGIC = b"V3AST"
+FORMAT_VERSION = 1
+SUFFIX = ".v3ast"
+
+_HEADER = struct.Struct("<5sB8sBBIIIII")
+_INT_CODES = b"BHIQ"          # sidx/nums için geçerli array typecode'ları
+
+# tag -> sınıf; sıra formatın parçasıdır (değişirse şema hash'i de değişir). 0 = None
+_CLASSES: Tuple[type, ...] = (
+    A.Program, A.FuncDef, A.FuncSignature, A.ArgDef,
+    A.BuiltinType, A.CustomType, A.ArrayType,
+    A.VarDecl, A.Break, A.If, A.While, A.DoLoop, A.ExprStmt,
+    A.Place, A.Literal, A.Unary, A.Binary, A.Assign, A.CallOrIndexer,
+)
+_TAG_OF: Dict[type, int] = {type(None): 0, **{cls: i + 1 for i, cls in enumerate(_CLASSES)}}
+
+# alan türleri
+_STR, _INT, _NODE, _LIST, _STRLIST = range(5)
+
+
+class AstFormatError(ValueError):
+    pass
+
+
+def _field_kind(t: Any) -> int:
+    if get_origin(t) is Union:
+        t = next(a for a in get_args(t) if a is not type(None))
+    if t is str:
+        return _STR
+    if t is int:
+        return _INT
+    if get_origin(t) in (list, List):
+        return _STRLIST if get_args(t)[0] is str else _LIST
+    return _NODE
+
+
+def _build_plans() -> Tuple[Tuple[Tuple[str, int], ...], ...]:
+    plans = []
+    for cls in _CLASSES:
+        hints = get_type_hints(cls)
+        plans.append(tuple((f.name, _field_kind(hints[f.name])) for f in fields(cls)))
+    return tuple(plans)
+
+
+# _PLANS[tag - 1] = ((alan adı, tür), ...)
+_PLANS = _build_plans()
+SCHEMA_HASH = hashlib.blake2b(
+    repr([(c.__name__, p) for c, p in zip(_CLASSES, _PLANS)]).encode(), digest_size=8
+).digest()
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # sadece döngüsüz yeni nesneler üretiliyor: döngüsel GC taramaları boşa iş
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def dump_ast(root: Any) -> bytes:
+    if isinstance(root, A.Program):
+        # Program.items'taki NEWLINE ayırıcı token'ları (lark) yazılmaz
+        root = A.Program(items=[x for x in root.items if isinstance(x, A.FuncDef)])
+    with _gc_paused():
+        return _dump(root)
+
+
+def _dump(root: Any) -> bytes:
+    # Post-order = (düğüm, çocuklar sağdan sola) pre-order'ının tersi
+    order: List[Any] = []
+    stack: List[Any] = [root]
+    pop = stack.pop
+    push = stack.append
+    extend = stack.extend
+    add = order.append
+    kids = _KIDS
+    try:
+        while stack:
+            node = pop()
+            add(node)
+            kids[type(node)](node, push, extend)
+    except KeyError as e:
+        raise AstFormatError(f"cannot serialize {e.args[0].__name__}") from None
+    order.reverse()
+
+    strings: Dict[str, int] = {}
+    setdefault = strings.setdefault
+    sidx: List[int] = []
+    nums: List[int] = []
+    S = sidx.append
+    N = nums.append
+
+    def I(x: str) -> int:
+        return setdefault(x, len(strings))
+
+    emitters = _EMITTERS
+    for node in order:
+        emitters[type(node)](node, S, N, I)
+    tags = bytes(map(_TAG_OF.__getitem__, map(type, order)))
+
+    table_str = "\0".join(strings)
+    if strings and table_str.count("\0") != len(strings) - 1:
+        raise AstFormatError("NUL character in string")
+    table = table_str.encode("utf-8")
+    s_arr = _pack_ints(sidx)
+    n_arr = _pack_ints(nums)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, SCHEMA_HASH, ord(s_arr.typecode), ord(n_arr.typecode),
+        len(strings), len(table), len(tags), len(s_arr), len(n_arr),
+    )
+    return b"".join((header, table, tags, s_arr.tobytes(), n_arr.tobytes()))
+
+
+def _pack_ints(values: List[int]) -> array:
+    top = max(values, default=0)
+    code = "B" if top < 1 << 8 else "H" if top < 1 << 16 else "I" if top < 1 << 32 else "Q"
+    arr = array(code, values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def _unpack_ints(view: memoryview, pos: int, code: int, n: int) -> Tuple[List[int], int]:
+    if code not in _INT_CODES:
+        raise AstFormatError(f"corrupt AST data: bad typecode {code:#04x}")
+    arr = array(chr(code))
+    end = pos + n * arr.itemsize
+    arr.frombytes(view[pos:end])
+    if len(arr) != n:
+        raise AstFormatError("truncated AST data")
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tolist(), end
+
+
+def _gen_codec(cls: type, plan: Tuple[Tuple[str, int], ...]) -> Tuple[Any, Any]:
+    """
+    Sınıfa özel iki fonksiyon üretir: çocukları (soldan sağa) yığına iten kids()
+    ve skaler alanları alan sırasıyla S()/N() akışlarına yazan emit().
+    """
+    kid_lines = ["def kids(n, push, extend):"]
+    emit_lines = ["def emit(n, S, N, I):"]
+    for name, kind in plan:
+        if kind == _NODE:
+            kid_lines.append(f"    push(n.{name})")
+        elif kind == _LIST:
+            kid_lines.append(f"    v = n.{name}")
+            kid_lines.append(f"    if v: extend(v)")
+            emit_lines.append(f"    v = n.{name}")
+            emit_lines.append(f"    N(0 if v is None else len(v) + 1)")
+        elif kind == _STR:
+            emit_lines.append(f"    S(I(n.{name}))")
+        elif kind == _INT:
+            emit_lines.append(f"    N(n.{name})")
+        else:
+            emit_lines.append(f"    v = n.{name}")
+            emit_lines.append(f"    N(len(v))")
+            emit_lines.append(f"    for x in v: S(I(x))")
+    kid_lines.append("    pass")
+    emit_lines.append("    pass")
+    ns: Dict[str, Any] = {}
+    exec("\n".join(kid_lines + emit_lines), ns)
+    return ns["kids"], ns["emit"]
+
+
+def _noop(*args: Any) -> None:
+    return None
+
+
+_KIDS: Dict[type, Any] = {type(None): _noop}
+_EMITTERS: Dict[type, Any] = {type(None): _noop}
+for _cls, _plan in zip(_CLASSES, _PLANS):
+    _KIDS[_cls], _EMITTERS[_cls] = _gen_codec(_cls, _plan)
+
+
+def _gen_decoder(cls: type, plan: Tuple[Tuple[str, int], ...]) -> Any:
+    """
+    Sınıfa özel decode fonksiyonu üretir: skalerler alan sırasıyla S()/N()'den
+    okunur, çocuklar yığından ters alan sırasıyla alınır.
+    """
+    lines = ["def dec(stack, S, N):"]
+    for name, kind in plan:
+        if kind == _STR:
+            lines.append(f"    {name} = S()")
+        elif kind in (_INT, _LIST):
+            lines.append(f"    {name} = N()")
+        elif kind == _STRLIST:
+            lines.append(f"    {name} = [S() for _ in range(N())]")
+    for name, kind in reversed(plan):
+        if kind == _NODE:
+            lines.append(f"    {name} = stack.pop()")
+        elif kind == _LIST:
+            lines += [
+                f"    if {name} > 1:",
+                f"        k = {name} - 1",
+                f"        if k > len(stack): raise IndexError('stack underflow')",
+                f"        {name} = stack[-k:]",
+                f"        del stack[-k:]",
+                f"    else:",
+                f"        {name} = [] if {name} else None",
+            ]
+    lines.append(f"    return cls({', '.join(n for n, _ in plan)})")
+    ns: Dict[str, Any] = {"cls": cls}
+    exec("\n".join(lines), ns)
+    return ns["dec"]
+
+
+_DECODERS = [_noop] + [_gen_decoder(c, p) for c, p in zip(_CLASSES, _PLANS)]
+
+
+def load_ast(data: Union[bytes, bytearray, memoryview]) -> Any:
+    try:
+        return _load(memoryview(data))
+    except AstFormatError:
+        raise
+    except (struct.error, ValueError) as e:
+        # bozuk UTF-8, beklenmeyen boyutlar...: çağıranlar yalnızca AstFormatError yakalar
+        raise AstFormatError(f"corrupt AST data: {e!r}") from None
+
+
+def _load(view: memoryview) -> Any:
+    if len(view) < _HEADER.size:
+        raise AstFormatError("truncated header")
+    magic, version, schema, s_code, n_code, n_strings, table_len, n_tags, n_sidx, n_nums = \
+        _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise AstFormatError("not a v3 AST file")
+    if version != FORMAT_VERSION or schema != SCHEMA_HASH:
+        raise AstFormatError(f"unsupported AST format (version {version})")
+
+    pos = _HEADER.size
+    strtab = str(view[pos:pos + table_len], "utf-8").split("\0") if n_strings else []
+    if len(strtab) != n_strings:
+        raise AstFormatError("truncated AST data")
+    strtab = [sys.intern(x) for x in strtab]
+    pos += table_len
+    tags = bytes(view[pos:pos + n_tags])
+    pos += n_tags
+    sidx, pos = _unpack_ints(view, pos, s_code, n_sidx)
+    nums, pos = _unpack_ints(view, pos, n_code, n_nums)
+    if len(tags) != n_tags:
+        raise AstFormatError("truncated AST data")
+
+    S = map(strtab.__getitem__, sidx).__next__
+    N = iter(nums).__next__
+    decoders = _DECODERS
+    stack: List[Any] = []
+    push = stack.append
+    try:
+        with _gc_paused():
+            for tag in tags:
+                push(decoders[tag](stack, S, N))
+    except (IndexError, StopIteration, TypeError) as e:
+        raise AstFormatError(f"corrupt AST data: {e!r}") from None
+
+    if len(stack) != 1:
+        raise AstFormatError("corrupt AST data: unbalanced node stream")
+    return stack[0]
+
+
+def write_ast(path: Union[str, Path], root: Any) -> None:
+    Path(path).write_bytes(dump_ast(root))
+
+
+def read_ast(path: Union[str, Path]) -> Any:
+    return load_ast(Path(path).read_bytes())
@@ -1,37 +1,52 @@
 from __future__ import annotations
 import argparse
 import sys
-from functools import partial
 
-from .parser import parse_text
-from .dot_export import to_dot
+from .parser import BACKENDS, parse_text
+from .recovery import parse_text_recover
+from .astbin import write_ast
+from .dot_export import resolve_path, write_dot
+from .source import read_source
 
 def read_text_blocked(path: str, buf_size: int) -> str:
-    # blok blok okuma (byte byte değil), sonsuz döngü yok
-    chunks = []
-    with open(path, "r", encoding="utf-8") as f:
-        for part in iter(partial(f.read, buf_size), ""):
-            chunks.append(part)
-    return "".join(chunks)
+    # mmap üzerinden tek decode; mmap edilemezse buf_size'lık bloklarla okunur
+    return read_source(path, buf_size=buf_size)
 
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("input", help="Input source file")
     ap.add_argument("output", help="Output .dot file")
     ap.add_argument("--buf", type=int, default=64 * 1024, help="Read buffer size")
+    ap.add_argument("--recover", action="store_true", help="Report all syntax errors, not only the first")
+    ap.add_argument("--backend", choices=BACKENDS, default="lark", help="Parser backend")
+    ap.add_argument("--max-depth", type=int, default=None, help="Partial tree: export nodes up to this depth")
+    ap.add_argument("--func", action="append", default=None, help="Partial tree: export only this function (repeatable)")
+    ap.add_argument("--path", default=None, help="Partial tree: export subtree at node path, e.g. main.body[2].cond")
+    ap.add_argument("--ast-bin", default=None, help="Also write the full AST in binary .v3ast format")
     args = ap.parse_args(argv)
 
     text = read_text_blocked(args.input, args.buf)
-    res = parse_text(text)
+    res = parse_text_recover(text) if args.recover else parse_text(text, inline=True, backend=args.backend)
 
     if res.errors:
         for e in res.errors:
             print(f"[parse error] line={e.line} col={e.column}: {e.message}", file=sys.stderr)
         return 2
 
-    dot = to_dot(res.program)
+    if args.ast_bin:
+        write_ast(args.ast_bin, res.program)
+
+    root = res.program
+    if args.path:
+        try:
+            root = resolve_path(root, args.path)
+        except ValueError as e:
+            print(f"[dot error] {e}", file=sys.stderr)
+            return 2
+
+    # DOT satırları bellekte biriktirilmeden doğrudan dosyaya yazılır
     with open(args.output, "w", encoding="utf-8") as f:
-        f.write(dot)
+        write_dot(root, f, max_depth=args.max_depth, funcs=args.func)
 
     return 0
 
@@ -1,52 +1,129 @@
 from __future__ import annotations
+import io
+import re
 from dataclasses import is_dataclass, fields
-from typing import Any, Dict, List, Tuple
+from typing import Any, Collection, Dict, List, Optional, TextIO, Tuple
 
-def to_dot(root: Any) -> str:
-    lines: List[str] = ["digraph AST {", '  node [shape=box];']
+from .ast import FuncDef, Program
+from .visitor import child_plan
+
+# sınıf -> etikette gösterilecek alan ("name" | "op" | "kind" | None)
+_LABEL_ATTR: Dict[type, Optional[str]] = {}
+
+# düğüm yolu adımı: "body", "body[2]"
+_STEP_RE = re.compile(r"^([A-Za-z_]\w*)(?:\[(\d+)\])?$")
+
+def _label_attr(cls: type) -> Optional[str]:
+    if cls not in _LABEL_ATTR:
+        names = {f.name for f in fields(cls)} if is_dataclass(cls) else set()
+        _LABEL_ATTR[cls] = next((a for a in ("name", "op", "kind") if a in names), None)
+    return _LABEL_ATTR[cls]
+
+def _label(obj: Any) -> str:
+    t = type(obj).__name__
+    attr = _label_attr(type(obj))
+    if attr is None:
+        return t
+    val = getattr(obj, attr)
+    if attr != "kind" and not isinstance(val, str):
+        return t
+    return f"{t}\\n{attr}={val}"
+
+def resolve_path(root: Any, path: str) -> Any:
+    """
+    "items[0].body[2].cond" gibi bir yolu izleyip alt ağacı döndürür.
+    Kök Program ise ilk adım fonksiyon adı da olabilir: "main.body[1]".
+    """
+    node = root
+    for i, step in enumerate(s for s in path.split(".") if s):
+        m = _STEP_RE.match(step)
+        if not m:
+            raise ValueError(f"bad path step: {step!r}")
+        name, index = m.group(1), m.group(2)
+        if i == 0 and isinstance(node, Program) and name != "items":
+            found = [f for f in node.items if isinstance(f, FuncDef) and f.signature.name == name]
+            if not found:
+                raise ValueError(f"no function named {name!r}")
+            node = found[0]
+        else:
+            if name not in {n for n, _ in child_plan(type(node))}:
+                raise ValueError(f"{type(node).__name__} has no child field {name!r}")
+            node = getattr(node, name)
+        if index is not None:
+            if not isinstance(node, list) or int(index) >= len(node):
+                raise ValueError(f"index out of range in path step: {step!r}")
+            node = node[int(index)]
+        elif isinstance(node, list):
+            raise ValueError(f"path step {step!r} is a list, index required")
+        if node is None:
+            raise ValueError(f"path step {step!r} is empty")
+    return node
+
+def write_dot(
+    root: Any,
+    out: TextIO,
+    max_depth: Optional[int] = None,
+    funcs: Optional[Collection[str]] = None,
+    path: Optional[str] = None,
+) -> int:
+    """
+    AST'yi DOT olarak doğrudan `out`a yazar (özyinelemesiz, satırlar bellekte
+    biriktirilmez). Sınırlar:
+      path      - sadece bu yoldaki alt ağaç (resolve_path)
+      funcs     - Program kökünde sadece bu isimdeki fonksiyonlar
+      max_depth - (seçilen) kökten en fazla bu derinliğe kadar düğümler
+    Seçilmeyen alt ağaçlara hiç inilmez. Yazılan düğüm sayısını döndürür.
+    """
+    if path:
+        root = resolve_path(root, path)
+    wanted = set(funcs) if funcs else None
+
+    write = out.write
+    write("digraph AST {\n  node [shape=box];\n")
     ids: Dict[int, str] = {}
-    counter = 0
 
     def nid(obj: Any) -> str:
-        nonlocal counter
         key = id(obj)
-        if key not in ids:
-            ids[key] = f"n{counter}"
-            counter += 1
-        return ids[key]
-
-    def label(obj: Any) -> str:
-        t = type(obj).__name__
-        if hasattr(obj, "name") and isinstance(getattr(obj, "name"), str):
-            return f"{t}\\nname={getattr(obj,'name')}"
-        if hasattr(obj, "op") and isinstance(getattr(obj, "op"), str):
-            return f"{t}\\nop={getattr(obj,'op')}"
-        if hasattr(obj, "kind"):
-            return f"{t}\\nkind={getattr(obj,'kind')}"
-        return t
+        s = ids.get(key)
+        if s is None:
+            s = ids[key] = f"n{len(ids)}"
+        return s
 
-    def walk(obj: Any):
-        if obj is None:
-            return
+    count = 0
+    # (düğüm, ebeveyn id, kenar etiketi, derinlik); kenar satırı çocuğun düğüm satırından hemen önce
+    stack: List[Tuple[Any, Optional[str], Optional[str], int]] = [(root, None, None, 0)] if root is not None else []
+    while stack:
+        obj, parent, edge, depth = stack.pop()
         this = nid(obj)
-        lines.append(f'  {this} [label="{label(obj)}"];')
-
-        # dataclass fields
-        if is_dataclass(obj):
-            for f in fields(obj):
-                val = getattr(obj, f.name)
-                if isinstance(val, list):
-                    for i, item in enumerate(val):
-                        if is_dataclass(item):
-                            child = nid(item)
-                            lines.append(f"  {this} -> {child} [label=\"{f.name}[{i}]\"];")
-                            walk(item)
-                else:
-                    if is_dataclass(val):
-                        child = nid(val)
-                        lines.append(f"  {this} -> {child} [label=\"{f.name}\"];")
-                        walk(val)
-
-    walk(root)
-    lines.append("}")
-    return "\n".join(lines)
+        if parent is not None:
+            write(f"  {parent} -> {this} [label=\"{edge}\"];\n")
+        write(f'  {this} [label="{_label(obj)}"];\n')
+        count += 1
+
+        if max_depth is not None and depth >= max_depth:
+            continue
+        is_program = isinstance(obj, Program)
+        children: List[Tuple[Any, Optional[str], Optional[str], int]] = []
+        for name, is_list in child_plan(type(obj)):
+            val = getattr(obj, name)
+            if val is None:
+                continue
+            if is_list:
+                for i, item in enumerate(val):
+                    # Program.items'taki NEWLINE token'ları düğüm değil; numaralar yine sayar
+                    if is_program and not (isinstance(item, FuncDef)
+                                           and (wanted is None or item.signature.name in wanted)):
+                        continue
+                    children.append((item, this, f"{name}[{i}]", depth + 1))
+            else:
+                children.append((val, this, name, depth + 1))
+        children.reverse()
+        stack.extend(children)
+
+    write("}")
+    return count
+
+def to_dot(root: Any, **limits: Any) -> str:
+    buf = io.StringIO()
+    write_dot(root, buf, **limits)
+    return buf.getvalue()
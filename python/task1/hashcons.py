@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any, Dict, List, Optional, Tuple
+
+from .ast import (
+    Assign, Binary, CallOrIndexer, DoLoop, Expr, ExprStmt, FuncDef, If, Literal,
+    Place, Program, Stmt, Unary, While,
+)
+
+# Yan etkisiz ifade sınıfları: yapısal olarak eşit olanlar tek düğümü paylaşır.
+# Assign ve CallOrIndexer (çağrı olabilir) paylaşılmaz, çocukları yine paylaşılır.
+_TAG_PLACE, _TAG_LIT, _TAG_UNARY, _TAG_BINARY = range(4)
+
+
+class ExprTable:
+    """
+    Hash-consing ifade fabrikası. place/literal/unary/binary yapısal olarak eşit
+    bir düğüm daha önce üretildiyse aynı nesneyi döndürür; her paylaşılan düğümün
+    yapısal hash'i ve yoğun (0..n-1) id'si üretimde bir kez hesaplanır.
+
+    Paylaşılan düğümler için eşitlik `a is b` (O(1)); hash_of()/id_of() CSE ve
+    önbellek geçişleri için ucuz anahtardır. Paylaşılan düğümler değiştirilmemeli
+    (V3_AST_FROZEN=1 bunu zorlar).
+    """
+
+    def __init__(self) -> None:
+        # cons anahtarı: (tag, skalerler..., çocukların id()'leri); tablo düğümleri
+        # canlı tuttuğu için id()'ler tekrar kullanılmaz
+        self._nodes: Dict[Tuple[Any, ...], Expr] = {}
+        self._info: Dict[int, Tuple[int, int]] = {}  # id(node) -> (dense id, structural hash)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _add(self, key: Tuple[Any, ...], node: Expr, h: int) -> Expr:
+        self._nodes[key] = node
+        self._info[id(node)] = (len(self._info), h)
+        return node
+
+    def hash_of(self, node: Any) -> Optional[int]:
+        info = self._info.get(id(node))
+        return None if info is None else info[1]
+
+    def id_of(self, node: Any) -> Optional[int]:
+        info = self._info.get(id(node))
+        return None if info is None else info[0]
+
+    def _h(self, node: Expr) -> int:
+        # paylaşılmayan çocuk (Assign/çağrı) için kimlik hash'i
+        info = self._info.get(id(node))
+        return info[1] if info is not None else hash(("id", id(node)))
+
+    def place(self, name: str) -> Place:
+        key = (_TAG_PLACE, name)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._add(key, Place(name=name), hash(key))
+        return node
+
+    def literal(self, kind: str, value: str) -> Literal:
+        key = (_TAG_LIT, kind, value)
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._add(key, Literal(kind, value), hash(key))
+        return node
+
+    def unary(self, op: str, rhs: Expr) -> Unary:
+        key = (_TAG_UNARY, op, id(rhs))
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._add(key, Unary(op=op, rhs=rhs), hash((_TAG_UNARY, op, self._h(rhs))))
+        return node
+
+    def binary(self, op: str, lhs: Expr, rhs: Expr) -> Binary:
+        key = (_TAG_BINARY, op, id(lhs), id(rhs))
+        node = self._nodes.get(key)
+        if node is None:
+            h = hash((_TAG_BINARY, op, self._h(lhs), self._h(rhs)))
+            node = self._add(key, Binary(op=op, lhs=lhs, rhs=rhs), h)
+        return node
+
+    # yan etkili olabilenler: her seferinde yeni düğüm
+    def assign(self, lhs: Expr, rhs: Expr) -> Assign:
+        return Assign(lhs=lhs, rhs=rhs)
+
+    def call(self, callee: Expr, args: List[Expr]) -> CallOrIndexer:
+        return CallOrIndexer(callee=callee, args=args)
+
+    # ---- var olan ağaçları paylaşımlı hale getirme ----
+
+    def intern(self, e: Expr) -> Expr:
+        """İfade ağacını alttan üste (özyinelemesiz) tablodan geçirir."""
+        out: List[Expr] = []
+        stack: List[Tuple[Expr, bool]] = [(e, False)]
+        while stack:
+            node, done = stack.pop()
+            t = type(node)
+            if not done:
+                stack.append((node, True))
+                if t is Binary or t is Assign:
+                    stack.append((node.rhs, False))
+                    stack.append((node.lhs, False))
+                elif t is Unary:
+                    stack.append((node.rhs, False))
+                elif t is CallOrIndexer:
+                    for a in reversed(node.args):
+                        stack.append((a, False))
+                    stack.append((node.callee, False))
+                continue
+            if t is Place:
+                out.append(self.place(node.name))
+            elif t is Literal:
+                out.append(self.literal(node.kind, node.value))
+            elif t is Unary:
+                out.append(self.unary(node.op, out.pop()))
+            elif t is Binary or t is Assign:
+                rhs = out.pop()
+                lhs = out.pop()
+                out.append(self.binary(node.op, lhs, rhs) if t is Binary else self.assign(lhs, rhs))
+            elif t is CallOrIndexer:
+                n = len(node.args)
+                args = out[len(out) - n:] if n else []
+                del out[len(out) - n:]
+                out.append(self.call(out.pop(), args))
+            else:
+                out.append(node)
+        return out[0]
+
+    def intern_stmts(self, stmts: Optional[List[Stmt]]) -> Optional[List[Stmt]]:
+        if stmts is None:
+            return None
+        res: List[Stmt] = []
+        for st in stmts:
+            t = type(st)
+            if t is ExprStmt:
+                st = replace(st, expr=self.intern(st.expr))
+            elif t is If:
+                st = replace(
+                    st, cond=self.intern(st.cond),
+                    then_body=self.intern_stmts(st.then_body), else_body=self.intern_stmts(st.else_body),
+                )
+            elif t is While or t is DoLoop:
+                st = replace(st, cond=self.intern(st.cond), body=self.intern_stmts(st.body))
+            res.append(st)
+        return res
+
+    def intern_program(self, program: Program) -> Program:
+        return Program(items=[
+            replace(f, body=self.intern_stmts(f.body)) if isinstance(f, FuncDef) else f
+            for f in program.items
+        ])
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from .ast import FuncDef, ParseError, Program
+from .parser import ParseResult, parse_text, shifted_error
+
+# Top-level sınır: satır başında "function" (ör. "end function" eşleşmez)
+FUNC_START_RE = re.compile(r"^[ \t]*function\b", re.MULTILINE)
+
+
+@dataclass
+class FuncSpan:
+    name: Optional[str]  # None = ilk fonksiyondan önceki kısım (yorum/boşluk)
+    start: int           # karakter offset (dahil)
+    end: int             # karakter offset (hariç)
+    line: int            # 1 tabanlı başlangıç satırı
+    digest: str
+    func: Optional[FuncDef] = None
+
+
+@dataclass
+class IncrementalResult:
+    program: Optional[Program]
+    errors: List[ParseError]
+    spans: List[FuncSpan]
+    changed: List[str] = field(default_factory=list)   # yeni veya içeriği değişen fonksiyonlar
+    removed: List[str] = field(default_factory=list)   # önceki sürümde olup artık olmayanlar
+    reparsed: int = 0                                  # gerçekten parse edilen span sayısı
+
+
+def split_spans(text: str) -> List[FuncSpan]:
+    starts = [m.start() for m in FUNC_START_RE.finditer(text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    starts.append(len(text))
+
+    spans: List[FuncSpan] = []
+    line = 1
+    for a, b in zip(starts, starts[1:]):
+        chunk = text[a:b]
+        spans.append(FuncSpan(name=None, start=a, end=b, line=line, digest=_digest(chunk)))
+        line += chunk.count("\n")
+    return spans
+
+
+def _digest(chunk: str) -> str:
+    return hashlib.blake2b(chunk.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class IncrementalParser:
+    """
+    Fonksiyon bazında artımlı parse. Kaynak satır başındaki "function" anahtar
+    kelimelerinden span'lere bölünür; her span içerik hash'i ile önbelleğe alınır.
+    Sadece hash'i değişen span'ler yeniden parse edilir, diğerlerinin FuncDef
+    nesneleri aynen kullanılır. Hata satırları span'in güncel konumuna göre kaydırılır.
+
+    Editör entegrasyonu için edit(start, old_end, new_text): sadece düzenlemenin
+    değdiği span'ler yeniden bölünüp hash'lenir, geri kalanlar kaydırılarak kullanılır.
+
+    backend="treesitter": bölme/hash yerine tree-sitter'ın kendi artımlı parse'ı
+    (tree.edit + eski ağaç) kullanılır; span'ler func_def düğümleridir ve reparsed
+    yeniden dönüştürülen fonksiyon sayısıdır. Sözdizimi hatası varsa hatalar diğer
+    backend'lerdeki gibi span bazında raporlanır.
+    """
+
+    def __init__(self, backend: str = "lark") -> None:
+        self.backend = backend
+        self._cache: Dict[str, ParseResult] = {}
+        self._prev: Dict[str, str] = {}  # fonksiyon adı -> digest
+        self._text: Optional[str] = None
+        self._spans: List[FuncSpan] = []
+        self._ts = None
+        if backend == "treesitter":
+            from .treesitter import TreeSitterParser
+
+            self._ts = TreeSitterParser()
+            self._ts_prev: Dict[str, str] = {}
+            # id(FuncDef) -> (FuncDef, span); FuncDef'i tutmak id'nin tekrar kullanılmasını önler.
+            # Yeniden kullanılan fonksiyonların span'leri yerinde kaydırılır (digest aynı kalır)
+            self._ts_spans: Dict[int, Tuple[FuncDef, FuncSpan]] = {}
+
+    def parse(self, text: str) -> IncrementalResult:
+        if self._ts is not None:
+            return self._ts_result(text, self._ts.parse(text))
+        return self._assemble(text, split_spans(text))
+
+    def edit(self, start: int, old_end: int, new_text: str) -> IncrementalResult:
+        """text[start:old_end] yerine new_text koyar ve artımlı olarak yeniden parse eder."""
+        old = self._text
+        if old is None:
+            raise RuntimeError("edit() called before parse()")
+        if not (0 <= start <= old_end <= len(old)):
+            raise ValueError(f"bad edit range: {start}..{old_end} (len={len(old)})")
+        text = old[:start] + new_text + old[old_end:]
+        if self._ts is not None:
+            return self._ts_result(text, self._ts.edit(start, old_end, new_text))
+        spans = self._spans
+
+        # etkilenen span aralığı [i, j]; i-1 de dahil: satır başındaki "function"
+        # bozulursa önceki span'le birleşebilir
+        i = 0
+        while i + 1 < len(spans) and spans[i].end <= start:
+            i += 1
+        i = max(i - 1, 0)
+        j = i
+        while j + 1 < len(spans) and spans[j + 1].start <= old_end:
+            j += 1
+
+        delta = len(new_text) - (old_end - start)
+        r0 = spans[i].start
+        r1_old = spans[j].end
+        r1_new = r1_old + delta
+        region = text[r0:r1_new]
+        line_delta = region.count("\n") - old[r0:r1_old].count("\n")
+
+        mid = split_spans(region)
+        for sp in mid:
+            sp.start += r0
+            sp.end += r0
+            sp.line += spans[i].line - 1
+        if mid and mid[0].start == mid[0].end and i > 0:
+            mid = mid[1:]
+
+        # düzenlemeden sonraki span'ler yerinde kaydırılır (önceki sonucun span'leri
+        # bir sonraki parse/edit çağrısına kadar geçerlidir)
+        tail = spans[j + 1:]
+        if delta or line_delta:
+            for sp in tail:
+                sp.start += delta
+                sp.end += delta
+                sp.line += line_delta
+        return self._assemble(text, spans[:i] + mid + tail)
+
+    def _ts_result(self, text: str, res: ParseResult) -> IncrementalResult:
+        if res.errors:
+            return self._assemble(text, split_spans(text))
+        self._text = text
+        spans: List[FuncSpan] = []
+        known = self._ts_spans
+        by_id: Dict[int, Tuple[FuncDef, FuncSpan]] = {}
+        for start, end, row, f in self._ts.funcs:
+            hit = known.get(id(f))
+            if hit is None:
+                sp = FuncSpan(name=f.signature.name, start=start, end=end, line=row + 1,
+                              digest=_digest(text[start:end]), func=f)
+            else:
+                sp = hit[1]
+                sp.start, sp.end, sp.line = start, end, row + 1
+            by_id[id(f)] = (f, sp)
+            spans.append(sp)
+        self._ts_spans = by_id
+
+        # değişiklikler son başarılı tree-sitter sonucuna göre (hata sonuçları _prev'i kullanır)
+        cur = {sp.name: sp.digest for sp in spans}
+        changed = [n for n, d in cur.items() if self._ts_prev.get(n) != d]
+        removed = [n for n in self._ts_prev if n not in cur]
+        self._ts_prev = cur
+        return IncrementalResult(
+            program=Program(items=[sp.func for sp in spans]),
+            errors=[],
+            spans=spans,
+            changed=changed,
+            removed=removed,
+            reparsed=self._ts.converted,
+        )
+
+    def _assemble(self, text: str, spans: List[FuncSpan]) -> IncrementalResult:
+        cache: Dict[str, ParseResult] = {}
+        errors: List[ParseError] = []
+        funcs: List[FuncDef] = []
+        reparsed = 0
+
+        prev_cache = self._cache
+        for sp in spans:
+            res = cache.get(sp.digest) or prev_cache.get(sp.digest)
+            if res is None:
+                chunk = text[sp.start:sp.end]
+                if not chunk.strip():
+                    res = ParseResult(program=Program(items=[]), errors=[])
+                else:
+                    res = parse_text(chunk, inline=True, backend=self.backend)
+                reparsed += 1
+            cache[sp.digest] = res
+
+            if res.errors:
+                for e in res.errors:
+                    errors.append(shifted_error(e, sp.line - 1))
+            if res.program is None:
+                continue
+            for item in res.program.items:
+                if not isinstance(item, FuncDef):
+                    continue
+                sp.func = item
+                sp.name = item.signature.name
+                funcs.append(item)
+
+        self._cache = cache
+        self._text = text
+        self._spans = spans
+
+        cur: Dict[str, str] = {}
+        for sp in spans:
+            if sp.name is not None:
+                cur[sp.name] = sp.digest
+        changed = [n for n, d in cur.items() if self._prev.get(n) != d]
+        removed = [n for n in self._prev if n not in cur]
+        self._prev = cur
+
+        program = None if errors else Program(items=funcs)
+        return IncrementalResult(
+            program=program,
+            errors=errors,
+            spans=spans,
+            changed=changed,
+            removed=removed,
+            reparsed=reparsed,
+        )
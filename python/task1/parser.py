@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import hashlib
+import os
+import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import lark
 from lark import Lark, Transformer, exceptions
 
 from .ast import *
 
+if TYPE_CHECKING:
+    from .hashcons import ExprTable
+
+
+def _sym(tok) -> str:
+    # identifier/operatör/literal metinleri intern edilir: aynı isim tek str nesnesi
+    return sys.intern(str(tok))
+
 
 @dataclass
 class ParseResult:
@@ -13,6 +27,18 @@ class ParseResult:
     errors: List[ParseError]
 
 
+def shifted_error(e: ParseError, line_offset: int) -> ParseError:
+    """
+    Parça (fonksiyon aralığı) içinde raporlanan hatayı dosya satırına taşır;
+    mesajdaki "at line N" konumu da aynı satırı göstersin diye kaydırılır.
+    """
+    if not line_offset:
+        return e
+    line = e.line + line_offset
+    message = re.sub(rf"\bat line {e.line}\b", f"at line {line}", e.message, count=1)
+    return ParseError(message=message, line=line, column=e.column)
+
+
 class AstBuilder(Transformer):
     def start(self, items):
         # start: _seps source _seps  => bazen items içinde sadece Program gelir,
@@ -33,17 +59,20 @@ class AstBuilder(Transformer):
 
     # --- types ---
     def type_builtin(self, items):
-        return BuiltinType(str(items[0]))
+        return BuiltinType(_sym(items[0]))
 
     def type_custom(self, items):
-        return CustomType(str(items[0]))
+        return CustomType(_sym(items[0]))
+
+    def comma_list(self, items):
+        # !comma_list: virgül token'ları korunur, sayısı dizi boyutunu verir
+        return len(items)
 
     def array_suffix(self, items):
-        # items can be [] (no commas) or [comma_list]
+        # items can be [] (no commas) or [comma_list] (virgül sayısı)
         if not items:
             return 1
-        commas = str(items[0])
-        return commas.count(",") + 1
+        return items[0] + 1
 
     def base_type(self, items):
         return items[0]
@@ -58,7 +87,7 @@ class AstBuilder(Transformer):
 
     # --- function ---
     def arg_def(self, items):
-        name = str(items[0])
+        name = _sym(items[0])
         t = items[1] if len(items) > 1 else None
         return ArgDef(name=name, type_ref=t)
 
@@ -66,7 +95,7 @@ class AstBuilder(Transformer):
         return items
 
     def func_signature(self, items):
-        name = str(items[0])
+        name = _sym(items[0])
         args = items[1] if len(items) > 1 and isinstance(items[1], list) else []
         ret = None
         for it in items[1:]:
@@ -83,7 +112,7 @@ class AstBuilder(Transformer):
 
     # --- statements ---
     def ident_list(self, items):
-        return [str(x) for x in items]
+        return [_sym(x) for x in items]
 
     def var_stmt(self, items):
         names = items[0]
@@ -144,20 +173,20 @@ class AstBuilder(Transformer):
 
     # --- expressions ---
     def place(self, items):
-        return Place(name=str(items[0]))
+        return Place(name=_sym(items[0]))
 
-    def lit_bool(self, items): return Literal("bool", str(items[0]))
-    def lit_str(self, items):  return Literal("str", str(items[0]))
-    def lit_char(self, items): return Literal("char", str(items[0]))
-    def lit_hex(self, items):  return Literal("hex", str(items[0]))
-    def lit_bits(self, items): return Literal("bits", str(items[0]))
-    def lit_dec(self, items):  return Literal("dec", str(items[0]))
+    def lit_bool(self, items): return Literal("bool", _sym(items[0]))
+    def lit_str(self, items):  return Literal("str", _sym(items[0]))
+    def lit_char(self, items): return Literal("char", _sym(items[0]))
+    def lit_hex(self, items):  return Literal("hex", _sym(items[0]))
+    def lit_bits(self, items): return Literal("bits", _sym(items[0]))
+    def lit_dec(self, items):  return Literal("dec", _sym(items[0]))
 
     def braces(self, items):
         return items[0]
 
     def unary(self, items):
-        op = str(items[0])
+        op = _sym(items[0])
         rhs = items[1]
         return Unary(op=op, rhs=rhs)
 
@@ -166,7 +195,7 @@ class AstBuilder(Transformer):
         expr = items[0]
         i = 1
         while i + 1 < len(items):
-            op = str(items[i])
+            op = _sym(items[i])
             rhs = items[i + 1]
             expr = Binary(op=op, lhs=expr, rhs=rhs)
             i += 2
@@ -192,25 +221,163 @@ class AstBuilder(Transformer):
         return expr
 
 
-def make_parser() -> Lark:
-    with open(__file__.replace("parser.py", "grammar_v3.lark"), "r", encoding="utf-8") as f:
-        grammar = f.read()
-    return Lark(grammar, start="start", parser="lalr", propagate_positions=True)
+GRAMMAR_PATH = Path(__file__).with_name("grammar_v3.lark")
+
+# LALR tablolarının disk cache'i. V3_PARSER_CACHE=<dir> ile yer değiştirilir,
+# V3_PARSER_CACHE=0 ile tamamen kapatılır.
+CACHE_ENV = "V3_PARSER_CACHE"
+_CACHE_PREFIX = "grammar_v3-"
+
+
+def parser_cache_dir() -> Optional[Path]:
+    env = os.environ.get(CACHE_ENV)
+    if env is not None and env.strip().lower() in ("", "0", "off", "no", "false"):
+        return None
+    if env:
+        return Path(env)
+    return Path(__file__).with_name("__pycache__")
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def parser_cache_file(grammar: str, options: dict) -> Optional[Path]:
+    # ad: grammar_v3-<grammar+lark+python hash>-<seçenek hash>-<sürüm etiketi>.cache
+    d = parser_cache_dir()
+    if d is None:
+        return None
+    # hash'lenebilir seçenekler; her (inline, positions, ...) birleşimi ayrı dosya
+    opts = "".join(f"{k}={options[k]!r};" for k in sorted(options) if k != "transformer")
+    key = _digest(grammar, lark.__version__, repr(sys.version_info[:2]))
+    tag = f"lark{lark.__version__}-py{sys.version_info[0]}{sys.version_info[1]}"
+    return d / f"{_CACHE_PREFIX}{key}-{_digest(opts)}-{tag}.cache"
 
 
-_PARSER: Optional[Lark] = None
+def _prune_stale_caches(current: Path) -> None:
+    # aynı seçenekler ve lark/python sürümü için eski grammar hash'li dosyaları sil;
+    # başka seçeneklerle kurulmuş parser'ların dosyalarına dokunma
+    _, opts_tag = current.name[len(_CACHE_PREFIX):].split("-", 1)
+    for old in current.parent.glob(f"{_CACHE_PREFIX}*-{opts_tag}"):
+        if old != current:
+            try:
+                old.unlink()
+            except OSError:
+                pass
 
 
-def parse_text(text: str) -> ParseResult:
-    global _PARSER
-    if _PARSER is None:
-        _PARSER = make_parser()
+def make_parser(cache: bool = True, **options) -> Lark:
+    grammar = GRAMMAR_PATH.read_text(encoding="utf-8")
+    opts = dict(start="start", parser="lalr", propagate_positions=True)
+    opts.update(options)
+
+    cache_file = parser_cache_file(grammar, opts) if cache else None
+    if cache_file is None:
+        return Lark(grammar, **opts)
+
+    if cache_file.exists():
+        # lark dosya başlığındaki sha256'yı kendisi de doğrular; uyuşmazsa yeniden üretir
+        return Lark(grammar, cache=str(cache_file), **opts)
+
+    # Önce geçici dosyaya yaz, sonra atomik rename: paralel süreçler yarım dosya görmez
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
     try:
-        tree = _PARSER.parse(text)
-        program = AstBuilder().transform(tree)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return Lark(grammar, **opts)
+    parser = Lark(grammar, cache=str(tmp), **opts)
+    try:
+        os.replace(tmp, cache_file)
+        _prune_stale_caches(cache_file)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+    return parser
+
+
+# (inline, positions) -> Lark
+_PARSERS: Dict[Tuple[bool, bool], Lark] = {}
+
+
+def get_parser(inline: bool = False, positions: bool = True) -> Lark:
+    """
+    inline=False: klasik iki geçiş (parse tree + AstBuilder().transform)
+    inline=True : AstBuilder callback'leri LALR reduce sırasında çalışır,
+                  ara parse tree hiç oluşturulmaz.
+    positions   : propagate_positions; sadece tanılama/source map gerekiyorsa açık olmalı.
+    """
+    key = (inline, positions)
+    p = _PARSERS.get(key)
+    if p is None:
+        opts = dict(propagate_positions=positions)
+        if inline:
+            opts["transformer"] = AstBuilder()
+        p = make_parser(**opts)
+        _PARSERS[key] = p
+    return p
+
+
+BACKENDS = ("lark", "pratt", "treesitter")
+
+
+def parse_text(
+    text: str,
+    inline: bool = False,
+    positions: Optional[bool] = None,
+    backend: str = "lark",
+    exprs: Optional[ExprTable] = None,
+) -> ParseResult:
+    """
+    exprs: verilirse yapısal olarak eşit yan etkisiz ifadeler (Place, Literal,
+    Unary, Binary) bu ExprTable üzerinden tek düğümü paylaşır. pratt bunu parse
+    sırasında yapar; lark'ta (paylaşımlı AstBuilder) parse sonrası tek geçişle.
+
+    backend="treesitter": grammar_v3.lark'ın LALR tablolarından üretilen tree-sitter
+    parser'ı (bkz. treesitter.py); ilk kullanımda cc ile derlenip cache'lenir.
+    """
+    if backend == "pratt":
+        return _parse_text_pratt(text, exprs)
+    if backend == "treesitter":
+        return _parse_text_treesitter(text, exprs)
+    if backend != "lark":
+        raise ValueError(f"unknown parser backend: {backend!r} (expected one of {BACKENDS})")
+    if positions is None:
+        positions = not inline
+    parser = get_parser(inline=inline, positions=positions)
+    try:
+        if inline:
+            program = parser.parse(text)
+        else:
+            tree = parser.parse(text)
+            program = AstBuilder().transform(tree)
+        if exprs is not None:
+            program = exprs.intern_program(program)
         return ParseResult(program=program, errors=[])
     except exceptions.UnexpectedInput as e:
         return ParseResult(
             program=None,
             errors=[ParseError(message=str(e), line=e.line, column=e.column)]
         )
+
+
+def _parse_text_pratt(text: str, exprs: Optional[ExprTable] = None) -> ParseResult:
+    from .pratt import PrattSyntaxError, parse_program
+
+    try:
+        return ParseResult(program=parse_program(text, exprs), errors=[])
+    except PrattSyntaxError as e:
+        return ParseResult(program=None, errors=[ParseError(message=e.message, line=e.line, column=e.column)])
+
+
+def _parse_text_treesitter(text: str, exprs: Optional[ExprTable] = None) -> ParseResult:
+    from .treesitter import TreeSitterParser
+
+    res = TreeSitterParser().parse(text)
+    if exprs is not None and res.program is not None:
+        res.program = exprs.intern_program(res.program)
+    return res
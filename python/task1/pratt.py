@@ -0,0 +1,368 @@
+from __future__ import annotations
+
+import re
+import sys
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from lark import Token
+
+from .ast import *
+
+if TYPE_CHECKING:
+    from .hashcons import ExprTable
+
+# Elle yazılmış tek geçişli lexer + precedence-climbing (Pratt) parser.
+# grammar_v3.lark ile aynı dili tanır ve AstBuilder ile birebir aynı AST'yi üretir
+# (lark yolundaki bilinen tuhaflıklar dahil, bkz. _if_stmt/_do_stmt/_type_ref/_postfix).
+
+# (kind, text, line, column)
+Tok = Tuple[str, str, int, int]
+
+_TOKEN_RE = re.compile(r"""
+    (?P<WS>[ \t]+)
+  | (?P<COMMENT>//[^\n]*)
+  | (?P<NEWLINE>(?:\r?\n)+)
+  | (?P<NAME>[a-zA-Z_][a-zA-Z_0-9]*)
+  | (?P<HEX>0[xX][0-9A-Fa-f]+)
+  | (?P<BITS>0[bB][01]+)
+  | (?P<DEC>[0-9]+)
+  | (?P<STR>"[^"\\]*(?:\\.[^"\\]*)*")
+  | (?P<CHAR>'[^']')
+  | (?P<OP>==|<=|>=|\|\||&&|[-+*/%<>=|^&!~(),;])
+""", re.VERBOSE)
+# Not: lark'ın terminal sıralamasında UNARY_OP ("not" en uzun) CMP_OP'tan, CMP_OP da
+# SHIFT_OP'tan önce denenir; bu yüzden "!=" -> "!" "=" ve "<<" -> "<" "<" olarak
+# bölünür. Aynı AST/hata konumları için burada da "!=", "<<", ">>" tek token değildir.
+
+KEYWORDS = {
+    "function": "FUNCTION", "end": "END", "dim": "DIM", "as": "AS",
+    "if": "IF", "then": "THEN", "else": "ELSE", "while": "WHILE", "wend": "WEND",
+    "do": "DO", "loop": "LOOP", "until": "UNTIL", "break": "BREAK",
+    "true": "BOOL", "false": "BOOL",
+    "and": "AND_OP", "or": "OR_OP", "not": "UNARY_OP",
+    "bool": "BUILTIN_TYPE", "byte": "BUILTIN_TYPE", "int": "BUILTIN_TYPE", "uint": "BUILTIN_TYPE",
+    "long": "BUILTIN_TYPE", "ulong": "BUILTIN_TYPE", "char": "BUILTIN_TYPE", "string": "BUILTIN_TYPE",
+}
+
+OPERATORS = {
+    "||": "OR_OP", "&&": "AND_OP",
+    "|": "BOR_OP", "^": "BXOR_OP", "&": "BAND_OP",
+    "==": "CMP_OP", "!=": "CMP_OP", "<=": "CMP_OP", ">=": "CMP_OP", "<": "CMP_OP", ">": "CMP_OP",
+    "<<": "SHIFT_OP", ">>": "SHIFT_OP",
+    "+": "ADD_OP", "-": "ADD_OP",
+    "*": "MUL_OP", "/": "MUL_OP", "%": "MUL_OP",
+    "!": "UNARY_OP", "~": "UNARY_OP",
+    "=": "ASSIGN_OP",
+    "(": "LPAR", ")": "RPAR", ",": "COMMA", ";": "SEMICOLON",
+}
+
+# binary operatör öncelikleri (büyük = sıkı bağlar), hepsi sola birleşmeli
+BINARY_PREC = {
+    "OR_OP": 1,
+    "AND_OP": 2,
+    "BOR_OP": 3,
+    "BXOR_OP": 4,
+    "BAND_OP": 5,
+    "CMP_OP": 6,
+    "SHIFT_OP": 7,
+    "ADD_OP": 8,
+    "MUL_OP": 9,
+}
+
+LITERALS = {"BOOL": "bool", "STR": "str", "CHAR": "char", "HEX": "hex", "BITS": "bits", "DEC": "dec"}
+
+_STMT_END = {"END", "ELSE", "WEND", "LOOP"}
+
+
+class PrattSyntaxError(Exception):
+    def __init__(self, message: str, line: int, column: int) -> None:
+        super().__init__(message)
+        self.message = message
+        self.line = line
+        self.column = column
+
+
+def tokenize(text: str) -> List[Tok]:
+    toks: List[Tok] = []
+    append = toks.append
+    intern = sys.intern
+    match = _TOKEN_RE.match
+    pos = 0
+    n = len(text)
+    line = 1
+    line_start = 0
+    while pos < n:
+        m = match(text, pos)
+        if m is None:
+            # lark gibi tembel davran: hata, parser bu noktaya gelince raporlanır
+            append(("$ERROR", text[pos], line, pos - line_start + 1))
+            return toks
+        kind = m.lastgroup
+        end = m.end()
+        if kind == "NAME":
+            s = intern(m.group())
+            append((KEYWORDS.get(s, "IDENTIFIER"), s, line, pos - line_start + 1))
+        elif kind == "OP":
+            s = m.group()
+            append((OPERATORS[s], intern(s), line, pos - line_start + 1))
+        elif kind == "NEWLINE":
+            append(("NEWLINE", m.group(), line, pos - line_start + 1))
+            line += m.group().count("\n")
+            line_start = end
+        elif kind != "WS" and kind != "COMMENT":
+            append((kind, intern(m.group()), line, pos - line_start + 1))
+        pos = end
+    # lark: $END son token'ın konumunu ödünç alır
+    last = toks[-1] if toks else ("", "", 1, 1)
+    append(("$END", "", last[2], last[3]))
+    return toks
+
+
+class PrattParser:
+    def __init__(self, toks: List[Tok], exprs: Optional[ExprTable] = None) -> None:
+        self.toks = toks
+        self.i = 0
+        self.exprs = exprs  # verilirse yan etkisiz ifadeler hash-cons edilir
+
+    # ---- token helpers ----
+    def _peek(self) -> str:
+        return self.toks[self.i][0]
+
+    def _next(self) -> Tok:
+        t = self.toks[self.i]
+        self.i += 1
+        return t
+
+    def _expect(self, kind: str) -> Tok:
+        t = self.toks[self.i]
+        if t[0] != kind:
+            self._error(t, kind)
+        self.i += 1
+        return t
+
+    def _error(self, t: Tok, expected: str):
+        if t[0] == "$ERROR":
+            raise PrattSyntaxError(f"No terminal matches {t[1]!r} at line {t[2]} col {t[3]}", t[2], t[3])
+        raise PrattSyntaxError(
+            f"Unexpected token {t[1]!r} ({t[0]}) at line {t[2]}, column {t[3]}.\nExpected: {expected}",
+            t[2], t[3],
+        )
+
+    def _seps(self) -> bool:
+        toks = self.toks
+        i = self.i
+        while toks[i][0] == "NEWLINE":
+            i += 1
+        seen = i != self.i
+        self.i = i
+        return seen
+
+    # ---- program ----
+    def parse_program(self) -> Program:
+        self._seps()
+        items: List[FuncDef] = []
+        toks = self.toks
+        while self._peek() == "FUNCTION":
+            items.append(self._func_def())
+            # lark: source'taki _seps NEWLINE token'ları Program.items'ta kalır
+            # (AST DOT'taki items[i] numaraları bunları da sayar)
+            i = self.i
+            self._seps()
+            items.extend(Token("NEWLINE", t[1], line=t[2], column=t[3]) for t in toks[i:self.i])
+        t = self.toks[self.i]
+        if t[0] != "$END":
+            self._error(t, "FUNCTION")
+        return Program(items=items)
+
+    def _func_def(self) -> FuncDef:
+        self._expect("FUNCTION")
+        sig = self._func_signature()
+        if self._peek() in ("FUNCTION", "$END"):
+            return FuncDef(signature=sig, body=None)  # sadece bildirim
+        had_sep = self._seps()
+        stmts = self._statements()
+        self._expect("END")
+        self._expect("FUNCTION")
+        # AstBuilder.func_def: ne NEWLINE ne statement varsa body=None
+        return FuncDef(signature=sig, body=stmts if (stmts or had_sep) else None)
+
+    def _func_signature(self) -> FuncSignature:
+        name = self._expect("IDENTIFIER")[1]
+        self._expect("LPAR")
+        args: List[ArgDef] = []
+        if self._peek() != "RPAR":
+            args.append(self._arg_def())
+            while self._peek() == "COMMA":
+                self.i += 1
+                args.append(self._arg_def())
+        self._expect("RPAR")
+        ret = None
+        if self._peek() == "AS":
+            self.i += 1
+            ret = self._type_ref()
+        return FuncSignature(name=name, args=args, return_type=ret)
+
+    def _arg_def(self) -> ArgDef:
+        name = self._expect("IDENTIFIER")[1]
+        t = None
+        if self._peek() == "AS":
+            self.i += 1
+            t = self._type_ref()
+        return ArgDef(name=name, type_ref=t)
+
+    def _type_ref(self) -> TypeRef:
+        t = self._next()
+        if t[0] == "BUILTIN_TYPE":
+            ty: TypeRef = BuiltinType(t[1])
+        elif t[0] == "IDENTIFIER":
+            ty = CustomType(t[1])
+        else:
+            self._error(t, "BUILTIN_TYPE or IDENTIFIER")
+        while self._peek() == "LPAR":
+            self.i += 1
+            commas = 0
+            while self._peek() == "COMMA":
+                self.i += 1
+                commas += 1
+            self._expect("RPAR")
+            ty = ArrayType(base=ty, rank=commas + 1)
+        return ty
+
+    # ---- statements ----
+    def _statements(self) -> List[Stmt]:
+        out: List[Stmt] = []
+        while self._peek() not in _STMT_END:
+            out.append(self._statement())
+        return out
+
+    def _statement(self) -> Stmt:
+        k = self._peek()
+        if k == "DIM":
+            return self._var_stmt()
+        if k == "IF":
+            return self._if_stmt()
+        if k == "WHILE":
+            return self._while_stmt()
+        if k == "DO":
+            return self._do_stmt()
+        if k == "BREAK":
+            self.i += 1
+            self._seps()
+            return Break()
+        e = self._expr()
+        self._expect("SEMICOLON")
+        self._seps()
+        return ExprStmt(expr=e)
+
+    def _var_stmt(self) -> VarDecl:
+        self.i += 1
+        names = [self._expect("IDENTIFIER")[1]]
+        while self._peek() == "COMMA":
+            self.i += 1
+            names.append(self._expect("IDENTIFIER")[1])
+        self._expect("AS")
+        t = self._type_ref()
+        self._seps()
+        return VarDecl(names=names, type_ref=t)
+
+    def _if_stmt(self) -> If:
+        self.i += 1
+        cond = self._expr()
+        self._expect("THEN")
+        self._seps()
+        stmts = self._statements()
+        if self._peek() == "ELSE":
+            self.i += 1
+            self._seps()
+            # AstBuilder.if_stmt: else dalı da then_body'ye eklenir
+            stmts.extend(self._statements())
+        self._expect("END")
+        self._expect("IF")
+        self._seps()
+        return If(cond=cond, then_body=stmts, else_body=None)
+
+    def _while_stmt(self) -> While:
+        self.i += 1
+        cond = self._expr()
+        self._seps()
+        body = self._statements()
+        self._expect("WEND")
+        self._seps()
+        return While(cond=cond, body=body)
+
+    def _do_stmt(self) -> DoLoop:
+        self.i += 1
+        self._seps()
+        body = self._statements()
+        self._expect("LOOP")
+        t = self._next()
+        if t[0] not in ("WHILE", "UNTIL"):
+            self._error(t, "WHILE or UNTIL")
+        cond = self._expr()
+        self._seps()
+        # AstBuilder.do_stmt anonim while/until token'ını göremez -> mode hep "while"
+        return DoLoop(body=body, mode="while", cond=cond)
+
+    # ---- expressions ----
+    def _expr(self) -> Expr:
+        lhs = self._binary(0)
+        if self._peek() == "ASSIGN_OP":
+            self.i += 1
+            return Assign(lhs=lhs, rhs=self._expr())
+        return lhs
+
+    def _binary(self, min_prec: int) -> Expr:
+        lhs = self._unary()
+        toks = self.toks
+        while True:
+            t = toks[self.i]
+            prec = BINARY_PREC.get(t[0])
+            if prec is None or prec <= min_prec:
+                return lhs
+            self.i += 1
+            rhs = self._binary(prec)
+            lhs = Binary(op=t[1], lhs=lhs, rhs=rhs) if self.exprs is None else self.exprs.binary(t[1], lhs, rhs)
+
+    def _unary(self) -> Expr:
+        k = self._peek()
+        if k == "ADD_OP" or k == "UNARY_OP":
+            op = self._next()[1]
+            rhs = self._unary()
+            return Unary(op=op, rhs=rhs) if self.exprs is None else self.exprs.unary(op, rhs)
+        return self._postfix()
+
+    def _postfix(self) -> Expr:
+        e = self._atom()
+        while self._peek() == "LPAR":
+            self.i += 1
+            if self._peek() == "RPAR":
+                # AstBuilder.call_or_indexer: boş "()" hiçbir şey üretmez
+                self.i += 1
+                continue
+            args = [self._expr()]
+            while self._peek() == "COMMA":
+                self.i += 1
+                args.append(self._expr())
+            self._expect("RPAR")
+            e = CallOrIndexer(callee=e, args=args)
+        return e
+
+    def _atom(self) -> Expr:
+        t = self._next()
+        k = t[0]
+        if k == "IDENTIFIER":
+            return Place(name=t[1]) if self.exprs is None else self.exprs.place(t[1])
+        if k == "LPAR":
+            e = self._expr()
+            self._expect("RPAR")
+            return e
+        kind = LITERALS.get(k)
+        if kind is not None:
+            return Literal(kind, t[1]) if self.exprs is None else self.exprs.literal(kind, t[1])
+        self.i -= 1
+        self._error(t, "expression")
+
+
+def parse_program(text: str, exprs: Optional[ExprTable] = None) -> Program:
+    """PrattSyntaxError fırlatır; ParseResult sarmalaması parser.parse_text içinde."""
+    return PrattParser(tokenize(text), exprs).parse_program()
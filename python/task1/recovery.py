@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from lark import exceptions
+from lark.parsers.lalr_analysis import Shift
+
+from .ast import FuncDef, ParseError, Program
+from .incremental import split_spans
+from .parser import ParseResult, get_parser, parse_text, shifted_error
+
+# Bir fonksiyon içinde en fazla bu kadar hata toplanır (kaskad koruması)
+MAX_ERRORS_PER_FUNC = 50
+
+# Statement listesi bağlamındaki LALR state'leri bu terminali kabul eder
+_STMT_START = "DIM"
+_TOP_LEVEL = "FUNCTION"
+
+
+class _Recovery:
+    """
+    Lark on_error callback'i: ilk hatada parser stack'ini statement seviyesine
+    kadar geri sarar, aynı satırdaki kalan token'ları sessizce atlar ve bir
+    sonraki satırdan (statement sınırı) parse'a devam eder.
+    """
+
+    def __init__(self, line_offset: int) -> None:
+        self.line_offset = line_offset
+        self.errors: List[ParseError] = []
+        self.skip_line: Optional[int] = None
+
+    def __call__(self, e: exceptions.UnexpectedInput) -> bool:
+        token = getattr(e, "token", None)
+        if token is not None and token.type == "$END":
+            self._record(e)
+            return False
+
+        if e.line == self.skip_line:
+            return True
+
+        self._record(e)
+        if len(self.errors) >= MAX_ERRORS_PER_FUNC:
+            return False
+
+        ip = getattr(e, "interactive_parser", None)
+        if ip is None or not self._unwind(ip):
+            return False
+        self.skip_line = e.line
+        return True
+
+    def _record(self, e: exceptions.UnexpectedInput) -> None:
+        line = e.line + self.line_offset
+        if self.errors and self.errors[-1].line == line and self.errors[-1].column == e.column:
+            return
+        self.errors.append(shifted_error(ParseError(message=str(e), line=e.line, column=e.column), self.line_offset))
+
+    def _unwind(self, ip) -> bool:
+        ps = ip.parser_state
+        states = ps.parse_conf.parse_table.states
+
+        def shifts(state, term: str) -> bool:
+            act = states[state].get(term)
+            return act is not None and act[0] is Shift
+
+        for wanted in (_STMT_START, _TOP_LEVEL):
+            depth = len(ps.state_stack)
+            while depth > 0 and not shifts(ps.state_stack[depth - 1], wanted):
+                depth -= 1
+            if depth > 0:
+                del ps.state_stack[depth:]
+                del ps.value_stack[depth - 1:]
+                return True
+        return False
+
+
+def collect_errors(chunk: str, line_offset: int) -> List[ParseError]:
+    rec = _Recovery(line_offset)
+    parser = get_parser(inline=False, positions=False)
+    try:
+        parser.parse(chunk, on_error=rec)
+    except exceptions.UnexpectedInput as e:
+        rec._record(e)
+    return rec.errors
+
+
+def parse_text_recover(text: str) -> ParseResult:
+    """
+    Hata toleranslı parse: kaynak top-level "function" sınırlarından bölünür,
+    her fonksiyon ayrı parse edilir. Hatalı fonksiyonlarda tüm sözdizimi hataları
+    (statement sınırlarında senkronize olarak) toplanır; hatasız fonksiyonlar
+    kısmi Program olarak döner. Hiç hata yoksa sonuç parse_text ile aynıdır.
+    """
+    res = parse_text(text, inline=True)
+    if not res.errors:
+        return res
+
+    funcs: List[FuncDef] = []
+    errors: List[ParseError] = []
+    for sp in split_spans(text):
+        chunk = text[sp.start:sp.end]
+        if not chunk.strip():
+            continue
+        part = parse_text(chunk, inline=True)
+        if not part.errors:
+            funcs.extend(x for x in part.program.items if isinstance(x, FuncDef))
+            continue
+        errors.extend(collect_errors(chunk, sp.line - 1))
+
+    return ParseResult(program=Program(items=funcs), errors=errors)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import mmap
+import re
+from bisect import bisect_right
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+PathLike = Union[str, Path]
+
+# satır sonu: "\r\n", tek "\r" (eski Mac) veya "\n"; text, iter_lines ve satır indeksi aynı kuralı kullanır
+_EOL_RE = re.compile(rb"\r\n?|\n")
+
+
+class SourceBuffer:
+    """
+    Dosyanın mmap ile eşlenmiş, salt okunur görünümü. İçerik kopyalanmaz:
+    text ilk erişimde bir kez decode edilir, iter_lines() satırları mmap
+    üzerinden tek tek decode eder (bütün dosyanın splitlines() kopyası oluşmaz).
+
+    Satır başı offset tablosu (byte offset) ilk ihtiyaçta tembel olarak kurulur;
+    offset -> (satır, sütun) dönüşümü bisect ile yapılır.
+
+    mmap edilemeyen kaynaklarda (boş dosya, pipe) blok blok okumaya düşer.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        buf_size: int = 64 * 1024,
+    ) -> None:
+        self.path = Path(path)
+        self.encoding = encoding
+        self.errors = errors
+        self._text: Optional[str] = None
+        self._line_starts: Optional[List[int]] = None
+        self._mm: Optional[mmap.mmap] = None
+
+        with open(self.path, "rb") as f:
+            try:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._data: Union[mmap.mmap, bytes] = self._mm
+            except (ValueError, OSError):
+                # boş dosya veya mmap desteklemeyen kaynak
+                self._data = b"".join(iter(partial(f.read, buf_size), b""))
+        # decode bu görünüm üzerinden yapılır (arada bytes kopyası oluşmaz)
+        self._view = memoryview(self._data)
+
+    # --- yaşam döngüsü ---
+
+    def close(self) -> None:
+        self._view.release()
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._data = b""
+        self._view = memoryview(self._data)
+
+    def __enter__(self) -> "SourceBuffer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    # --- içerik ---
+
+    def _decode(self, a: int, b: int) -> str:
+        return str(self._view[a:b], self.encoding, self.errors)
+
+    @property
+    def text(self) -> str:
+        """Tüm içerik; bir kez decode edilir, satır sonları "\\n"e normalize edilir."""
+        if self._text is None:
+            text = self._decode(0, len(self._data))
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            self._text = text
+        return self._text
+
+    def iter_lines(self, keepends: bool = False) -> Iterator[str]:
+        """
+        Satırları sırayla decode eder. Satır sonu ("\\n", "\\r\\n" veya "\\r") atılır;
+        keepends=True ise "\\n" olarak korunur (text ile aynı satırlar).
+        """
+        data = self._data
+        pos = 0
+        for m in _EOL_RE.finditer(data):
+            line = self._decode(pos, m.start())
+            yield line + "\n" if keepends else line
+            pos = m.end()
+        if pos < len(data):
+            yield self._decode(pos, len(data))
+
+    # --- satır indeksi ---
+
+    @property
+    def line_starts(self) -> List[int]:
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in _EOL_RE.finditer(self._data)]
+        return self._line_starts
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_starts)
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """Byte offset -> (satır, sütun); ikisi de 1 tabanlı, sütun karakter cinsinden."""
+        starts = self.line_starts
+        i = bisect_right(starts, offset) - 1
+        return i + 1, len(self._decode(starts[i], offset)) + 1
+
+    def line(self, lineno: int) -> str:
+        """1 tabanlı satırı satır sonu olmadan döndürür."""
+        starts = self.line_starts
+        a = starts[lineno - 1]
+        if lineno < len(starts):
+            m = _EOL_RE.search(self._data, a)
+            return self._decode(a, m.start())
+        return self._decode(a, len(self._data))
+
+
+def read_source(path: PathLike, buf_size: int = 64 * 1024) -> str:
+    with SourceBuffer(path, buf_size=buf_size) as src:
+        return src.text
+
+
+def iter_source_lines(path: PathLike, errors: str = "replace") -> Iterator[str]:
+    """DOT gibi satır tabanlı dosyalar için: read_text().splitlines() yerine."""
+    with SourceBuffer(path, errors=errors) as src:
+        yield from src.iter_lines()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Iterator, List, Optional
+
+from .ast import FuncDef, ParseError
+from .incremental import FUNC_START_RE
+from .parser import parse_text, shifted_error
+from .recovery import collect_errors
+from .source import SourceBuffer
+
+
+def iter_func_defs(
+    path: str,
+    buf_size: int = 64 * 1024,
+    errors: Optional[List[ParseError]] = None,
+    recover: bool = False,
+    backend: str = "lark",
+) -> Iterator[FuncDef]:
+    """
+    Kaynağı (mmap üzerinden) tek geçişte satır satır okur, top-level "function" sınırlarında
+    böler ve her fonksiyonu ayrı parse edip FuncDef olarak yield eder.
+    Bellekte aynı anda sadece bir fonksiyonun metni tutulur.
+
+    Parse hataları (dosyadaki gerçek satır numarasıyla) `errors` listesine eklenir;
+    hatalı span atlanır, diğer fonksiyonlar yine üretilir. recover=True ise hatalı
+    span'deki tüm hatalar (sadece ilki değil) toplanır. backend, parse_text'e
+    aynen geçirilir.
+    """
+    buf: List[str] = []
+    buf_line = 1  # buf'taki ilk satırın dosyadaki numarası
+    line_no = 0
+
+    with SourceBuffer(path, buf_size=buf_size) as src:
+        for line in src.iter_lines(keepends=True):
+            line_no += 1
+            if buf and FUNC_START_RE.match(line):
+                yield from _parse_span("".join(buf), buf_line, errors, recover, backend)
+                buf = []
+                buf_line = line_no
+            buf.append(line)
+
+    if buf:
+        yield from _parse_span("".join(buf), buf_line, errors, recover, backend)
+
+
+def _parse_span(
+    chunk: str,
+    first_line: int,
+    errors: Optional[List[ParseError]],
+    recover: bool,
+    backend: str,
+) -> Iterator[FuncDef]:
+    if not chunk.strip():
+        return
+    res = parse_text(chunk, inline=True, backend=backend)
+    if res.errors:
+        if errors is not None and recover:
+            errors.extend(collect_errors(chunk, first_line - 1))
+        elif errors is not None:
+            for e in res.errors:
+                errors.append(shifted_error(e, first_line - 1))
+        return
+    for item in res.program.items:
+        if isinstance(item, FuncDef):
+            yield item
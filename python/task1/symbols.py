@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .ast import (
+    ArrayType, DoLoop, Expr, ExprStmt, FuncDef, If, Place, Program,
+    Stmt, TypeRef, VarDecl, While,
+)
+from .visitor import walk
+
+FUNC, ARG, VAR = "func", "arg", "var"
+
+
+@dataclass
+class Symbol:
+    id: int                     # program genelinde yoğun id (SymbolTable.symbols indeksi)
+    name: str
+    kind: str                   # "func" | "arg" | "var"
+    type_ref: Optional[TypeRef]
+    func: int                   # sahibi fonksiyonun id'si (fonksiyonlar için kendisi)
+    scope: int                  # tanımlandığı scope id'si
+    slot: int = -1              # fonksiyon içindeki sıra (arg'lar önce); fonksiyonlarda -1
+
+
+@dataclass
+class Scope:
+    id: int
+    parent: int                 # -1 = global
+    func: int                   # -1 = global
+    names: Dict[str, int] = field(default_factory=dict)  # isim -> symbol id
+
+
+@dataclass
+class FuncSymbols:
+    id: int                     # fonksiyonun symbol id'si
+    locals: List[int] = field(default_factory=list)   # arg + var symbol id'leri, slot sırasıyla
+
+
+@dataclass
+class SymbolTable:
+    symbols: List[Symbol] = field(default_factory=list)
+    scopes: List[Scope] = field(default_factory=list)
+    functions: Dict[str, FuncSymbols] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+    def lookup(self, name: str, scope: int) -> Optional[Symbol]:
+        while scope >= 0:
+            sc = self.scopes[scope]
+            sid = sc.names.get(name)
+            if sid is not None:
+                return self.symbols[sid]
+            scope = sc.parent
+        return None
+
+    def locals_of(self, func: str) -> List[Symbol]:
+        fs = self.functions.get(func)
+        return [] if fs is None else [self.symbols[i] for i in fs.locals]
+
+    def slot_map(self, func: str) -> Dict[str, int]:
+        """isim -> fonksiyon içi slot (aynı isim iç scope'ta tekrar varsa ilk tanım)."""
+        out: Dict[str, int] = {}
+        for sym in self.locals_of(func):
+            out.setdefault(sym.name, sym.slot)
+        return out
+
+    def type_name(self, sym: Symbol) -> str:
+        return type_to_str(sym.type_ref)
+
+
+def type_to_str(t: Optional[TypeRef]) -> str:
+    if t is None:
+        return "<?>"
+    if isinstance(t, ArrayType):
+        return f"{type_to_str(t.base)}({t.rank})"
+    return str(getattr(t, "name", t))
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.st = SymbolTable()
+        self.func_id = -1
+        self.func_name = ""
+
+    def new_scope(self, parent: int) -> int:
+        sc = Scope(id=len(self.st.scopes), parent=parent, func=self.func_id)
+        self.st.scopes.append(sc)
+        return sc.id
+
+    def declare(self, name: str, kind: str, type_ref: Optional[TypeRef], scope: int) -> int:
+        st = self.st
+        sc = st.scopes[scope]
+        if name in sc.names:
+            where = f"[{self.func_name}] " if self.func_name else ""
+            st.errors.append(f"[semantic] {where}duplicate declaration: {name}")
+            return sc.names[name]
+        sid = len(st.symbols)
+        func = sid if kind == FUNC else self.func_id
+        sym = Symbol(id=sid, name=name, kind=kind, type_ref=type_ref, func=func, scope=scope)
+        if kind != FUNC:
+            fs = st.functions[self.func_name]
+            sym.slot = len(fs.locals)
+            fs.locals.append(sid)
+        st.symbols.append(sym)
+        sc.names[name] = sid
+        return sid
+
+    def build(self, program: Program) -> SymbolTable:
+        st = self.st
+        glob = self.new_scope(-1)
+
+        # 1) tüm fonksiyonlar önce: ileriye dönük çağrılar da çözülür
+        funcs: List[FuncDef] = []
+        for f in program.items:
+            if not isinstance(f, FuncDef):
+                continue
+            sig = f.signature
+            if sig.name in st.functions:
+                st.errors.append(f"[semantic] duplicate function name: {sig.name}")
+                continue
+            sid = self.declare(sig.name, FUNC, sig.return_type, glob)
+            st.functions[sig.name] = FuncSymbols(id=sid)
+            funcs.append(f)
+
+        # 2) her fonksiyon: arg'lar + gövde, tek doğrusal geçiş
+        for f in funcs:
+            fs = st.functions[f.signature.name]
+            self.func_id = fs.id
+            self.func_name = f.signature.name
+            scope = self.new_scope(glob)
+            for a in f.signature.args:
+                self.declare(a.name, ARG, a.type_ref, scope)
+            if f.body:
+                self.stmts(f.body, scope)
+            self.func_id = -1
+            self.func_name = ""
+        return st
+
+    def stmts(self, body: List[Stmt], scope: int) -> None:
+        for s in body:
+            t = type(s)
+            if t is VarDecl:
+                for n in s.names:
+                    self.declare(n, VAR, s.type_ref, scope)
+            elif t is ExprStmt:
+                self.expr(s.expr, scope)
+            elif t is If:
+                self.expr(s.cond, scope)
+                self.stmts(s.then_body or [], self.new_scope(scope))
+                if s.else_body:
+                    self.stmts(s.else_body, self.new_scope(scope))
+            elif t is While:
+                self.expr(s.cond, scope)
+                self.stmts(s.body or [], self.new_scope(scope))
+            elif t is DoLoop:
+                self.stmts(s.body or [], self.new_scope(scope))
+                self.expr(s.cond, scope)
+
+    def expr(self, e: Expr, scope: int) -> None:
+        for n in walk(e):
+            if type(n) is Place and self.st.lookup(n.name, scope) is None:
+                self.st.errors.append(f"[semantic] [{self.func_name}] unknown identifier: {n.name}")
+
+
+def build_symbols(program: Program) -> SymbolTable:
+    """
+    AST üzerinde tek doğrusal geçiş: fonksiyonlar global scope'a, arg'lar
+    fonksiyon scope'una, VarDecl'lar bulundukları bloğun scope'una (if/while/do
+    gövdeleri iç içe scope) yazılır. Her fonksiyon/arg/değişken yoğun bir int id
+    ve fonksiyon içi slot alır; bilinmeyen ve tekrar tanımlanan isimler errors'a.
+    """
+    return _Builder().build(program)
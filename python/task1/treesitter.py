@@ -0,0 +1,1165 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+import lark
+import tree_sitter
+from lark import Token
+from lark.parsers.lalr_analysis import Reduce, Shift
+
+try:  # python >= 3.11
+    import re._constants as _sre
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants as _sre  # type: ignore[no-redef]
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+from .ast import FuncDef, Program
+from .parser import GRAMMAR_PATH, ParseResult, _digest, get_parser, parse_text, parser_cache_dir
+
+# tree-sitter backend'i. tree-sitter/grammar.js Variant-1 dilini tarif ediyor ve
+# ortamda tree-sitter CLI yok; bu yüzden parser.c, grammar_v3.lark'ın lark LALR
+# tablosundan ve contextual lexer'ından doğrudan tree-sitter ABI 14 formatında
+# üretilir, cc ile derlenip parser_cache_dir()'e konur (ctypes ile yüklenir).
+# Parse tablosu ve token kuralları lark'ınkinin aynısı olduğundan kabul edilen dil,
+# token sınırları ve çakışma çözümleri birebir aynıdır; CST -> AST dönüşümü de
+# lark'ın kendi (AstBuilder + ChildFilter) callback'leriyle yapılır. Sözdizimi
+# hatası olan kaynakta mesajlar lark'la aynı olsun diye lark'a düşülür.
+#
+# Sembol düzeni (üretici ve yükleyici aynı sırayı hesaplar):
+#   0                  : end
+#   1 .. token_count-1 : lark terminalleri, root lexer sırasıyla (atlanan WS hariç)
+#   token_count ..     : kural başına bir sembol (str(rule) sırasıyla); düğümün
+#                        grammar_id'si hangi alternatifin reduce edildiğini verir
+
+ABI_VERSION = 14
+_SO_PREFIX = "tree_sitter_v3-"
+_ENTRY = "tree_sitter_v3"
+
+# terminal bayrakları (C tarafıyla aynı)
+F_SKIP = 1        # ignore terminali, token başında advance(skip) ile atlanır
+F_WORD_END = 2    # desen "\b" ile biter: sonraki karakter \w olmamalı
+F_MAXIMAL = 4     # sadece en uzun eşleşme kabul (negatif lookahead'li IDENTIFIER)
+F_EXCLUDE = 8     # (?!kw\b|...) listesindeki kelimeler reddedilir
+_WORD_MAX = 32    # dışlama kontrolü için tutulan en fazla karakter
+
+# dönüşümde token değeri yerine hiçbir şey itilmeyen (extra) terminaller
+_EXTRA = object()
+
+
+class GrammarNotSupported(ValueError):
+    pass
+
+
+# --------- regex -> DFA ---------
+_MAX_CHAR = sys.maxunicode
+Ranges = List[Tuple[int, int]]
+
+
+def _merge(ranges: Sequence[Tuple[int, int]]) -> Ranges:
+    out: Ranges = []
+    for lo, hi in sorted(ranges):
+        if out and lo <= out[-1][1] + 1:
+            out[-1] = (out[-1][0], max(out[-1][1], hi))
+        else:
+            out.append((lo, hi))
+    return out
+
+
+def _complement(ranges: Ranges) -> Ranges:
+    out: Ranges = []
+    nxt = 0
+    for lo, hi in _merge(ranges):
+        if lo > nxt:
+            out.append((nxt, lo - 1))
+        nxt = hi + 1
+    if nxt <= _MAX_CHAR:
+        out.append((nxt, _MAX_CHAR))
+    return out
+
+
+def _in_set(items) -> Ranges:
+    negate = False
+    ranges: Ranges = []
+    for op, av in items:
+        if op is _sre.NEGATE:
+            negate = True
+        elif op is _sre.LITERAL:
+            ranges.append((av, av))
+        elif op is _sre.RANGE:
+            ranges.append(av)
+        else:
+            raise GrammarNotSupported(f"unsupported character class item: {op}")
+    return _complement(ranges) if negate else _merge(ranges)
+
+
+def _finite(items, limit: int = 256) -> Optional[List[str]]:
+    """Sonlu dilli (sadece literal/branch/küçük küme) bir desenin kelimeleri; değilse None."""
+    words = [""]
+    for op, av in items:
+        if op is _sre.LITERAL:
+            alts = [chr(av)]
+        elif op is _sre.IN:
+            ranges = _in_set(av)
+            if sum(hi - lo + 1 for lo, hi in ranges) > limit:
+                return None
+            alts = [chr(c) for lo, hi in ranges for c in range(lo, hi + 1)]
+        elif op is _sre.BRANCH:
+            alts = []
+            for alt in av[1]:
+                sub = _finite(alt, limit)
+                if sub is None:
+                    return None
+                alts.extend(sub)
+        elif op is _sre.SUBPATTERN:
+            alts = _finite(av[3], limit)
+            if alts is None:
+                return None
+        else:
+            return None
+        words = [w + a for w in words for a in alts]
+        if len(words) > limit:
+            return None
+    return words
+
+
+class _NFA:
+    def __init__(self) -> None:
+        self.eps: List[List[int]] = []
+        self.edges: List[List[Tuple[Ranges, int]]] = []
+
+    def new(self) -> int:
+        self.eps.append([])
+        self.edges.append([])
+        return len(self.eps) - 1
+
+    def char(self, s: int, ranges: Ranges) -> int:
+        e = self.new()
+        self.edges[s].append((ranges, e))
+        return e
+
+    def build(self, items, s: int) -> int:
+        for op, av in items:
+            if op is _sre.LITERAL:
+                s = self.char(s, [(av, av)])
+            elif op is _sre.NOT_LITERAL:
+                s = self.char(s, _complement([(av, av)]))
+            elif op is _sre.ANY:
+                s = self.char(s, _complement([(10, 10)]))  # DOTALL yok: \n hariç
+            elif op is _sre.IN:
+                s = self.char(s, _in_set(av))
+            elif op is _sre.SUBPATTERN:
+                _, add_flags, del_flags, sub = av
+                if add_flags or del_flags:
+                    raise GrammarNotSupported("inline regex flags are not supported")
+                s = self.build(sub, s)
+            elif op is _sre.BRANCH:
+                alts = av[1]
+                # python alternation'da ilk eşleşen kazanır, DFA en uzunu alır:
+                # önceki bir alternatif sonrakinin öneki olmamalı
+                langs = [_finite(alt) for alt in alts]
+                for i, a in enumerate(langs):
+                    for b in langs[i + 1:]:
+                        if a is not None and b is not None and any(
+                            y != x and y.startswith(x) for x in a for y in b
+                        ):
+                            raise GrammarNotSupported("alternative is a prefix of a later one")
+                e = self.new()
+                for alt in alts:
+                    a = self.new()
+                    self.eps[s].append(a)
+                    self.eps[self.build(alt, a)].append(e)
+                s = e
+            elif op is _sre.MAX_REPEAT:
+                lo, hi, sub = av
+                for _ in range(lo):
+                    s = self.build(sub, s)
+                if hi is _sre.MAXREPEAT:
+                    loop = self.new()
+                    self.eps[s].append(loop)
+                    self.eps[self.build(sub, loop)].append(loop)
+                    s = loop
+                else:
+                    for _ in range(hi - lo):
+                        e = self.new()
+                        self.eps[s].append(e)
+                        self.eps[self.build(sub, s)].append(e)
+                        s = e
+            else:
+                raise GrammarNotSupported(f"unsupported regex construct: {op}")
+        return s
+
+
+@dataclass
+class _Dfa:
+    trans: List[List[Tuple[int, int, int]]]  # durum -> [(lo, hi, hedef)]
+    accept: List[bool]
+    flags: int
+    exclude: Tuple[str, ...]
+
+    @property
+    def first(self) -> Ranges:
+        return [(lo, hi) for lo, hi, _ in self.trans[0]]
+
+
+def _subset(nfa: _NFA, start: int, final: int) -> Tuple[List[List[Tuple[int, int, int]]], List[bool]]:
+    def closure(states) -> FrozenSet[int]:
+        seen = set(states)
+        todo = list(states)
+        while todo:
+            for t in nfa.eps[todo.pop()]:
+                if t not in seen:
+                    seen.add(t)
+                    todo.append(t)
+        return frozenset(seen)
+
+    first = closure([start])
+    index = {first: 0}
+    order = [first]
+    trans: List[List[Tuple[int, int, int]]] = []
+    accept: List[bool] = []
+    k = 0
+    while k < len(order):
+        cur = order[k]
+        k += 1
+        edges = [(lo, hi, t) for s in cur for ranges, t in nfa.edges[s] for lo, hi in ranges]
+        points = sorted({lo for lo, _, _ in edges} | {hi + 1 for _, hi, _ in edges})
+        out: List[Tuple[int, int, int]] = []
+        for a, b in zip(points, points[1:]):
+            targets = [t for lo, hi, t in edges if lo <= a and b - 1 <= hi]
+            if not targets:
+                continue
+            nxt = closure(targets)
+            j = index.get(nxt)
+            if j is None:
+                j = index[nxt] = len(order)
+                order.append(nxt)
+            if out and out[-1][2] == j and out[-1][1] == a - 1:
+                out[-1] = (out[-1][0], b - 1, j)
+            else:
+                out.append((a, b - 1, j))
+        trans.append(out)
+        accept.append(final in cur)
+    return trans, accept
+
+
+def _boundary_words(items) -> Tuple[str, ...]:
+    # (?!kw\b|kw2\b|...) -> ("kw", "kw2", ...); sre ortak önekleri dışarı alabilir,
+    # bu yüzden "\b"ler önce işaret karakterine çevrilip dil açılır
+    marker = "\0"
+    words = _finite(_mark_boundaries(items), limit=4096)
+    if words is None or not all(w.endswith(marker) and marker not in w[:-1] for w in words):
+        raise GrammarNotSupported("negative lookahead must be a list of literal\\b words")
+    return tuple(w[:-1] for w in words)
+
+
+def _mark_boundaries(items):
+    out = []
+    for op, av in items:
+        if (op, av) == (_sre.AT, _sre.AT_BOUNDARY):
+            out.append((_sre.LITERAL, 0))
+        elif op is _sre.BRANCH:
+            out.append((op, (av[0], [_mark_boundaries(alt) for alt in av[1]])))
+        elif op is _sre.SUBPATTERN:
+            out.append((op, av[:3] + (_mark_boundaries(av[3]),)))
+        else:
+            out.append((op, av))
+    return out
+
+
+def compile_terminal(pattern: str) -> _Dfa:
+    """lark terminal regex'i -> DFA (+ lookahead/"\\b" bayrakları)."""
+    items = list(_sre_parse.parse(pattern))
+    flags = 0
+    exclude: Tuple[str, ...] = ()
+    if items and items[0][0] is _sre.ASSERT_NOT:
+        direction, sub = items[0][1]
+        if direction != 1:
+            raise GrammarNotSupported("only a leading negative lookahead is supported")
+        exclude = _boundary_words(list(sub))
+        flags |= F_MAXIMAL | F_EXCLUDE
+        items = items[1:]
+    if items and items[-1] == (_sre.AT, _sre.AT_BOUNDARY):
+        flags |= F_WORD_END
+        items = items[:-1]
+    nfa = _NFA()
+    start = nfa.new()
+    final = nfa.build(items, start)
+    trans, accept = _subset(nfa, start, final)
+    if accept[0]:
+        raise GrammarNotSupported(f"terminal matches the empty string: {pattern!r}")
+    dfa = _Dfa(trans=trans, accept=accept, flags=flags, exclude=exclude)
+    if flags & F_EXCLUDE:
+        # en uzun eşleşme = \w olmayan karaktere kadar; dışlanan kelimeler DFA'dan geçmeli
+        if not all(accept[1:]):
+            raise GrammarNotSupported("lookahead terminal must accept every non-empty prefix")
+        for w in exclude:
+            s: Optional[int] = 0
+            for ch in w:
+                s = _step(dfa, s, ord(ch)) if s is not None else None
+            if s is None or not re.fullmatch(r"\w+", w) or len(w) > _WORD_MAX:
+                raise GrammarNotSupported(f"excluded word {w!r} is not matched by the terminal")
+    return dfa
+
+
+def _step(dfa: _Dfa, s: int, c: int) -> Optional[int]:
+    for lo, hi, t in dfa.trans[s]:
+        if lo <= c <= hi:
+            return t
+    return None
+
+
+def _word_ranges() -> Ranges:
+    # python'un str desenlerindeki \w'si (unicode), C tarafındaki is_word() için
+    chars = "".join(map(chr, range(_MAX_CHAR + 1)))
+    return [(m.start(), m.end() - 1) for m in re.finditer(r"\w+", chars)]
+
+
+# --------- lark tabloları -> sembol düzeni ---------
+@dataclass
+class _Layout:
+    lark: lark.Lark
+    terminals: List[Any]             # TerminalDef, root lexer sırası
+    dfas: List[_Dfa]
+    term_symbol: List[int]           # terminal sırası -> sembol (atlananlar 0)
+    rules: List[Any]                 # sembol - token_count -> Rule
+    token_count: int
+    symbol_names: List[str]
+    named: List[bool]
+    visible: List[bool]
+    token_kind: List[Any]            # terminal sembolü -> Token tipi / None (filtreli) / _EXTRA
+    callbacks: List[Optional[Callable]]
+    func_symbols: FrozenSet[int]
+    spine_symbols: FrozenSet[int]    # source'un sol özyinelemeli (_ önekli) liste kuralları
+
+    @property
+    def symbol_count(self) -> int:
+        return len(self.symbol_names)
+
+
+@lru_cache(maxsize=None)
+def _layout() -> _Layout:
+    L = get_parser(inline=True, positions=False)
+    table = L.parser.parser._parse_table
+    callbacks = L._callbacks
+    terminals = list(L.parser.lexer.root_lexer.terminals)
+    ignore = set(L.lexer_conf.ignore)
+    if any(t.pattern.flags for t in terminals):
+        raise GrammarNotSupported("terminal regex flags are not supported")
+    dfas = [compile_terminal(t.pattern.to_regexp()) for t in terminals]
+
+    # ignore terminali tek karakterle kabul ediyor, önceki terminallerle ilk karakter
+    # paylaşmıyor ve uzadıkça hep kabul ediyorsa token başında atlanabilir; değilse
+    # (COMMENT: "//" gerekir) her durumda extra olarak shift edilen bir token olur
+    for i, t in enumerate(terminals):
+        if t.name not in ignore:
+            continue
+        d = dfas[i]
+        closed = all(d.accept[1:]) and not d.flags
+        disjoint = all(
+            not (lo <= b and a <= hi)
+            for prev in dfas[:i] for lo, hi in prev.first for a, b in d.first
+        )
+        if closed and disjoint:
+            d.flags |= F_SKIP
+
+    kept = set()
+    rules_set = set()
+    for acts in table.states.values():
+        for act, arg in acts.values():
+            if act is Reduce:
+                rules_set.add(arg)
+    for r in rules_set:
+        for s in r.expansion:
+            if s.is_term and not s.filter_out:
+                kept.add(s.name)
+
+    names = ["end"]
+    named = [True]
+    visible = [False]
+    kinds: List[Any] = [None]
+    term_symbol = []
+    for t, d in zip(terminals, dfas):
+        if d.flags & F_SKIP:
+            term_symbol.append(0)
+            continue
+        term_symbol.append(len(names))
+        is_named = t.name in kept or t.name in ignore
+        lit = t.pattern.value if isinstance(t.pattern, lark.lexer.PatternStr) else None
+        names.append(t.name if is_named or lit is None else lit)
+        named.append(is_named)
+        visible.append(True)
+        kinds.append(_EXTRA if t.name in ignore else (t.name if t.name in kept else None))
+    token_count = len(names)
+
+    rules = sorted(rules_set, key=str)
+    if len({str(r) for r in rules}) != len(rules):
+        raise GrammarNotSupported("duplicate rule strings")
+    cbs: List[Optional[Callable]] = [None] * token_count
+    probe = object()
+    for r in rules:
+        cb = callbacks[r]
+        names.append(r.origin.name)
+        named.append(True)
+        # tek (inline olmayan) nonterminal çocuğunu aynen döndüren kurallar
+        # (?expr: assign, bin/call_or_indexer'ın tek elemanlı hali...) görünmez:
+        # cursor onları atlar, çocuğun değeri doğrudan ebeveyne gider
+        passthrough = False
+        if len(r.expansion) == 1 and not r.expansion[0].is_term and not r.expansion[0].name.startswith("_"):
+            try:
+                passthrough = cb([probe]) is probe
+            except Exception:
+                passthrough = False
+        visible.append(not passthrough)
+        cbs.append(cb)
+    func_symbols = frozenset(
+        token_count + i for i, r in enumerate(rules) if r.origin.name == "func_def"
+    )
+    source_lists = {
+        s.name for r in rules if r.origin.name == "source"
+        for s in r.expansion if not s.is_term and s.name.startswith("_")
+    }
+    spine_symbols = frozenset(
+        token_count + i for i, r in enumerate(rules) if r.origin.name in source_lists
+    )
+    return _Layout(
+        lark=L, terminals=terminals, dfas=dfas, term_symbol=term_symbol, rules=rules,
+        token_count=token_count, symbol_names=names, named=named, visible=visible,
+        token_kind=kinds, callbacks=cbs, func_symbols=func_symbols, spine_symbols=spine_symbols,
+    )
+
+
+# --------- parser.c üretimi ---------
+_HEADER = r"""
+#include <stdbool.h>
+#include <stddef.h>
+#include <stdint.h>
+
+typedef uint16_t TSStateId;
+typedef uint16_t TSSymbol;
+typedef uint16_t TSFieldId;
+typedef struct { TSFieldId field_id; uint8_t child_index; bool inherited; } TSFieldMapEntry;
+typedef struct { uint16_t index; uint16_t length; } TSFieldMapSlice;
+typedef struct { bool visible; bool named; bool supertype; } TSSymbolMetadata;
+typedef struct TSLexer TSLexer;
+struct TSLexer {
+  int32_t lookahead;
+  TSSymbol result_symbol;
+  void (*advance)(TSLexer *, bool);
+  void (*mark_end)(TSLexer *);
+  uint32_t (*get_column)(TSLexer *);
+  bool (*is_at_included_range_start)(const TSLexer *);
+  bool (*eof)(const TSLexer *);
+};
+typedef enum {
+  TSParseActionTypeShift, TSParseActionTypeReduce, TSParseActionTypeAccept, TSParseActionTypeRecover,
+} TSParseActionType;
+typedef union {
+  struct { uint8_t type; TSStateId state; bool extra; bool repetition; } shift;
+  struct { uint8_t type; uint8_t child_count; TSSymbol symbol; int16_t dynamic_precedence; uint16_t production_id; } reduce;
+  uint8_t type;
+} TSParseAction;
+typedef struct { uint16_t lex_state; uint16_t external_lex_state; } TSLexMode;
+typedef union { TSParseAction action; struct { uint8_t count; bool reusable; } entry; } TSParseActionEntry;
+typedef struct TSLanguage {
+  uint32_t version, symbol_count, alias_count, token_count, external_token_count, state_count,
+           large_state_count, production_id_count, field_count;
+  uint16_t max_alias_sequence_length;
+  const uint16_t *parse_table;
+  const uint16_t *small_parse_table;
+  const uint32_t *small_parse_table_map;
+  const TSParseActionEntry *parse_actions;
+  const char * const *symbol_names;
+  const char * const *field_names;
+  const TSFieldMapSlice *field_map_slices;
+  const TSFieldMapEntry *field_map_entries;
+  const TSSymbolMetadata *symbol_metadata;
+  const TSSymbol *public_symbol_map;
+  const uint16_t *alias_map;
+  const TSSymbol *alias_sequences;
+  const TSLexMode *lex_modes;
+  bool (*lex_fn)(TSLexer *, TSStateId);
+  bool (*keyword_lex_fn)(TSLexer *, TSStateId);
+  TSSymbol keyword_capture_token;
+  struct {
+    const bool *states;
+    const TSSymbol *symbol_map;
+    void *(*create)(void);
+    void (*destroy)(void *);
+    bool (*scan)(void *, TSLexer *, const bool *symbol_whitelist);
+    unsigned (*serialize)(void *, char *);
+    void (*deserialize)(void *, const char *, unsigned);
+  } external_scanner;
+  const TSStateId *primary_state_ids;
+} TSLanguage;
+
+#define SHIFT(s) {.action = {.shift = {.type = TSParseActionTypeShift, .state = (s)}}}
+#define SHIFT_EXTRA() {.action = {.shift = {.type = TSParseActionTypeShift, .extra = true}}}
+#define SHIFT_REPEAT(s) {.action = {.shift = {.type = TSParseActionTypeShift, .state = (s), .repetition = true}}}
+#define REDUCE(sym, n) {.action = {.reduce = {.type = TSParseActionTypeReduce, .symbol = (sym), .child_count = (n)}}}
+#define ACCEPT_INPUT() {.action = {.type = TSParseActionTypeAccept}}
+#define RECOVER() {.action = {.type = TSParseActionTypeRecover}}
+#define ENTRY(n, r) {.entry = {.count = (n), .reusable = (r)}}
+"""
+
+# token başında: atlanabilir ignore terminallerini geç; sonra moddaki tüm DFA'ları
+# karakter karakter birlikte ilerlet. Her konumda kabul eden ilk (sırası en önde)
+# terminal en iyi aday olur; sıra olarak ondan sonra gelenler bırakılır. Bu, lark'ın
+# "sıradaki ilk eşleşen terminal, kendi (açgözlü) uzunluğuyla" kuralının aynısıdır.
+_LEXER = r"""
+static inline int dfa_step(int s, int32_t c) {
+  if (c < 0) return -1;
+  if (c < 128) return (int)dfa_ascii[s][c] - 1;
+  for (uint32_t i = dfa_roff[s]; i < dfa_roff[s + 1]; i++) {
+    if (c >= dfa_ranges[i].lo && c <= dfa_ranges[i].hi) return (int)dfa_ranges[i].to - 1;
+  }
+  return -1;
+}
+
+static bool is_word(int32_t c) {
+  if (c < 0) return false;
+  if (c < 128) return word_ascii[c];
+  uint32_t lo = 0, hi = WORD_RANGE_COUNT;
+  while (lo < hi) {
+    uint32_t mid = (lo + hi) / 2;
+    if (c < word_ranges[mid][0]) hi = mid;
+    else if (c > word_ranges[mid][1]) lo = mid + 1;
+    else return true;
+  }
+  return false;
+}
+
+static bool term_ok(int t, int s, int32_t c, const int32_t *buf, int len) {
+  uint8_t f = term_flags[t];
+  if (!f) return true;
+  bool word_next = is_word(c);
+  if ((f & F_WORD_END) && word_next) return false;
+  if ((f & F_MAXIMAL) && dfa_step(s, c) >= 0) return false;
+  if ((f & F_EXCLUDE) && !word_next && len <= WORD_MAX) {
+    for (uint32_t w = excl_off[t]; w < excl_off[t + 1]; w++) {
+      const char *word = excl_words[w];
+      int i = 0;
+      while (i < len && word[i] && (int32_t)(unsigned char)word[i] == buf[i]) i++;
+      if (i == len && !word[i]) return false;
+    }
+  }
+  return true;
+}
+
+static bool ts_lex(TSLexer *lexer, TSStateId mode) {
+  const uint8_t *terms = mode_terms + mode_off[mode];
+  int n = mode_off[mode + 1] - mode_off[mode];
+  int cur[TERM_COUNT];
+  int32_t buf[WORD_MAX];
+  int len, lim, best, i;
+restart:
+  for (i = 0; i < n; i++) cur[i] = term_start[terms[i]];
+  len = 0;
+  lim = n;
+  best = -1;
+  for (;;) {
+    bool eof = lexer->eof(lexer);
+    int32_t c = eof ? -1 : lexer->lookahead;
+    if (len > 0) {
+      for (i = 0; i < lim; i++) {
+        int s = cur[i];
+        if (s >= 0 && dfa_accept[s] && term_ok(terms[i], s, c, buf, len)) {
+          best = i;
+          lim = i + 1;
+          lexer->result_symbol = term_symbol[terms[i]];
+          lexer->mark_end(lexer);
+          break;
+        }
+      }
+    } else if (eof) {
+      lexer->result_symbol = 0;
+      lexer->mark_end(lexer);
+      return true;
+    } else {
+      for (i = 0; i < n; i++) {
+        int t = terms[i];
+        int s = term_start[t];
+        if ((term_flags[t] & F_SKIP) && (s = dfa_step(s, c)) >= 0) {
+          do lexer->advance(lexer, true);
+          while (!lexer->eof(lexer) && (s = dfa_step(s, lexer->lookahead)) >= 0);
+          goto restart;
+        }
+      }
+    }
+    if (c < 0) break;
+    bool live = false;
+    for (i = 0; i < lim; i++) {
+      if (cur[i] >= 0) {
+        cur[i] = dfa_step(cur[i], c);
+        if (cur[i] >= 0) live = true;
+      }
+    }
+    if (!live) break;
+    if (len < WORD_MAX) buf[len] = c;
+    len++;
+    lexer->advance(lexer, false);
+  }
+  return best >= 0;
+}
+"""
+
+
+def _c_str(s: str) -> str:
+    out = []
+    for ch in s.encode("utf-8"):
+        if ch in (0x22, 0x5C):
+            out.append("\\" + chr(ch))
+        elif 0x20 <= ch < 0x7F:
+            out.append(chr(ch))
+        else:
+            out.append(f"\\{ch:03o}")
+    return '"' + "".join(out) + '"'
+
+
+def _rows(name: str, ctype: str, dims: str, rows: Sequence[Dict[int, int]]) -> str:
+    # seyrek satırlar: designated initializer, kalan hücreler 0
+    lines = [f"static const {ctype} {name}{dims} = {{"]
+    for i, row in enumerate(rows):
+        if row:
+            cells = ", ".join(f"[{k}] = {v}" for k, v in sorted(row.items()))
+            lines.append(f"  [{i}] = {{{cells}}},")
+    lines.append("};")
+    return "\n".join(lines)
+
+
+def _array(name: str, ctype: str, values: Sequence[Any], per_line: int = 16) -> str:
+    vals = [str(v) for v in values] or ["0"]
+    body = ",\n  ".join(", ".join(vals[i:i + per_line]) for i in range(0, len(vals), per_line))
+    return f"static const {ctype} {name}[] = {{\n  {body},\n}};"
+
+
+def generate_parser_c() -> str:
+    """grammar_v3.lark için tree-sitter ABI 14 parser.c kaynağı."""
+    lay = _layout()
+    L = lay.lark
+    table = L.parser.parser._parse_table
+    lexers = L.parser.lexer.lexers
+    term_index = {t.name: i for i, t in enumerate(lay.terminals)}
+    sym_of_term = {t.name: lay.term_symbol[i] for i, t in enumerate(lay.terminals)}
+    # extra terminaller (terminal sırası, sembol)
+    extras = [(i, sym) for i, sym in enumerate(lay.term_symbol) if sym and lay.token_kind[sym] is _EXTRA]
+
+    # --- parse tablosu ---
+    start = table.start_states["start"]
+    end = table.end_states["start"]
+    order = [start] + sorted(s for s in table.states if s != start)
+    ts_state = {s: i + 1 for i, s in enumerate(order)}
+    state_count = len(order) + 1
+    rule_sym = {r: lay.token_count + i for i, r in enumerate(lay.rules)}
+    by_origin: Dict[str, List[int]] = {}
+    for r in lay.rules:
+        by_origin.setdefault(r.origin.name, []).append(rule_sym[r])
+
+    # --- lex modları: lark'ın durum başına terminal listeleri ---
+    modes: List[Tuple[int, ...]] = [tuple(range(len(lay.terminals)))]
+    mode_index = {modes[0]: 0}
+    lex_modes = [0] * state_count
+    for s in order:
+        terms = tuple(sorted(term_index[t.name] for t in lexers[s].terminals))
+        m = mode_index.get(terms)
+        if m is None:
+            m = mode_index[terms] = len(modes)
+            modes.append(terms)
+        lex_modes[ts_state[s]] = m
+
+    # tree-sitter başka lex modunda okunmuş bir token'ı yalnızca tablo girdisi
+    # "reusable" ise yeniden kullanır. t'nin sonucunu moda göre değiştirebilecek
+    # tek şey, t'den önce sıralanan, t ile aynı karakterle başlayabilen ve t'yi
+    # içeren bazı modlarda bulunmayan bir terminaldir (sonra gelenler t kabul
+    # ettiği anda elenir).
+    unstable: List[Set[int]] = []
+    for t, dfa in enumerate(lay.dfas):
+        with_t = [set(m) for m in modes if t in m]
+        unstable.append({
+            u for u in range(t)
+            if not all(u in m for m in with_t)
+            and any(lo <= b and a <= hi for lo, hi in lay.dfas[u].first for a, b in dfa.first)
+        })
+
+    actions: List[str] = ["ENTRY(0, false)"]
+    entry_index: Dict[Tuple[Any, ...], int] = {}
+
+    def entry(*acts: str, reusable: bool = False) -> int:
+        key = (reusable,) + acts
+        i = entry_index.get(key)
+        if i is None:
+            i = entry_index[key] = len(actions)
+            actions.append(f"ENTRY({len(acts)}, {'true' if reusable else 'false'})")
+            actions.extend(acts)
+        return i
+
+    rows: List[Dict[int, int]] = [dict() for _ in range(state_count)]
+    recover = entry("RECOVER()")
+    for sym in range(lay.token_count):
+        rows[0][sym] = recover
+    for s in order:
+        row = rows[ts_state[s]]
+        mode = set(modes[lex_modes[ts_state[s]]])
+        for name, (act, arg) in table.states[s].items():
+            reusable = name in term_index and not unstable[term_index[name]] & mode
+            if act is Shift:
+                if name in sym_of_term:
+                    row[sym_of_term[name]] = entry(f"SHIFT({ts_state[arg]})", reusable=reusable)
+                else:
+                    # nonterminal goto: o isimli tüm kural sembolleri aynı duruma gider
+                    for rs in by_origin[name]:
+                        row[rs] = ts_state[arg]
+            else:
+                sym = 0 if name == "$END" else sym_of_term[name]
+                n = len(arg.expansion)
+                if n:
+                    row[sym] = entry(f"REDUCE({rule_sym[arg]}, {n})", reusable=reusable)
+                else:
+                    # boş reduce: ikinci (yok sayılan) aksiyon düğümü "fragile" yapar;
+                    # sıfır genişlikli düğümler artımlı parse'ta yeniden kullanılmaz
+                    row[sym] = entry(f"REDUCE({rule_sym[arg]}, 0)", "SHIFT_REPEAT(0)", reusable=reusable)
+        for i, sym in extras:
+            row[sym] = entry("SHIFT_EXTRA()", reusable=not unstable[i] & mode)
+    rows[ts_state[end]][0] = entry("ACCEPT_INPUT()")
+
+    mode_off = [0]
+    mode_terms: List[int] = []
+    for terms in modes:
+        mode_terms.extend(terms)
+        mode_off.append(len(mode_terms))
+
+    # --- DFA'lar ---
+    term_start: List[int] = []
+    dfa_ascii: List[Dict[int, int]] = []
+    dfa_ranges: List[str] = []
+    dfa_roff = [0]
+    dfa_accept: List[int] = []
+    for d in lay.dfas:
+        base = len(dfa_accept)
+        term_start.append(base)
+        for out, acc in zip(d.trans, d.accept):
+            row_ascii: Dict[int, int] = {}
+            for lo, hi, t in out:
+                for c in range(lo, min(hi, 127) + 1):
+                    row_ascii[c] = base + t + 1
+                if hi >= 128:
+                    dfa_ranges.append(f"{{{max(lo, 128)}, {hi}, {base + t + 1}}}")
+            dfa_ascii.append(row_ascii)
+            dfa_roff.append(len(dfa_ranges))
+            dfa_accept.append(int(acc))
+    excl_off = [0]
+    excl_words: List[str] = []
+    for d in lay.dfas:
+        excl_words.extend(_c_str(w) for w in d.exclude)
+        excl_off.append(len(excl_words))
+
+    words = _word_ranges()
+    word_ascii = [0] * 128
+    for lo, hi in words:
+        for c in range(lo, min(hi, 127) + 1):
+            word_ascii[c] = 1
+    word_hi = [f"{{{max(lo, 128)}, {hi}}}" for lo, hi in words if hi >= 128]
+
+    sc = lay.symbol_count
+    first_of: Dict[str, int] = {}
+    public = [first_of.setdefault(name, i) if i else 0 for i, name in enumerate(lay.symbol_names)]
+    meta = [
+        f"{{{str(v).lower()}, {str(n).lower()}, false}}"
+        for v, n in zip(lay.visible, lay.named)
+    ]
+
+    parts = [
+        f"/* grammar_v3.lark'tan task1/treesitter.py ile üretildi; elle düzenlemeyin. */",
+        _HEADER,
+        f"#define STATE_COUNT {state_count}",
+        f"#define SYMBOL_COUNT {sc}",
+        f"#define TOKEN_COUNT {lay.token_count}",
+        f"#define TERM_COUNT {len(lay.terminals)}",
+        f"#define WORD_MAX {_WORD_MAX}",
+        f"#define WORD_RANGE_COUNT {len(word_hi)}",
+        f"#define F_SKIP {F_SKIP}",
+        f"#define F_WORD_END {F_WORD_END}",
+        f"#define F_MAXIMAL {F_MAXIMAL}",
+        f"#define F_EXCLUDE {F_EXCLUDE}",
+        "",
+        _array("symbol_names", "char * const", [_c_str(n) for n in lay.symbol_names], 8),
+        _array("symbol_metadata", "TSSymbolMetadata", meta, 8),
+        _array("public_symbol_map", "TSSymbol", public),
+        _array("parse_actions", "TSParseActionEntry", actions, 4),
+        _rows("parse_table", "uint16_t", "[STATE_COUNT][SYMBOL_COUNT]", rows),
+        _array("lex_modes", "TSLexMode", [f"{{{m}, 0}}" for m in lex_modes], 8),
+        _array("primary_state_ids", "TSStateId", range(state_count)),
+        "static const char * const field_names[] = {NULL};",
+        "static const uint16_t alias_map[] = {0};",
+        "static const TSSymbol alias_sequences[1] = {0};",
+        "",
+        _array("mode_off", "uint16_t", mode_off),
+        _array("mode_terms", "uint8_t", mode_terms),
+        _array("term_start", "int16_t", term_start),
+        _array("term_flags", "uint8_t", [d.flags for d in lay.dfas]),
+        _array("term_symbol", "TSSymbol", lay.term_symbol),
+        _array("excl_off", "uint16_t", excl_off),
+        _array("excl_words", "char * const", excl_words or ["NULL"], 8),
+        _rows("dfa_ascii", "uint8_t" if len(dfa_accept) < 255 else "uint16_t",
+              f"[{len(dfa_accept)}][128]", dfa_ascii),
+        "static const struct { int32_t lo, hi; uint16_t to; } dfa_ranges[] = {\n  "
+        + ",\n  ".join(dfa_ranges or ["{0, -1, 0}"]) + ",\n};",
+        _array("dfa_roff", "uint32_t", dfa_roff),
+        _array("dfa_accept", "bool", dfa_accept, 32),
+        _array("word_ascii", "bool", word_ascii, 32),
+        "static const int32_t word_ranges[][2] = {\n  " + ",\n  ".join(word_hi) + ",\n};",
+        _LEXER,
+        f"""static const TSLanguage language = {{
+  .version = {ABI_VERSION},
+  .symbol_count = SYMBOL_COUNT,
+  .alias_count = 0,
+  .token_count = TOKEN_COUNT,
+  .external_token_count = 0,
+  .state_count = STATE_COUNT,
+  .large_state_count = STATE_COUNT,
+  .production_id_count = 1,
+  .field_count = 0,
+  .max_alias_sequence_length = 0,
+  .parse_table = &parse_table[0][0],
+  .parse_actions = parse_actions,
+  .symbol_names = symbol_names,
+  .field_names = field_names,
+  .symbol_metadata = symbol_metadata,
+  .public_symbol_map = public_symbol_map,
+  .alias_map = alias_map,
+  .alias_sequences = alias_sequences,
+  .lex_modes = lex_modes,
+  .lex_fn = ts_lex,
+  .primary_state_ids = primary_state_ids,
+}};
+
+const TSLanguage *{_ENTRY}(void) {{ return &language; }}
+""",
+    ]
+    return "\n".join(parts)
+
+
+# --------- derleme / yükleme ---------
+def _so_name() -> str:
+    grammar = GRAMMAR_PATH.read_text(encoding="utf-8")
+    key = _digest(
+        grammar, lark.__version__, repr(sys.version_info[:2]),
+        Path(__file__).read_text(encoding="utf-8"), str(ABI_VERSION),
+    )
+    return f"{_SO_PREFIX}{key}.so"
+
+
+def _compile(out: Path) -> None:
+    src = out.with_suffix(".c")
+    src.write_text(generate_parser_c(), encoding="utf-8")
+    cc = os.environ.get("CC", "cc")
+    try:
+        subprocess.run(
+            [cc, "-O2", "-shared", "-fPIC", "-o", str(out), str(src)],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(f"tree-sitter backend needs a C compiler ({cc!r} not found; set CC)") from None
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"compiling the tree-sitter parser failed:\n{e.stderr}") from None
+    finally:
+        try:
+            src.unlink()
+        except OSError:
+            pass
+
+
+def build_library() -> Path:
+    """Derlenmiş parser'ın yolu; cache'te yoksa üretilip derlenir."""
+    d = parser_cache_dir()
+    if d is None:
+        d = Path(tempfile.mkdtemp(prefix="v3ts-"))
+    so = d / _so_name()
+    if so.exists():
+        return so
+    d.mkdir(parents=True, exist_ok=True)
+    # geçici dosyaya derle, sonra atomik rename: paralel süreçler yarım dosya görmez
+    tmp = so.with_name(f"{so.stem}.{os.getpid()}.tmp.so")
+    _compile(tmp)
+    os.replace(tmp, so)
+    for old in d.glob(f"{_SO_PREFIX}*.so"):
+        if old != so and ".tmp" not in old.name:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return so
+
+
+_LIB: Optional[ctypes.CDLL] = None
+
+
+@lru_cache(maxsize=None)
+def language() -> tree_sitter.Language:
+    global _LIB
+    lay = _layout()
+    lib = ctypes.CDLL(str(build_library()))
+    fn = getattr(lib, _ENTRY)
+    fn.restype = ctypes.c_void_p
+    new_capsule = ctypes.pythonapi.PyCapsule_New
+    new_capsule.restype = ctypes.py_object
+    new_capsule.argtypes = (ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p)
+    lang = tree_sitter.Language(new_capsule(fn(), b"tree_sitter.Language", None))
+    # .so ile bu süreçteki lark tablolarının sembol düzeni aynı olmalı
+    if lang.node_kind_count != lay.symbol_count or any(
+        lang.node_kind_for_id(i) != name for i, name in enumerate(lay.symbol_names)
+    ):
+        raise RuntimeError("tree-sitter parser library does not match grammar_v3.lark")
+    _LIB = lib  # Language yalnızca pointer tutar; kütüphane süreç boyunca yüklü kalmalı
+    return lang
+
+
+# --------- CST -> AST ---------
+def _point(text: str, pos: int) -> Tuple[int, int]:
+    # tree-sitter noktası: (satır, satır başından byte sütunu)
+    ls = text.rfind("\n", 0, pos) + 1
+    col = pos - ls if text.isascii() else len(text[ls:pos].encode("utf-8"))
+    return text.count("\n", 0, pos), col
+
+
+def _char_offsets(funcs: List[Tuple[int, int, int, FuncDef]], src: bytes) -> List[Tuple[int, int, int, FuncDef]]:
+    # sıralı byte aralıkları -> karakter aralıkları, kaynak üzerinden tek geçiş
+    out = []
+    pb = pc = 0
+    for a, b, row, f in funcs:
+        pc += len(src[pb:a].decode("utf-8"))
+        start = pc
+        pc += len(src[a:b].decode("utf-8"))
+        pb = b
+        out.append((start, pc, row, f))
+    return out
+
+
+class TreeSitterParser:
+    """
+    Tek kaynak üzerinde (artımlı) tree-sitter parse'ı. edit() düzenlemeyi eski
+    ağaca tree.edit() ile bildirir; tree-sitter değişmeyen alt ağaçları yeniden
+    kullanır. AST tarafında da yeniden kullanılan func_def düğümlerinin FuncDef'leri
+    düğüm id'siyle önbellekten alınır, sadece yeni func_def'ler dönüştürülür.
+    Omurganın (source listesi) altındaki ayraç düğümleri de aynı şekilde
+    önbelleklenir; yeniden kullanılan sol omurga düğümüne ise hiç inilmez: o
+    öneğin elemanları önceki parse'ın listesinden dilimlenir.
+
+    funcs     : son başarılı parse'ın (başlangıç, bitiş, satır, FuncDef) listesi;
+                offset'ler karakter, satır 0 tabanlı
+    converted : son parse'ta yeniden dönüştürülen fonksiyon sayısı
+    """
+
+    def __init__(self) -> None:
+        self._layout = _layout()
+        self._parser = tree_sitter.Parser(language())
+        self._text: Optional[str] = None
+        self._src = b""
+        self._tree: Optional[tree_sitter.Tree] = None
+        # anahtar (ilk çocuğun düğüm id'si) -> (değer, başlangıç, bitiş byte'ı);
+        # değer FuncDef veya ayraç. tree.edit() düzenlenen yoldaki düğümleri
+        # kopyalayıp eskilerini bırakabildiği için id'ler tekrar kullanılabilir:
+        # isabet ancak _cache_src'deki metin aynıysa geçerlidir
+        self._cache: Dict[int, Tuple[Any, int, int]] = {}
+        self._cache_ids: List[int] = []  # _cache anahtarları, kaynak sırasıyla
+        self._cache_src = b""
+        self._cache_tree: Optional[tree_sitter.Tree] = None
+        # source omurgası, reduce sırasıyla: (anahtar, başlangıç, bitiş, Tree.data,
+        # eleman sayısı, fonksiyon sayısı, önbellek anahtarı sayısı)
+        self._spines: List[Tuple[int, int, int, str, int, int, int]] = []
+        self._items: List[Any] = []
+        self._bfuncs: List[Tuple[int, int, int, FuncDef]] = []  # byte offset'li funcs
+        self.funcs: List[Tuple[int, int, int, FuncDef]] = []
+        self.converted = 0
+
+    @property
+    def tree(self) -> Optional[tree_sitter.Tree]:
+        return self._tree
+
+    def parse(self, text: str) -> ParseResult:
+        self._tree = None
+        return self._run(text, None, None)
+
+    def edit(self, start: int, old_end: int, new_text: str) -> ParseResult:
+        """text[start:old_end] yerine new_text koyar ve eski ağaçtan artımlı parse eder."""
+        old = self._text
+        if old is None:
+            raise RuntimeError("edit() called before parse()")
+        if not (0 <= start <= old_end <= len(old)):
+            raise ValueError(f"bad edit range: {start}..{old_end} (len={len(old)})")
+        text = old[:start] + new_text + old[old_end:]
+        tree = self._tree
+        if tree is None:
+            return self._run(text, None, None)
+        try:
+            piece = new_text.encode("utf-8")
+        except UnicodeEncodeError:
+            return self._run(text, None, None)
+        if old.isascii():
+            sb, ob = start, old_end
+        else:
+            sb = len(old[:start].encode("utf-8"))
+            ob = sb + len(old[start:old_end].encode("utf-8"))
+        tree.edit(
+            start_byte=sb,
+            old_end_byte=ob,
+            new_end_byte=sb + len(piece),
+            start_point=_point(old, start),
+            old_end_point=_point(old, old_end),
+            new_end_point=_point(text, start + len(new_text)),
+        )
+        return self._run(text, self._src[:sb] + piece + self._src[ob:], tree)
+
+    def _run(self, text: str, src: Optional[bytes], old_tree: Optional[tree_sitter.Tree]) -> ParseResult:
+        self._text = text
+        if src is None:
+            try:
+                src = text.encode("utf-8")
+            except UnicodeEncodeError:
+                # tek başına surrogate vb.: tree-sitter'a verilemez
+                self._src, self._tree = b"", None
+                self.funcs, self.converted = [], 0
+                return parse_text(text, inline=True)
+        self._src = src
+        tree = self._parser.parse(src, old_tree) if old_tree is not None else self._parser.parse(src)
+        self._tree = tree
+        if tree.root_node.has_error:
+            # hata mesajı/konumu lark'la aynı olsun; FuncDef önbelleği (ve ağacı) korunur
+            self.funcs, self.converted = [], 0
+            return parse_text(text, inline=True)
+        program = self._convert(tree, text, src)
+        return ParseResult(program=program, errors=[])
+
+    def _convert(self, tree: tree_sitter.Tree, text: str, src: bytes) -> Program:
+        lay = self._layout
+        ntok = lay.token_count
+        kinds = lay.token_kind
+        callbacks = lay.callbacks
+        func_symbols = lay.func_symbols
+        spine_symbols = lay.spine_symbols
+        ascii_text = text.isascii()
+        old = self._cache
+        old_src = self._cache_src
+        old_spine = {sp[0]: i for i, sp in enumerate(self._spines)}
+        cache: Dict[int, Tuple[Any, int, int]] = {}
+        cache_ids: List[int] = []
+        spines: List[Tuple[int, int, int, str, int, int, int]] = []
+        items: List[Any] = []
+        # satır start_point[0] ile okunur: py-tree-sitter 0.26'da Point.row ödünç
+        # referans döndürüyor, 256'dan büyük satır numaralarında int serbest kalıyor
+        funcs: List[Tuple[int, int, int, FuncDef]] = []
+        converted = 0
+
+        values: List[Any] = []
+        # açık kural düğümleri: (values tabanı, sembol, düğüm, önbellek anahtarı)
+        stack: List[Tuple[int, int, tree_sitter.Node, Optional[int]]] = []
+        cur = tree.walk()
+        while True:
+            node = cur.node
+            sym = node.grammar_id
+            if sym < ntok:
+                kind = kinds[sym]
+                if kind is None:
+                    values.append(None)
+                elif kind is not _EXTRA:
+                    a, b = node.byte_range
+                    values.append(Token(kind, text[a:b] if ascii_text else src[a:b].decode("utf-8")))
+            elif cur.goto_first_child():
+                # önbellek anahtarı ilk çocuğun id'si: Node.id ebeveynin çocuk dizisindeki
+                # yuvayı gösterir, yeni bir ebeveyn altında yeniden kullanılan alt ağacın
+                # kendi id'si değişir ama kendi çocuk dizisi (ilk çocuğun id'si) aynı kalır.
+                # Omurga altındaki ayraçlar ilk çocuk değilse önbelleklenir (ChildFilter
+                # sadece ilk genişletilen çocuğun listesini yerinde uzatır)
+                key = None
+                if sym in func_symbols or sym in spine_symbols or (
+                    stack and stack[-1][1] in spine_symbols and len(values) > stack[-1][0]
+                ):
+                    key = cur.node.id
+                    a, b = node.byte_range
+                    if sym in spine_symbols:
+                        j = old_spine.get(key, -1)
+                        hit = j >= 0 and old_src[self._spines[j][1]:self._spines[j][2]] == src[a:b]
+                    else:
+                        e = old.get(key)
+                        hit = e is not None and old_src[e[1]:e[2]] == src[a:b]
+                if key is None or not hit:
+                    stack.append((len(values), sym, node, key))
+                    continue
+                cur.goto_parent()
+                if sym in spine_symbols:
+                    # omurga öneği aynen duruyor (önündeki düzenlemeyle kaymış olabilir)
+                    _, a0, _, data, n, k, m = self._spines[j]
+                    db = a - a0
+                    prev = self._bfuncs[:k]
+                    prev_ids = self._cache_ids[:m]
+                    cache_ids.extend(prev_ids)
+                    if db:
+                        spines.extend((i, x + db, y + db, d, n_, k_, m_)
+                                      for i, x, y, d, n_, k_, m_ in self._spines[:j + 1])
+                        for i in prev_ids:
+                            v, x, y = old[i]
+                            cache[i] = (v, x + db, y + db)
+                    else:
+                        spines.extend(self._spines[:j + 1])
+                        cache.update((i, old[i]) for i in prev_ids)
+                    dr = node.start_point[0] - prev[0][2] if prev else 0
+                    if db or dr:
+                        funcs.extend((x + db, y + db, r + dr, f) for x, y, r, f in prev)
+                    else:
+                        funcs.extend(prev)
+                    # ChildFilter sol özyinelemede çocuk listesini yerinde uzatır: yeni liste ver
+                    items = self._items[:n]
+                    values.append(lark.Tree(data, items))
+                else:
+                    value = e[0]
+                    cache[key] = (value, a, b)
+                    cache_ids.append(key)
+                    if sym in func_symbols:
+                        funcs.append((a, b, node.start_point[0], value))
+                    values.append(value)
+            else:
+                values.append(callbacks[sym]([]))
+
+            # sonraki kardeşe geç; yoksa ebeveyne çıkıp onu reduce et
+            while stack and not cur.goto_next_sibling():
+                cur.goto_parent()
+                base, psym, pnode, key = stack.pop()
+                children = values[base:]
+                del values[base:]
+                value = callbacks[psym](children)
+                if key is None:
+                    pass
+                elif psym in spine_symbols:
+                    items = value.children
+                    spines.append((key, pnode.start_byte, pnode.end_byte, value.data,
+                                   len(items), len(funcs), len(cache_ids)))
+                else:
+                    a, b = pnode.byte_range
+                    cache[key] = (value, a, b)
+                    cache_ids.append(key)
+                    if psym in func_symbols:
+                        funcs.append((a, b, pnode.start_point[0], value))
+                        converted += 1
+                values.append(value)
+            if not stack:
+                break
+
+        self._cache = cache
+        self._cache_src = src
+        self._cache_tree = tree
+        self._spines = spines
+        self._items = list(items)
+        self._cache_ids = cache_ids
+        self._bfuncs = funcs
+        self.funcs = funcs if ascii_text else _char_offsets(funcs, src)
+        self.converted = converted
+        return values[-1]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from dataclasses import fields, is_dataclass, replace
+from typing import (
+    Any, Callable, Dict, Iterator, List, Optional, Tuple, Union,
+    get_args, get_origin, get_type_hints,
+)
+
+from .ast import Expr, Stmt
+
+# Sınıf başına çocuk alan planı: (alan adı, liste mi) — yalnızca düğüm taşıyabilen alanlar.
+# dataclasses.fields() yansıması düğüm başına değil, sınıf başına bir kez yapılır.
+ChildPlan = Tuple[Tuple[str, bool], ...]
+_PLANS: Dict[type, ChildPlan] = {}
+
+
+def _is_node_type(t: Any) -> bool:
+    return isinstance(t, type) and (is_dataclass(t) or issubclass(t, (Stmt, Expr)))
+
+
+def _unwrap_optional(t: Any) -> Any:
+    if get_origin(t) is Union:
+        args = [a for a in get_args(t) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return t
+
+
+def _build_plan(cls: type) -> ChildPlan:
+    if not is_dataclass(cls):
+        return ()
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = {}
+
+    plan: List[Tuple[str, bool]] = []
+    for f in fields(cls):
+        t = _unwrap_optional(hints.get(f.name, Any))
+        if get_origin(t) in (list, List):
+            args = get_args(t)
+            if args and _is_node_type(_unwrap_optional(args[0])):
+                plan.append((f.name, True))
+        elif _is_node_type(t):
+            plan.append((f.name, False))
+    return tuple(plan)
+
+
+def child_plan(cls: type) -> ChildPlan:
+    plan = _PLANS.get(cls)
+    if plan is None:
+        plan = _PLANS[cls] = _build_plan(cls)
+    return plan
+
+
+def iter_fields(node: Any) -> Iterator[Tuple[str, Optional[int], Any]]:
+    """Düğümün çocuklarını (alan adı, liste indeksi ya da None, çocuk) olarak verir."""
+    for name, is_list in child_plan(type(node)):
+        val = getattr(node, name)
+        if val is None:
+            continue
+        if is_list:
+            for i, item in enumerate(val):
+                yield name, i, item
+        else:
+            yield name, None, val
+
+
+def iter_child_nodes(node: Any) -> Iterator[Any]:
+    for _, _, child in iter_fields(node):
+        yield child
+
+
+def iter_tree(root: Any) -> Iterator[Tuple[Any, Any, Optional[str], Optional[int]]]:
+    """
+    Açık yığınla (özyinelemesiz) pre-order gezinme. Her adım
+    (düğüm, ebeveyn, alan adı, liste indeksi) verir; kökte ebeveyn None'dur.
+    Sıra, özyinelemeli DFS ile birebir aynıdır.
+    """
+    if root is None:
+        return
+    stack: List[Tuple[Any, Any, Optional[str], Optional[int]]] = [(root, None, None, None)]
+    pop = stack.pop
+    push = stack.append
+    plans = _PLANS
+    while stack:
+        step = pop()
+        yield step
+        node = step[0]
+        plan = plans.get(type(node))
+        if plan is None:
+            plan = child_plan(type(node))
+        # çocuklar ters sırada yığına (ilk çocuk ilk çıksın)
+        for name, is_list in reversed(plan):
+            val = getattr(node, name)
+            if val is None:
+                continue
+            if is_list:
+                for i in range(len(val) - 1, -1, -1):
+                    push((val[i], node, name, i))
+            else:
+                push((val, node, name, None))
+
+
+def walk(root: Any) -> Iterator[Any]:
+    """iter_tree'nin sadece düğümleri veren hali."""
+    for step in iter_tree(root):
+        yield step[0]
+
+
+class Visitor:
+    """
+    Tip anahtarlı dispatch: visit(node, *args) -> visit_<SınıfAdı>(node, *args).
+    Metot bulunamazsa MRO'daki üst sınıflar denenir (visit_Stmt, visit_Expr),
+    o da yoksa generic_visit çağrılır. Çözümleme her (visitor sınıfı, düğüm tipi)
+    için bir kez yapılır ve önbelleğe alınır.
+    """
+
+    _dispatch: Dict[type, Callable[..., Any]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
+    @classmethod
+    def _resolve(cls, t: type) -> Callable[..., Any]:
+        fn = None
+        for k in t.__mro__:
+            fn = getattr(cls, "visit_" + k.__name__, None)
+            if fn is not None:
+                break
+        if fn is None:
+            fn = cls.generic_visit
+        cls._dispatch[t] = fn
+        return fn
+
+    def visit(self, node: Any, *args: Any) -> Any:
+        t = type(node)
+        fn = self._dispatch.get(t)
+        if fn is None:
+            fn = self._resolve(t)
+        return fn(self, node, *args)
+
+    def generic_visit(self, node: Any, *args: Any) -> Any:
+        visit = self.visit
+        plan = _PLANS.get(type(node))
+        if plan is None:
+            plan = child_plan(type(node))
+        for name, is_list in plan:
+            val = getattr(node, name)
+            if val is None:
+                continue
+            if is_list:
+                for item in val:
+                    visit(item, *args)
+            else:
+                visit(val, *args)
+        return None
+
+
+class Transformer(Visitor):
+    """
+    visit_* metotları düğümün yerine geçecek değeri döndürür. generic_visit
+    çocukları dönüştürür; değişen alan varsa dataclasses.replace ile yeni düğüm
+    kurulur (frozen düğümlerle de çalışır). Listede None dönen eleman silinir.
+    """
+
+    def generic_visit(self, node: Any, *args: Any) -> Any:
+        changes: Dict[str, Any] = {}
+        for name, is_list in child_plan(type(node)):
+            old = getattr(node, name)
+            if old is None:
+                continue
+            if is_list:
+                new_list = []
+                dirty = False
+                for item in old:
+                    new = self.visit(item, *args)
+                    dirty = dirty or new is not item
+                    if new is not None:
+                        new_list.append(new)
+                if dirty:
+                    changes[name] = new_list
+            else:
+                new = self.visit(old, *args)
+                if new is not old:
+                    changes[name] = new
+        return replace(node, **changes) if changes else node
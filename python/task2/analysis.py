@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Sequence
+
+from .csr import CSRCFG, build_csr
+from .dataflow import (
+    AvailableExprs, Effect, Liveness, ReachingDefs, available_expressions, block_effects, liveness,
+    priority_order, reaching_definitions,
+)
+from .graph import csr_dfs
+
+if TYPE_CHECKING:
+    from .cfg import CFG
+
+# Tüm düğümler CSR indeksleridir (CFGBuilder CFG'lerinde blok id'si ile aynı).
+
+
+def immediate_dominators(
+    n: int, root: int,
+    succ_off: Sequence[int], succ_dst: Sequence[int],
+    pred_off: Sequence[int], pred_src: Sequence[int],
+) -> List[int]:
+    """
+    Lengauer-Tarjan (yol sıkıştırmalı sürüm, O(E log V)), özyinelemesiz.
+    idom[v]: v'nin anlık dominatörü; kök ve kökten erişilemeyenler için -1.
+    Ters grafikle (succ <-> pred) çağrılınca post-dominatörleri verir.
+    """
+    idom = [-1] * n
+    if not 0 <= root < n:
+        return idom
+    vertex, dfn, parent = csr_dfs(root, succ_off, succ_dst, n)
+
+    semi = dfn[:]               # dfn numarası olarak
+    label = list(range(n))
+    ancestor = [-1] * n
+    bucket: List[List[int]] = [[] for _ in range(n)]
+
+    def evaluate(v: int) -> int:
+        if ancestor[v] < 0:
+            return v
+        path = []
+        x = v
+        while ancestor[ancestor[x]] >= 0:
+            path.append(x)
+            x = ancestor[x]
+        for x in reversed(path):
+            a = ancestor[x]
+            if semi[label[a]] < semi[label[x]]:
+                label[x] = label[a]
+            ancestor[x] = ancestor[a]
+        return label[v]
+
+    for k in range(len(vertex) - 1, 0, -1):
+        w = vertex[k]
+        s = semi[w]
+        for j in range(pred_off[w], pred_off[w + 1]):
+            v = pred_src[j]
+            if dfn[v] < 0:
+                continue            # kökten erişilemeyen öncel
+            sv = semi[evaluate(v)]
+            if sv < s:
+                s = sv
+        semi[w] = s
+        bucket[vertex[s]].append(w)
+        p = parent[w]
+        ancestor[w] = p
+        for v in bucket[p]:
+            u = evaluate(v)
+            idom[v] = u if semi[u] < semi[v] else p
+        bucket[p] = []
+
+    for k in range(1, len(vertex)):
+        w = vertex[k]
+        if idom[w] != vertex[semi[w]]:
+            idom[w] = idom[idom[w]]
+    return idom
+
+
+@dataclass
+class DomTree:
+    """
+    (Post-)dominatör ağacı. pre/post: ağaçta giriş/çıkış sıraları; dominates()
+    bunlarla O(1). Kökten erişilemeyen düğümlerde pre = -1.
+    """
+    root: int
+    idom: List[int]
+    children: List[List[int]]
+    pre: List[int]
+    post: List[int]
+
+    @classmethod
+    def build(cls, root: int, idom: List[int]) -> "DomTree":
+        n = len(idom)
+        children: List[List[int]] = [[] for _ in range(n)]
+        for v, d in enumerate(idom):
+            if d >= 0:
+                children[d].append(v)
+        pre = [-1] * n
+        post = [-1] * n
+        if 0 <= root < n:
+            clock = 0
+            stack = [(root, False)]
+            while stack:
+                v, done = stack.pop()
+                if done:
+                    post[v] = clock
+                    clock += 1
+                    continue
+                pre[v] = clock
+                clock += 1
+                stack.append((v, True))
+                for c in reversed(children[v]):
+                    stack.append((c, False))
+        return cls(root=root, idom=idom, children=children, pre=pre, post=post)
+
+    def reachable(self, v: int) -> bool:
+        return self.pre[v] >= 0
+
+    def dominates(self, a: int, b: int) -> bool:
+        """a, b'yi (tersine: post-dominatör ağacında b'yi post-) domine ediyor mu (a == b dahil)."""
+        pre = self.pre
+        return pre[b] >= 0 and pre[a] <= pre[b] and self.post[b] <= self.post[a]
+
+    def dominators_of(self, v: int) -> List[int]:
+        """v'den köke dominatör zinciri (v dahil)."""
+        if self.pre[v] < 0:
+            return []
+        out = [v]
+        while self.idom[v] >= 0:
+            v = self.idom[v]
+            out.append(v)
+        return out
+
+
+@dataclass
+class Loop:
+    header: int
+    back_edges: List[int]                               # geri kenar kaynakları (latch'ler)
+    blocks: List[int] = field(default_factory=list)     # doğrudan üyeler (header dahil, iç döngüler hariç)
+    children: List[int] = field(default_factory=list)   # iç döngü indeksleri
+    parent: int = -1
+    depth: int = 1
+
+
+@dataclass
+class LoopForest:
+    """Doğal döngülerin iç içelik ormanı. loop_of[v]: v'yi içeren en içteki döngü (-1 yok)."""
+    loops: List[Loop]
+    roots: List[int]
+    loop_of: List[int]
+
+    def depth(self, v: int) -> int:
+        li = self.loop_of[v]
+        return 0 if li < 0 else self.loops[li].depth
+
+    def all_blocks(self, li: int) -> List[int]:
+        """Döngünün iç döngüler dahil tüm düğümleri."""
+        out: List[int] = []
+        stack = [li]
+        while stack:
+            lp = self.loops[stack.pop()]
+            out.extend(lp.blocks)
+            stack.extend(lp.children)
+        return out
+
+
+def find_loops(g: CSRCFG, dom: DomTree) -> LoopForest:
+    """
+    Geri kenarlar (u -> h, h u'yu domine eder) üzerinden doğal döngüler.
+    Başlıklar dominatör ağacı preorder'ının tersiyle (içten dışa) işlenir; iç döngüler
+    union-find ile tek temsilciye daraltıldığı için toplam iş ~doğrusal.
+    Indirgenemez (başlığı domine etmeyen) döngüler doğal döngü sayılmaz.
+    """
+    n = g.num_nodes
+    succ_off, succ_dst = g.succ_off, g.succ_dst
+    pred_off, pred_src = g.pred_off, g.pred_src
+
+    pre, post = dom.pre, dom.post
+
+    latches: dict = {}
+    for u in range(n):
+        pu = pre[u]
+        if pu < 0:
+            continue
+        for e in range(succ_off[u], succ_off[u + 1]):
+            h = succ_dst[e]
+            if pre[h] <= pu and post[u] <= post[h]:     # dom.dominates(h, u)
+                latches.setdefault(h, []).append(u)
+
+    rep = list(range(n))            # union-find: daraltılmış döngünün başlığı
+
+    def find(x: int) -> int:
+        r = x
+        while rep[r] != r:
+            r = rep[r]
+        while rep[x] != r:
+            rep[x], x = r, rep[x]
+        return r
+
+    loops: List[Loop] = []
+    loop_of = [-1] * n
+    loop_at: dict = {}              # başlık -> döngü indeksi
+    mark = [-1] * n
+    for h in sorted(latches, key=pre.__getitem__, reverse=True):
+        li = len(loops)
+        lp = Loop(header=h, back_edges=latches[h], blocks=[h])
+        loops.append(lp)
+        loop_at[h] = li
+        loop_of[h] = li
+        mark[h] = li
+        members: List[int] = []
+        work = [find(u) for u in lp.back_edges]
+        while work:
+            x = work.pop()
+            if mark[x] == li:
+                continue
+            mark[x] = li
+            members.append(x)
+            inner = loop_at.get(x)
+            if inner is not None and loops[inner].parent < 0 and inner != li:
+                loops[inner].parent = li
+                lp.children.append(inner)
+            else:
+                loop_of[x] = li
+                lp.blocks.append(x)
+            for j in range(pred_off[x], pred_off[x + 1]):
+                p = pred_src[j]
+                if pre[p] >= 0:
+                    r = find(p)
+                    if mark[r] != li:
+                        work.append(r)
+        for x in members:
+            rep[x] = h
+
+    roots = [li for li, lp in enumerate(loops) if lp.parent < 0]
+    stack = list(roots)
+    while stack:
+        li = stack.pop()
+        lp = loops[li]
+        if lp.parent >= 0:
+            lp.depth = loops[lp.parent].depth + 1
+        stack.extend(lp.children)
+    return LoopForest(loops=loops, roots=roots, loop_of=loop_of)
+
+
+class CFGAnalysis:
+    """
+    Bir CFG için tembel hesaplanan ve önbelleklenen analizler (CFG.analysis()).
+    CFG'ye blok/kenar eklenince CFG önbelleği düşürür.
+    """
+
+    def __init__(self, cfg: CFG) -> None:
+        self.cfg = cfg
+
+    @cached_property
+    def csr(self) -> CSRCFG:
+        return build_csr(self.cfg)
+
+    @cached_property
+    def dom(self) -> DomTree:
+        g = self.csr
+        idom = immediate_dominators(g.num_nodes, g.entry, g.succ_off, g.succ_dst, g.pred_off, g.pred_src)
+        return DomTree.build(g.entry, idom)
+
+    @cached_property
+    def pdom(self) -> DomTree:
+        g = self.csr
+        idom = immediate_dominators(g.num_nodes, g.exit, g.pred_off, g.pred_src, g.succ_off, g.succ_dst)
+        return DomTree.build(g.exit, idom)
+
+    @cached_property
+    def loops(self) -> LoopForest:
+        return find_loops(self.csr, self.dom)
+
+    @cached_property
+    def dataflow_order(self) -> List[int]:
+        return priority_order(self.csr, self.loops)
+
+    @cached_property
+    def effects(self) -> List[List[Effect]]:
+        return block_effects(self.cfg)
+
+    @cached_property
+    def liveness(self) -> Liveness:
+        return liveness(self.cfg)
+
+    @cached_property
+    def reaching(self) -> ReachingDefs:
+        return reaching_definitions(self.cfg)
+
+    @cached_property
+    def available(self) -> AvailableExprs:
+        return available_expressions(self.cfg)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from typing import Optional, Sequence, Tuple, List
 
@@ -8,6 +8,7 @@ from task1.ast import (
     Stmt, VarDecl, Break, ExprStmt, If, While, DoLoop,
     Expr, Assign, Binary, Unary, Place, Literal, CallOrIndexer,
 )
+from task1.visitor import Visitor, walk
 
 from .cfg import CFG
 
@@ -17,7 +18,18 @@ class _LoopCtx:
     break_target: int  # break nereye atlayacak
 
 
-class CFGBuilder:
+_Edge = Tuple[int, Optional[str]]
+# Temel blok kipinde akışın "devamı": (açık blok id'si ya da -1, hedefi henüz
+# belli olmayan kenarlar). Açık blok: halefi olmayan, deyim eklenebilen blok.
+_Pend = Tuple[int, List[_Edge]]
+
+
+@dataclass
+class _BlockLoopCtx:
+    breaks: List[_Edge] = field(default_factory=list)  # döngü sonrasına bağlanacak kenarlar
+
+
+class CFGBuilder(Visitor):
     def build_for_func(self, f: FuncDef) -> CFG:
         cfg = CFG(name=f.signature.name)
 
@@ -72,99 +84,143 @@ class CFGBuilder:
         st: Stmt,
         loop_stack: List[_LoopCtx],
     ) -> Tuple[Optional[int], Optional[int]]:
-        if isinstance(st, VarDecl):
-            b = cfg.new_block(self._stmt_to_str(st))
-            return b, b
+        # tip anahtarlı dispatch: visit_<StmtSınıfı>, bilinmeyen tipler generic_visit'e
+        return self.visit(st, cfg, loop_stack)
 
-        if isinstance(st, ExprStmt):
-            self._collect_calls(cfg, st.expr)
-            b = cfg.new_block(self._stmt_to_str(st))
-            return b, b
+    def visit_VarDecl(
+        self,
+        st: VarDecl,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        b = cfg.new_block(self._stmt_to_str(st))
+        cfg.blocks[b].nodes.append(st)
+        return b, b
 
-        if isinstance(st, Break):
-            b = cfg.new_block("break")
-            if not loop_stack:
-                cfg.errors.append(f"[{cfg.name}] break outside loop")
-                return b, None
-            cfg.add_edge(b, loop_stack[-1].break_target, "break")
+    def visit_ExprStmt(
+        self,
+        st: ExprStmt,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        self._collect_calls(cfg, st.expr)
+        b = cfg.new_block(self._stmt_to_str(st))
+        cfg.blocks[b].nodes.append(st)
+        return b, b
+
+    def visit_Break(
+        self,
+        st: Break,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        b = cfg.new_block("break")
+        if not loop_stack:
+            cfg.errors.append(f"[{cfg.name}] break outside loop")
             return b, None
+        cfg.add_edge(b, loop_stack[-1].break_target, "break")
+        return b, None
 
-        if isinstance(st, If):
-            self._collect_calls(cfg, st.cond)
-            cond_id = cfg.new_block(f"if {self._expr_to_str(st.cond)}")
+    def visit_If(
+        self,
+        st: If,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        self._collect_calls(cfg, st.cond)
+        cond_id = cfg.new_block(f"if {self._expr_to_str(st.cond)}")
+        cfg.blocks[cond_id].nodes.append(st.cond)
 
-            then_start, then_end = self._build_stmt_list(cfg, st.then_body or [], loop_stack)
+        then_start, then_end = self._build_stmt_list(cfg, st.then_body or [], loop_stack)
 
-            else_start, else_end = (None, None)
-            if st.else_body:
-                else_start, else_end = self._build_stmt_list(cfg, st.else_body, loop_stack)
+        else_start, else_end = (None, None)
+        if st.else_body:
+            else_start, else_end = self._build_stmt_list(cfg, st.else_body, loop_stack)
 
-            join_id = cfg.new_block("join")
+        join_id = cfg.new_block("join")
 
-            if then_start is None:
-                cfg.add_edge(cond_id, join_id, "True")
-            else:
-                cfg.add_edge(cond_id, then_start, "True")
-                if then_end is not None:
-                    cfg.add_edge(then_end, join_id)
+        if then_start is None:
+            cfg.add_edge(cond_id, join_id, "True")
+        else:
+            cfg.add_edge(cond_id, then_start, "True")
+            if then_end is not None:
+                cfg.add_edge(then_end, join_id)
 
-            if else_start is None:
-                cfg.add_edge(cond_id, join_id, "False")
-            else:
-                cfg.add_edge(cond_id, else_start, "False")
-                if else_end is not None:
-                    cfg.add_edge(else_end, join_id)
+        if else_start is None:
+            cfg.add_edge(cond_id, join_id, "False")
+        else:
+            cfg.add_edge(cond_id, else_start, "False")
+            if else_end is not None:
+                cfg.add_edge(else_end, join_id)
 
-            return cond_id, join_id
+        return cond_id, join_id
 
-        if isinstance(st, While):
-            self._collect_calls(cfg, st.cond)
-            cond_id = cfg.new_block(f"while {self._expr_to_str(st.cond)}")
+    def visit_While(
+        self,
+        st: While,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        self._collect_calls(cfg, st.cond)
+        cond_id = cfg.new_block(f"while {self._expr_to_str(st.cond)}")
+        cfg.blocks[cond_id].nodes.append(st.cond)
 
-            after_id = cfg.new_block("after_while")
-            loop_stack.append(_LoopCtx(break_target=after_id))
+        after_id = cfg.new_block("after_while")
+        loop_stack.append(_LoopCtx(break_target=after_id))
 
-            body_start, body_end = self._build_stmt_list(cfg, st.body or [], loop_stack)
-            loop_stack.pop()
+        body_start, body_end = self._build_stmt_list(cfg, st.body or [], loop_stack)
+        loop_stack.pop()
 
-            if body_start is None:
-                cfg.add_edge(cond_id, cond_id, "True")
-            else:
-                cfg.add_edge(cond_id, body_start, "True")
-                if body_end is not None:
-                    cfg.add_edge(body_end, cond_id)
+        if body_start is None:
+            cfg.add_edge(cond_id, cond_id, "True")
+        else:
+            cfg.add_edge(cond_id, body_start, "True")
+            if body_end is not None:
+                cfg.add_edge(body_end, cond_id)
 
-            cfg.add_edge(cond_id, after_id, "False")
-            return cond_id, after_id
+        cfg.add_edge(cond_id, after_id, "False")
+        return cond_id, after_id
 
-        if isinstance(st, DoLoop):
-            self._collect_calls(cfg, st.cond)
+    def visit_DoLoop(
+        self,
+        st: DoLoop,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        self._collect_calls(cfg, st.cond)
 
-            after_id = cfg.new_block("after_do")
-            loop_stack.append(_LoopCtx(break_target=after_id))
+        after_id = cfg.new_block("after_do")
+        loop_stack.append(_LoopCtx(break_target=after_id))
 
-            body_start, body_end = self._build_stmt_list(cfg, st.body or [], loop_stack)
-            loop_stack.pop()
+        body_start, body_end = self._build_stmt_list(cfg, st.body or [], loop_stack)
+        loop_stack.pop()
 
-            cond_id = cfg.new_block(f"do_{st.mode} {self._expr_to_str(st.cond)}")
+        cond_id = cfg.new_block(f"do_{st.mode} {self._expr_to_str(st.cond)}")
+        cfg.blocks[cond_id].nodes.append(st.cond)
 
-            if body_start is None:
-                cfg.add_edge(cond_id, cond_id)
-                cfg.add_edge(cond_id, after_id)
-                return cond_id, after_id
+        if body_start is None:
+            cfg.add_edge(cond_id, cond_id)
+            cfg.add_edge(cond_id, after_id)
+            return cond_id, after_id
 
-            if body_end is not None:
-                cfg.add_edge(body_end, cond_id)
+        if body_end is not None:
+            cfg.add_edge(body_end, cond_id)
 
-            if str(st.mode).lower() == "while":
-                cfg.add_edge(cond_id, body_start, "True")
-                cfg.add_edge(cond_id, after_id, "False")
-            else:
-                cfg.add_edge(cond_id, after_id, "True")
-                cfg.add_edge(cond_id, body_start, "False")
+        if str(st.mode).lower() == "while":
+            cfg.add_edge(cond_id, body_start, "True")
+            cfg.add_edge(cond_id, after_id, "False")
+        else:
+            cfg.add_edge(cond_id, after_id, "True")
+            cfg.add_edge(cond_id, body_start, "False")
 
-            return body_start, after_id
+        return body_start, after_id
 
+    def generic_visit(
+        self,
+        st: Stmt,
+        cfg: CFG,
+        loop_stack: List[_LoopCtx],
+    ) -> Tuple[Optional[int], Optional[int]]:
         b = cfg.new_block(f"[unhandled stmt] {type(st).__name__}")
         cfg.errors.append(f"[{cfg.name}] unhandled stmt type: {type(st).__name__}")
         return b, b
@@ -193,47 +249,273 @@ class CFGBuilder:
         return str(t)
 
     def _expr_to_str(self, e: Expr) -> str:
-        if isinstance(e, Place):
-            return str(e.name)
-        if isinstance(e, Literal):
-            v = getattr(e, "value", None)
-            if v is None:
-                v = getattr(e, "text", None)
-            if v is None:
-                v = getattr(e, "raw", None)
-            if v is None:
-                v = str(e)
-            return str(v)
-        if isinstance(e, Unary):
-            return f"({e.op}{self._expr_to_str(e.rhs)})"
-        if isinstance(e, Binary):
-            return f"({self._expr_to_str(e.lhs)} {e.op} {self._expr_to_str(e.rhs)})"
-        if isinstance(e, Assign):
-            return f"({self._expr_to_str(e.lhs)} = {self._expr_to_str(e.rhs)})"
-        if isinstance(e, CallOrIndexer):
-            callee = self._expr_to_str(e.callee)
-            args = ", ".join(self._expr_to_str(a) for a in (e.args or []))
-            return f"{callee}({args})"
-        return type(e).__name__
+        return _EXPR_STR.visit(e)
 
     def _collect_calls(self, cfg: CFG, e: Optional[Expr]) -> None:
-        if e is None:
-            return
-        if isinstance(e, CallOrIndexer):
-            if isinstance(e.callee, Place):
-                cfg.calls.add(str(e.callee.name))
-            self._collect_calls(cfg, e.callee)
-            for a in (e.args or []):
-                self._collect_calls(cfg, a)
-            return
-        if isinstance(e, Unary):
-            self._collect_calls(cfg, e.rhs)
-            return
-        if isinstance(e, Binary):
-            self._collect_calls(cfg, e.lhs)
-            self._collect_calls(cfg, e.rhs)
-            return
-        if isinstance(e, Assign):
-            self._collect_calls(cfg, e.lhs)
-            self._collect_calls(cfg, e.rhs)
+        # açık yığınla gezinme: derin ifadelerde özyineleme limiti yok
+        for n in walk(e):
+            if isinstance(n, CallOrIndexer) and isinstance(n.callee, Place):
+                cfg.calls.add(str(n.callee.name))
+
+
+class BlockCFGBuilder(CFGBuilder):
+    """
+    Temel blok kipi: düz deyimler aynı CFGBlock'un stmts listesine eklenir,
+    if/while/do koşulları bloğun son deyimidir. join/after_*/break düğümleri
+    hiç üretilmez: hedefi belli olmayan kenarlar (etiketleriyle) bekletilir ve
+    bir sonraki gerçek bloğa doğrudan bağlanır. ENTRY/EXIT ayrı bloklar kalır;
+    blok etiketi deyimlerin satır satır birleşimidir.
+    """
+
+    def build_for_func(self, f: FuncDef) -> CFG:
+        cfg = CFG(name=f.signature.name)
+
+        entry = cfg.new_block("ENTRY")
+        exit_ = cfg.new_block("EXIT")
+        cfg.entry = entry
+        cfg.exit = exit_
+
+        body = getattr(f, "body", None)
+        if not body:
+            cfg.errors.append(f"[{cfg.name}] function has no body")
+            cfg.add_edge(entry, exit_)
+            return cfg
+
+        loop_stack: List[_BlockLoopCtx] = []
+        _, pend = self._build_stmt_list(cfg, body, loop_stack, (-1, [(entry, None)]))
+        self._connect(cfg, pend, exit_)
+
+        for b in cfg.blocks.values():
+            if b.stmts:
+                b.label = "\n".join(b.stmts)
+        return cfg
+
+    # ---- bekleyen akış yardımcıları ----
+
+    def _materialize(self, cfg: CFG, pend: _Pend) -> int:
+        """Deyim eklenecek blok: açık blok ya da bekleyen kenarların yeni hedefi."""
+        open_id, edges = pend
+        if open_id >= 0:
+            return open_id
+        b = cfg.new_block("")
+        for src, lab in edges:
+            cfg.add_edge(src, b, lab)
+        return b
+
+    def _connect(self, cfg: CFG, pend: _Pend, target: int) -> None:
+        open_id, edges = pend
+        if open_id >= 0:
+            cfg.add_edge(open_id, target)
             return
+        for src, lab in edges:
+            cfg.add_edge(src, target, lab)
+
+    def _dangling(self, pend: _Pend) -> List[_Edge]:
+        open_id, edges = pend
+        return [(open_id, None)] if open_id >= 0 else list(edges)
+
+    def _merge(self, cfg: CFG, a: _Pend, b: _Pend) -> _Pend:
+        edges = self._dangling(a) + self._dangling(b)
+        if len(edges) == 1 and edges[0][1] is None:
+            src = edges[0][0]
+            # tek etiketsiz kenar, halefsiz bloktan: o blok açık kalır (zincir birleşir)
+            if src != cfg.entry and not cfg.blocks[src].succs:
+                return src, []
+        return -1, edges
+
+    def _landing(self, cfg: CFG, marks: List[Tuple[int, Optional[str], int]]) -> Optional[int]:
+        """Bekletilen kenarlar (hep birlikte bağlanırlar) hangi bloğa bağlandı; henüz bağlanmadıysa None."""
+        for src, lab, k in marks[:1]:
+            for to, elab in cfg.blocks[src].succs[k:]:
+                if elab == lab:
+                    return to
+        return None
+
+    # ---- deyimler: (gelen akışın girdiği blok ya da None, yeni devam) ----
+
+    def _build_stmt_list(
+        self,
+        cfg: CFG,
+        stmts: Sequence[Stmt],
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        start: Optional[int] = None
+        for i, st in enumerate(stmts):
+            s, pend = self.visit(st, cfg, loop_stack, pend)
+            if i == 0:
+                start = s
+        return start, pend
+
+    def _append(self, cfg: CFG, pend: _Pend, text: str, node: Optional[object] = None) -> int:
+        b = self._materialize(cfg, pend)
+        cfg.blocks[b].stmts.append(text)
+        if node is not None:
+            cfg.blocks[b].nodes.append(node)
+        return b
+
+    def visit_VarDecl(
+        self,
+        st: VarDecl,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        b = self._append(cfg, pend, self._stmt_to_str(st), st)
+        return b, (b, [])
+
+    def visit_ExprStmt(
+        self,
+        st: ExprStmt,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        self._collect_calls(cfg, st.expr)
+        b = self._append(cfg, pend, self._stmt_to_str(st), st)
+        return b, (b, [])
+
+    def visit_Break(
+        self,
+        st: Break,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        if not loop_stack:
+            cfg.errors.append(f"[{cfg.name}] break outside loop")
+            return self._append(cfg, pend, "break"), (-1, [])
+        open_id, edges = pend
+        if open_id >= 0:
+            loop_stack[-1].breaks.append((open_id, "break"))
+            return open_id, (-1, [])
+        # sadece atlama yapan düğüm yok: gelen kenarlar etiketleriyle döngü sonrasına
+        loop_stack[-1].breaks.extend(edges)
+        return None, (-1, [])
+
+    def visit_If(
+        self,
+        st: If,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        self._collect_calls(cfg, st.cond)
+        b = self._append(cfg, pend, f"if {self._expr_to_str(st.cond)}", st.cond)
+
+        _, then_pend = self._build_stmt_list(cfg, st.then_body or [], loop_stack, (-1, [(b, "True")]))
+        else_pend: _Pend = (-1, [(b, "False")])
+        if st.else_body:
+            _, else_pend = self._build_stmt_list(cfg, st.else_body, loop_stack, else_pend)
+
+        return b, self._merge(cfg, then_pend, else_pend)
+
+    def visit_While(
+        self,
+        st: While,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        self._collect_calls(cfg, st.cond)
+        # başlık geri kenar hedefi: her zaman yeni blok
+        h = cfg.new_block("")
+        self._connect(cfg, pend, h)
+        cfg.blocks[h].stmts.append(f"while {self._expr_to_str(st.cond)}")
+        cfg.blocks[h].nodes.append(st.cond)
+
+        ctx = _BlockLoopCtx()
+        loop_stack.append(ctx)
+        _, body_pend = self._build_stmt_list(cfg, st.body or [], loop_stack, (-1, [(h, "True")]))
+        loop_stack.pop()
+        self._connect(cfg, body_pend, h)
+
+        return h, (-1, [(h, "False")] + ctx.breaks)
+
+    def visit_DoLoop(
+        self,
+        st: DoLoop,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        self._collect_calls(cfg, st.cond)
+        cond_text = f"do_{st.mode} {self._expr_to_str(st.cond)}"
+        # gövde başı geri kenar hedefi: açık bloğa eklenmesin, yeni blokta başlasın
+        incoming: _Pend = (-1, self._dangling(pend))
+
+        if not st.body:
+            c = self._append(cfg, incoming, cond_text, st.cond)
+            cfg.add_edge(c, c)
+            return c, (-1, [(c, None)])
+
+        # gövde break ile başlarsa gelen kenarlar ileri taşınır; nereye indikleri sonradan bulunur
+        marks = [(src, lab, len(cfg.blocks[src].succs)) for src, lab in incoming[1]]
+        ctx = _BlockLoopCtx()
+        loop_stack.append(ctx)
+        body_start, body_pend = self._build_stmt_list(cfg, st.body, loop_stack, incoming)
+        loop_stack.pop()
+
+        if str(st.mode).lower() == "while":
+            body_lab, after_lab = "True", "False"
+        else:
+            body_lab, after_lab = "False", "True"
+
+        # koşul, gövdenin son açık bloğuna eklenir (yalnızca oradan girilir)
+        c = self._append(cfg, body_pend, cond_text, st.cond)
+        if body_start is None:
+            body_start = self._landing(cfg, marks)
+        if body_start is not None:
+            cfg.add_edge(c, body_start, body_lab)
+        return body_start, (-1, [(c, after_lab)] + ctx.breaks)
+
+    def generic_visit(
+        self,
+        st: Stmt,
+        cfg: CFG,
+        loop_stack: List[_BlockLoopCtx],
+        pend: _Pend,
+    ) -> Tuple[Optional[int], _Pend]:
+        cfg.errors.append(f"[{cfg.name}] unhandled stmt type: {type(st).__name__}")
+        b = self._append(cfg, pend, f"[unhandled stmt] {type(st).__name__}")
+        return b, (b, [])
+
+
+class _ExprPrinter(Visitor):
+    def visit_Place(self, e: Place) -> str:
+        return str(e.name)
+
+    def visit_Literal(self, e: Literal) -> str:
+        v = getattr(e, "value", None)
+        if v is None:
+            v = getattr(e, "text", None)
+        if v is None:
+            v = getattr(e, "raw", None)
+        if v is None:
+            v = str(e)
+        return str(v)
+
+    def visit_Unary(self, e: Unary) -> str:
+        return f"({e.op}{self.visit(e.rhs)})"
+
+    def visit_Binary(self, e: Binary) -> str:
+        return f"({self.visit(e.lhs)} {e.op} {self.visit(e.rhs)})"
+
+    def visit_Assign(self, e: Assign) -> str:
+        return f"({self.visit(e.lhs)} = {self.visit(e.rhs)})"
+
+    def visit_CallOrIndexer(self, e: CallOrIndexer) -> str:
+        callee = self.visit(e.callee)
+        args = ", ".join(self.visit(a) for a in (e.args or []))
+        return f"{callee}({args})"
+
+    def generic_visit(self, e: Expr) -> str:
+        return type(e).__name__
+
+
+_EXPR_STR = _ExprPrinter()
+
+
+def expr_str(e: Expr) -> str:
+    """İfadenin CFG etiketlerinde kullanılan metin biçimi ("(a + b)", "f(x)" ...)."""
+    return _EXPR_STR.visit(e)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .graph import iter_sccs, reachable
+
+# Çağrı grafiği analizi: Tarjan SCC yoğunlaştırması, topolojik sıra ve giriş
+# fonksiyonundan erişilebilirlik. İki kullanım:
+#   * CallGraph(edges): toplanmış call_edges üzerinde, analizler ilk
+#     erişimde hesaplanır ve önbelleğe alınır (CFGAnalysis gibi)
+#   * iter_reachable_sccs(entry, calls_of): tembel; calls_of(f) bir fonksiyona
+#     ilk varışta çağrılır (ör. CFG'sini o anda kurar), yani erişilemeyen
+#     fonksiyonlara hiç dokunulmaz. SCC'ler aşağıdan yukarı gelir: bir SCC
+#     üretildiğinde çağırdığı (kendi dışındaki) tüm fonksiyonlar zaten üretilmiştir.
+
+
+def iter_reachable_sccs(entry: Iterable[str], calls_of: Callable[[str], Iterable[str]]) -> Iterator[List[str]]:
+    return iter_sccs(entry, calls_of)
+
+
+class CallGraph:
+    """
+    Yönlü çağrı grafiği (çağıran -> çağrılan). nodes: kenarsız fonksiyonlar da
+    dahil edilsin diye (tanımlı ama hiç çağrılmayan / çağırmayan).
+    sccs aşağıdan yukarı (çağrılanlar önce); topo_order yukarıdan aşağı.
+    """
+
+    def __init__(self, edges: Iterable[Tuple[str, str]] = (), nodes: Iterable[str] = ()) -> None:
+        succ: Dict[str, List[str]] = {}
+        for n in nodes:
+            succ.setdefault(n, [])
+        seen: Set[Tuple[str, str]] = set()
+        for a, b in edges:
+            succ.setdefault(b, [])
+            if (a, b) not in seen:
+                seen.add((a, b))
+                succ.setdefault(a, []).append(b)
+        self.succ = succ
+
+    def callees(self, name: str) -> List[str]:
+        return self.succ.get(name, [])
+
+    @cached_property
+    def sccs(self) -> List[List[str]]:
+        return list(iter_sccs(self.succ, self.callees))
+
+    @cached_property
+    def scc_of(self) -> Dict[str, int]:
+        return {name: i for i, comp in enumerate(self.sccs) for name in comp}
+
+    @cached_property
+    def condensation(self) -> List[List[int]]:
+        """SCC DAG'ı: i -> çağırdığı diğer SCC'ler (tekrarsız). Kenarlar hep küçük indekse gider."""
+        scc_of = self.scc_of
+        out: List[List[int]] = []
+        for i, comp in enumerate(self.sccs):
+            targets: List[int] = []
+            seen = {i}
+            for a in comp:
+                for b in self.succ[a]:
+                    j = scc_of[b]
+                    if j not in seen:
+                        seen.add(j)
+                        targets.append(j)
+            out.append(targets)
+        return out
+
+    @cached_property
+    def topo_order(self) -> List[int]:
+        """SCC indeksleri, çağıranlar önce (Tarjan sırasının tersi)."""
+        return list(range(len(self.sccs) - 1, -1, -1))
+
+    def is_recursive(self, name: str) -> bool:
+        """Doğrudan ya da karşılıklı özyineleme."""
+        return len(self.sccs[self.scc_of[name]]) > 1 or name in self.succ[name]
+
+    def reachable_from(self, roots: Sequence[str]) -> Set[str]:
+        return reachable([r for r in roots if r in self.succ], self.callees)
+
+    def bottom_up(self, roots: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Fonksiyonlar aşağıdan yukarı SCC sırasıyla; roots verilirse yalnızca
+        onlardan erişilebilenler (kalan grafiğe hiç bakılmaz).
+        """
+        if roots is None:
+            comps: Iterable[List[str]] = self.sccs
+        else:
+            comps = iter_sccs([r for r in roots if r in self.succ], self.callees)
+        return [name for comp in comps for name in comp]
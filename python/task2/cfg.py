@@ -1,6 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .analysis import CFGAnalysis
+    from .csr import CSRCFG
 
 
 @dataclass
@@ -8,6 +12,8 @@ class CFGBlock:
     id: int
     label: str
     succs: List[Tuple[int, Optional[str]]] = field(default_factory=list)  # (to_id, edge_label)
+    stmts: List[str] = field(default_factory=list)  # temel blok kipinde blok içindeki deyimler
+    nodes: List[Any] = field(default_factory=list)  # deyim / koşul AST düğümleri, yürütme sırasıyla (dataflow)
 
 
 @dataclass
@@ -22,11 +28,28 @@ class CFG:
     errors: List[str] = field(default_factory=list)
     calls: Set[str] = field(default_factory=set)
 
+    # dominatör / döngü analizleri önbelleği; CFG değişince düşürülür
+    _analysis: Optional["CFGAnalysis"] = field(default=None, init=False, repr=False, compare=False)
+
     def new_block(self, label: str) -> int:
+        self._analysis = None
         bid = self.next_id
         self.next_id += 1
         self.blocks[bid] = CFGBlock(id=bid, label=label)
         return bid
 
     def add_edge(self, src: int, dst: int, label: Optional[str] = None) -> None:
+        self._analysis = None
         self.blocks[src].succs.append((dst, label))
+
+    def to_csr(self) -> "CSRCFG":
+        """Analizler için dizi tabanlı, önceli indeksli kopya (CFG değişmez)."""
+        from .csr import build_csr
+        return build_csr(self)
+
+    def analysis(self) -> "CFGAnalysis":
+        """Önbellekli analizler: .csr, .dom, .pdom, .loops, .liveness, .reaching, .available (ilk erişimde hesaplanır)."""
+        if self._analysis is None:
+            from .analysis import CFGAnalysis
+            self._analysis = CFGAnalysis(self)
+        return self._analysis
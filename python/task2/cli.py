@@ -1,12 +1,266 @@
 from __future__ import annotations
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 import argparse
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from task1.parser import parse_text
-from task1.ast import FuncDef
+from task1.parser import BACKENDS, ParseResult, get_parser, parse_text
+from task1.ast import FuncDef, ParseError, Program
+from task1.astbin import SUFFIX as AST_SUFFIX, AstFormatError, read_ast
+from task1.incremental import split_spans
+from task1.recovery import collect_errors, parse_text_recover
+from task1.source import read_source
+from task1.stream import iter_func_defs
+from task1.symbols import build_symbols
 
-from .builder import CFGBuilder
-from .render import cfg_to_dot, call_graph_to_dot, run_dot
+from .builder import BlockCFGBuilder, CFGBuilder
+from .callgraph import iter_reachable_sccs
+from .render import cfg_to_dot, call_graph_to_dot
+from .render_queue import RenderQueue, RenderResult, format_report
+from .svg import call_graph_to_svg, cfg_to_svg
+
+
+@dataclass
+class _FuncCFG:
+    name: str
+    dot_text: str
+    errors: List[str]
+    calls: List[str]                # cfg.calls yineleme sırası korunur (seri çıktıyla aynı kenar sırası)
+    svg_text: Optional[str] = None  # --svg-engine builtin
+
+
+@dataclass
+class _FileResult:
+    """Bir girdi dosyasının parse sonucu (seri yol ve --jobs işçileri ortak)."""
+    path: str
+    errors: List[str] = field(default_factory=list)
+    ok: bool = False                                        # tree/<stem>.ok.txt yazılsın mı
+    funcs: List[Tuple[str, bool]] = field(default_factory=list)   # (isim, gövdesi var mı), dosya sırasıyla
+    items: List[FuncDef] = field(default_factory=list)      # AST'ler (işçiden sadece --sema için döner)
+    cfgs: List[_FuncCFG] = field(default_factory=list)      # --jobs: işçide kurulmuş CFG'ler (items sırasıyla)
+
+
+def _func_cfg(builder: CFGBuilder, func: FuncDef, svg: bool = False) -> _FuncCFG:
+    cfg = builder.build_for_func(func)
+    return _FuncCFG(
+        name=func.signature.name, dot_text=cfg_to_dot(cfg), errors=cfg.errors, calls=list(cfg.calls),
+        svg_text=cfg_to_svg(cfg) if svg else None,
+    )
+
+
+def _write_graph(fc: _FuncCFG, out_graph: Path, renderer) -> None:
+    dot_path = out_graph / f"{fc.name}.dot"
+    dot_path.write_text(fc.dot_text, encoding="utf-8")
+    if fc.svg_text is not None:
+        (out_graph / f"{fc.name}.svg").write_text(fc.svg_text, encoding="utf-8")
+
+    if renderer is not None:
+        renderer.submit(dot_path)
+
+
+def _record_func(name: str, errors, calls, all_errors, with_errors, call_edges) -> None:
+    if errors:
+        with_errors.add(name)
+        all_errors.extend(errors)
+
+    for callee in calls:
+        call_edges.add((name, callee))
+
+
+def _write_func(fc: _FuncCFG, out_graph: Path, renderer, all_errors, with_errors, call_edges) -> None:
+    _record_func(fc.name, fc.errors, fc.calls, all_errors, with_errors, call_edges)
+    _write_graph(fc, out_graph, renderer)
+
+
+def _load_file(fpath: str, recover: bool, backend: str) -> _FileResult:
+    p = Path(fpath)
+    out = _FileResult(path=fpath)
+    if not p.exists():
+        out.errors.append(f"[io error] file not found: {p}")
+        return out
+
+    if p.suffix == AST_SUFFIX:
+        try:
+            res = ParseResult(program=read_ast(p), errors=[])
+        except AstFormatError as e:
+            out.errors.append(f"[io error] {p.name}: {e}")
+            return out
+    else:
+        text = read_source(p)
+        res = parse_text_recover(text) if recover else parse_text(text, inline=True, backend=backend)
+
+    if res.errors:
+        out.errors.extend(_parse_error_msg(p.name, e) for e in res.errors)
+        if not recover:
+            return out
+
+    prog = res.program
+    if prog is None:
+        out.errors.append(f"[parse error] {p.name}: program is None")
+        return out
+
+    out.ok = not res.errors
+    _set_items(out, getattr(prog, "items", []))
+    return out
+
+
+def _parse_error_msg(fname: str, e: ParseError) -> str:
+    return f"[parse error] {fname}: line={e.line} col={e.column}: {e.message}"
+
+
+def _set_items(out: _FileResult, items) -> None:
+    out.items = [item for item in items if isinstance(item, FuncDef)]
+    out.funcs = [(item.signature.name, bool(getattr(item, "body", None))) for item in out.items]
+
+
+# ---- --jobs: süreç havuzu işçileri ----
+
+_WORKER_BUILDER: Optional[CFGBuilder] = None
+
+
+def _init_worker(backend: str, blocks: bool, recover: bool) -> None:
+    global _WORKER_BUILDER
+    # LALR tabloları işçi başına bir kez (--recover span'leri her zaman lark ile parse eder)
+    if backend == "lark" or recover:
+        get_parser(inline=True)
+    if recover:
+        get_parser(inline=False, positions=False)     # collect_errors'ın hata toparlayan parser'ı
+    _WORKER_BUILDER = BlockCFGBuilder() if blocks else CFGBuilder()
+
+
+def _finish_job(res: _FileResult, keep_ast: bool, svg: bool, build: bool) -> _FileResult:
+    if build:
+        res.cfgs = [_func_cfg(_WORKER_BUILDER, item, svg) for item in res.items]
+    if not keep_ast:
+        res.items = []                  # geri taşınmaz: ana süreç isim + DOT metniyle yetinir
+    return res
+
+
+def _file_job(job) -> _FileResult:
+    fpath, recover, backend, keep_ast, svg, build = job
+    return _finish_job(_load_file(fpath, recover, backend), keep_ast, svg, build)
+
+
+def _span_job(job) -> _FileResult:
+    """
+    Tek fonksiyon span'i (split_spans): parse + CFG. ok=False ise span hatalıdır;
+    --recover'da hataları parse_text_recover'daki gibi toplanır.
+    """
+    fpath, chunk, line, recover, backend, keep_ast, svg, build = job
+    out = _FileResult(path=fpath)
+    res = parse_text(chunk, inline=True, backend="lark" if recover else backend)
+    if res.errors:
+        if recover:
+            name = Path(fpath).name
+            out.errors = [_parse_error_msg(name, e) for e in collect_errors(chunk, line - 1)]
+        return out
+    out.ok = True
+    _set_items(out, res.program.items)
+    return _finish_job(out, keep_ast, svg, build)
+
+
+def _merge_spans(fpath: str, parts: List[_FileResult], recover: bool, backend: str) -> _FileResult:
+    """Bir dosyanın span sonuçlarını kaynak sırasıyla seri _load_file sonucuna birleştirir."""
+    if not recover and not all(part.ok for part in parts):
+        # hata mesajları tüm dosyanın parse'ındakiyle aynı olsun (ilk hata, bağlamıyla)
+        return _load_file(fpath, recover, backend)
+    out = _FileResult(path=fpath, ok=all(part.ok for part in parts))
+    for part in parts:
+        out.errors.extend(part.errors)
+        out.funcs.extend(part.funcs)
+        out.items.extend(part.items)
+        out.cfgs.extend(part.cfgs)
+    return out
+
+
+def _load_files(files: List[str], args) -> Iterable[_FileResult]:
+    if args.jobs <= 1:
+        return (_load_file(f, args.recover, args.backend) for f in files)
+    # --prune: CFG'ler ana süreçte, yalnızca erişilebilenler için kurulur
+    opts = (args.sema or args.prune, _builtin_svg(args), not args.prune)
+
+    # kaynak dosyalar fonksiyon span'lerine bölünür, her span ayrı bir iş olur;
+    # .v3ast ve bulunamayan dosyalar bütün olarak tek iş (span listesi None)
+    plan: List[Tuple[str, Optional[list]]] = []
+    for f in files:
+        p = Path(f)
+        if p.suffix == AST_SUFFIX or not p.exists():
+            plan.append((f, None))
+            continue
+        text = read_source(p)
+        chunks = ((text[sp.start:sp.end], sp.line) for sp in split_spans(text))
+        plan.append((f, [(f, chunk, line, args.recover, args.backend, *opts)
+                         for chunk, line in chunks if chunk.strip()]))
+    n_jobs = sum(1 if spans is None else len(spans) for _, spans in plan)
+    pool = ProcessPoolExecutor(
+        max_workers=min(args.jobs, n_jobs) or 1,
+        initializer=_init_worker, initargs=(args.backend, args.blocks, args.recover),
+    )
+
+    def results() -> Iterable[_FileResult]:
+        # sonuçlar giriş sırasıyla toplanır: birleştirme seri yolla aynı sırada
+        with pool:
+            futures: List[Tuple[str, object]] = [
+                (f, pool.submit(_file_job, (f, args.recover, args.backend, *opts)) if spans is None
+                 else [pool.submit(_span_job, job) for job in spans])
+                for f, spans in plan
+            ]
+            for f, fut in futures:
+                if isinstance(fut, Future):
+                    yield fut.result()
+                else:
+                    yield _merge_spans(f, [x.result() for x in fut], args.recover, args.backend)
+
+    return results()
+
+
+def _reachable_cfgs(entry: str, func_map, builder: CFGBuilder, svg: bool, all_errors) -> List[Tuple[str, _FuncCFG]]:
+    """
+    entry'den erişilebilen fonksiyonların CFG'leri, aşağıdan yukarı SCC sırasıyla.
+    CFG'ler çağrı grafiği gezilirken kurulur (çağrılar CFG'den öğrenilir);
+    erişilemeyen fonksiyonlar hiç kurulmaz.
+    """
+    built: Dict[str, _FuncCFG] = {}
+
+    def calls_of(name: str) -> List[str]:
+        func = func_map.get(name)
+        if func is None:
+            return []                   # tanımsız çağrı hedefi
+        fc = built[name] = _func_cfg(builder, func, svg)
+        return fc.calls
+
+    if entry not in func_map:
+        all_errors.append(f"[semantic] entry function not found: {entry}")
+        return []
+    return [(name, built[name]) for comp in iter_reachable_sccs([entry], calls_of) for name in comp if name in built]
+
+
+def _builtin_svg(args) -> bool:
+    return args.svg and args.svg_engine == "builtin"
+
+
+def _make_renderer(args) -> Optional[RenderQueue]:
+    formats = [fmt for fmt, on in (("png", args.png), ("svg", args.svg and not _builtin_svg(args))) if on]
+    if not formats:
+        return None
+    return RenderQueue(formats, jobs=args.render_jobs, cache=not args.force_render)
+
+
+def _report_renders(results: List[RenderResult], renderer: RenderQueue, report: Optional[str]) -> bool:
+    failed = [r for r in results if r.error is not None]
+    for r in failed:
+        err = getattr(r.error, "stderr", None)
+        detail = err.decode(errors="replace").strip() if err else str(r.error)
+        print(f"[render error] {r.dot_path}: {detail}", file=sys.stderr)
+    skipped = sum(r.skipped for r in results)
+    total = sum(r.seconds for r in results)
+    print(f"Rendered: {len(results) - skipped - len(failed)} graphs in {renderer.invocations} dot calls "
+          f"({total:.2f}s); unchanged: {skipped}; failed: {len(failed)}")
+    if report:
+        Path(report).write_text(format_report(results), encoding="utf-8")
+    return bool(failed)
 
 
 def main() -> int:
@@ -14,13 +268,41 @@ def main() -> int:
         prog="task2",
         description="Task2: build CFG for each function + call graph (Variant 3)"
     )
-    ap.add_argument("rest", nargs="+", help="file1 [file2 ...] out_dir")
+    ap.add_argument("rest", nargs="+", help="file1 [file2 ...] out_dir (inputs: .v3 source or .v3ast)")
     ap.add_argument("--svg", action="store_true", help="also render SVG")
+    ap.add_argument("--svg-engine", choices=("dot", "builtin"), default="dot",
+                    help="SVG via Graphviz dot, or the built-in layered layout (no subprocess)")
     ap.add_argument("--png", action="store_true", help="also render PNG")
+    ap.add_argument("--stream", action="store_true",
+                    help="parse function by function and emit each CFG immediately (bounded memory)")
+    ap.add_argument("--recover", action="store_true",
+                    help="report all syntax errors and still build CFGs for functions that parsed")
+    ap.add_argument("--backend", choices=BACKENDS, default="lark", help="parser backend")
+    ap.add_argument("--sema", action="store_true",
+                    help="build symbol tables and report unknown/duplicate identifiers")
+    ap.add_argument("--blocks", action="store_true",
+                    help="emit basic-block CFGs (no join/after/break nodes, statements grouped per block)")
+    ap.add_argument("--jobs", type=int, default=1,
+                    help="parse functions and build their CFGs in N worker processes (output identical to serial)")
+    ap.add_argument("--prune", action="store_true",
+                    help="only build/write CFGs of functions reachable from --entry (bottom-up SCC order)")
+    ap.add_argument("--entry", default="main", help="entry function for --prune")
+    ap.add_argument("--render-jobs", type=int, default=None,
+                    help="max concurrent Graphviz processes for --png/--svg (default: CPU count)")
+    ap.add_argument("--force-render", action="store_true",
+                    help="re-render images even if their DOT content is unchanged")
+    ap.add_argument("--render-report", metavar="FILE",
+                    help="write per-graph render times (TSV) to FILE")
     args = ap.parse_args()
 
     if len(args.rest) < 2:
         ap.error("Need at least one input file and output directory")
+    if args.sema and args.stream:
+        ap.error("--sema needs the whole program and cannot be combined with --stream")
+    if args.prune and args.stream:
+        ap.error("--prune needs the whole program and cannot be combined with --stream")
+    if args.jobs > 1 and args.stream:
+        ap.error("--jobs cannot be combined with --stream")
 
     *files, out_dir = args.rest
     out_dir = Path(out_dir)
@@ -31,65 +313,86 @@ def main() -> int:
     out_tree.mkdir(parents=True, exist_ok=True)
     out_graph.mkdir(parents=True, exist_ok=True)
 
-    builder = CFGBuilder()
+    builder = BlockCFGBuilder() if args.blocks else CFGBuilder()
+    renderer = _make_renderer(args)
 
     all_errors = []
-    func_map: dict[str, FuncDef] = {}
+    func_map: dict[str, Optional[FuncDef]] = {}
     defined = set()
     no_body = set()
     with_errors = set()
     call_edges = set()
 
-    # 1) parse all files, collect all functions
-    for fpath in files:
-        p = Path(fpath)
-        if not p.exists():
-            all_errors.append(f"[io error] file not found: {p}")
-            continue
+    if args.stream:
+        # 1+2) tek geçiş: her FuncDef parse edilir edilmez CFG'si yazılır ve bırakılır
+        last_defs: Dict[str, Tuple[list, list]] = {}     # ad -> (CFG hataları, çağrılar)
+        for fpath in files:
+            p = Path(fpath)
+            if not p.exists():
+                all_errors.append(f"[io error] file not found: {p}")
+                continue
 
-        text = p.read_text(encoding="utf-8")
-        res = parse_text(text)
+            errs: list[ParseError] = []
+            if p.suffix == AST_SUFFIX:
+                # task1.cli --ast-bin çıktısı: parse adımı atlanır
+                try:
+                    items = read_ast(p).items
+                except AstFormatError as e:
+                    all_errors.append(f"[io error] {p.name}: {e}")
+                    continue
+            else:
+                items = iter_func_defs(str(p), errors=errs, recover=args.recover, backend=args.backend)
+            for item in items:
+                name = item.signature.name
+                if name in defined:
+                    all_errors.append(f"[semantic] duplicate function name: {name} (file {p.name})")
+                defined.add(name)
+                if not getattr(item, "body", None):
+                    no_body.add(name)
+                fc = _func_cfg(builder, item, _builtin_svg(args))
+                _write_graph(fc, out_graph, renderer)
+                # tüm program modundaki gibi son tanım kazanır: gölgelenen tanımın
+                # CFG hataları ve çağrı kenarları sayılmaz (ilk tanımın sırası korunur)
+                last_defs[name] = (fc.errors, fc.calls)
 
-        if res.errors:
-            for e in res.errors:
-                all_errors.append(f"[parse error] {p.name}: line={e.line} col={e.column}: {e.message}")
-            continue
+            all_errors.extend(_parse_error_msg(p.name, e) for e in errs)
+            if not errs:
+                (out_tree / f"{p.stem}.ok.txt").write_text("parsed OK\n", encoding="utf-8")
 
-        prog = res.program
-        if prog is None:
-            all_errors.append(f"[parse error] {p.name}: program is None")
-            continue
+        for name, (errors, calls) in last_defs.items():
+            _record_func(name, errors, calls, all_errors, with_errors, call_edges)
 
-        (out_tree / f"{p.stem}.ok.txt").write_text("parsed OK\n", encoding="utf-8")
+    else:
+        # 1) parse all files, collect all functions (--jobs: fonksiyonlar paralel, sonuçlar giriş sırasıyla)
+        prebuilt: Dict[str, _FuncCFG] = {}
+        for res in _load_files(files, args):
+            all_errors.extend(res.errors)
+            p = Path(res.path)
+            if res.ok:
+                (out_tree / f"{p.stem}.ok.txt").write_text("parsed OK\n", encoding="utf-8")
 
-        for item in getattr(prog, "items", []):
-            if isinstance(item, FuncDef):
-                name = item.signature.name
+            for i, (name, has_body) in enumerate(res.funcs):
                 if name in func_map:
                     all_errors.append(f"[semantic] duplicate function name: {name} (file {p.name})")
-                func_map[name] = item
+                func_map[name] = res.items[i] if res.items else None
                 defined.add(name)
-                if not getattr(item, "body", None):
+                if not has_body:
                     no_body.add(name)
+                if res.cfgs:
+                    prebuilt[name] = res.cfgs[i]
 
-    # 2) build CFG for each function and render
-    for name, func in func_map.items():
-        cfg = builder.build_for_func(func)
-        if cfg.errors:
-            with_errors.add(name)
-            all_errors.extend(cfg.errors)
-
-        dot_text = cfg_to_dot(cfg)
-        dot_path = out_graph / f"{name}.dot"
-        dot_path.write_text(dot_text, encoding="utf-8")
-
-        if args.png:
-            run_dot(dot_path, out_graph / f"{name}.png")
-        if args.svg:
-            run_dot(dot_path, out_graph / f"{name}.svg")
+        if args.sema:
+            all_errors.extend(build_symbols(Program(items=list(func_map.values()))).errors)
 
-        for callee in cfg.calls:
-            call_edges.add((name, callee))
+        # 2) build CFG for each function and render
+        if args.prune:
+            order = _reachable_cfgs(args.entry, func_map, builder, _builtin_svg(args), all_errors)
+            print(f"Reachable from {args.entry}: {len(order)}; pruned: {len(func_map) - len(order)}")
+        else:
+            order = ((name, prebuilt.get(name) or _func_cfg(builder, func, _builtin_svg(args)))
+                     for name, func in func_map.items())
+        for _name, fc in order:
+            _write_func(fc, out_graph, renderer, all_errors, with_errors, call_edges)
 
     # 3) build + render call graph
     cg_dot = call_graph_to_dot(
@@ -100,18 +403,22 @@ def main() -> int:
     )
     cg_dot_path = out_dir / "call_graph.dot"
     cg_dot_path.write_text(cg_dot, encoding="utf-8")
+    if _builtin_svg(args):
+        (out_dir / "call_graph.svg").write_text(
+            call_graph_to_svg(call_edges, defined, no_body, with_errors), encoding="utf-8")
 
-    if args.png:
-        run_dot(cg_dot_path, out_dir / "call_graph.png")
-    if args.svg:
-        run_dot(cg_dot_path, out_dir / "call_graph.svg")
+    render_failed = False
+    if renderer is not None:
+        renderer.submit(cg_dot_path)
+        results = renderer.close()
+        render_failed = _report_renders(results, renderer, args.render_report)
 
     # 4) write errors
     (out_dir / "call_graph.errors.txt").write_text("\n".join(all_errors) + ("\n" if all_errors else ""), encoding="utf-8")
 
     print(f"OK. out_dir={out_dir.resolve()}")
-    print(f"Functions: {len(func_map)}; edges: {len(call_edges)}; errors: {len(all_errors)}")
-    return 0
+    print(f"Functions: {len(defined)}; edges: {len(call_edges)}; errors: {len(all_errors)}")
+    return 1 if render_failed else 0
 
 
 if __name__ == "__main__":
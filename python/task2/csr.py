@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .cfg import CFG
+
+# Kenar türleri (succ_kind / pred_edge üzerinden): küçük int kodlar
+EDGE_DEFAULT, EDGE_TRUE, EDGE_FALSE, EDGE_BREAK = range(4)
+EDGE_LABELS: Tuple[Optional[str], ...] = (None, "True", "False", "break")
+_KIND_OF: Dict[Optional[str], int] = {lab: k for k, lab in enumerate(EDGE_LABELS)}
+
+
+def edge_kind(label: Optional[str]) -> int:
+    try:
+        return _KIND_OF[label]
+    except KeyError:
+        raise ValueError(f"unknown CFG edge label: {label!r}") from None
+
+
+@dataclass
+class CSRCFG:
+    """
+    CFG'nin sonlandırılmış, dizi tabanlı (CSR) biçimi. Düğümler 0..n-1 yoğun
+    indekslerdir (ids[i] = orijinal blok id'si). i düğümünün kenarları
+    succ_off[i]:succ_off[i+1] aralığındadır; hedefler succ_dst, türler succ_kind.
+    Önceller aynı düzende pred_off/pred_src; pred_edge[j] o kenarın succ_*
+    dizilerindeki indeksidir (tür: succ_kind[pred_edge[j]]).
+
+    Kenar başına tuple/nesne yok; kenar sırası CFG'deki succs sırasıyla aynıdır.
+    """
+    name: str
+    ids: array                  # i -> blok id
+    labels: List[str]
+    entry: int                  # indeks (-1 = yok)
+    exit: int
+    succ_off: array             # n + 1
+    succ_dst: array             # E
+    succ_kind: array            # E, 'B'
+    pred_off: array             # n + 1
+    pred_src: array             # E
+    pred_edge: array            # E
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.succ_dst)
+
+    def index_of(self, block_id: int) -> int:
+        # CFGBuilder id'leri zaten 0..n-1; değilse tek seferlik arama
+        ids = self.ids
+        if 0 <= block_id < len(ids) and ids[block_id] == block_id:
+            return block_id
+        try:
+            return ids.index(block_id)
+        except ValueError:
+            raise KeyError(block_id) from None
+
+    def succs(self, i: int) -> array:
+        return self.succ_dst[self.succ_off[i]:self.succ_off[i + 1]]
+
+    def preds(self, i: int) -> array:
+        return self.pred_src[self.pred_off[i]:self.pred_off[i + 1]]
+
+    def out_degree(self, i: int) -> int:
+        return self.succ_off[i + 1] - self.succ_off[i]
+
+    def in_degree(self, i: int) -> int:
+        return self.pred_off[i + 1] - self.pred_off[i]
+
+    def iter_edges(self) -> Iterator[Tuple[int, int, int]]:
+        """(src, dst, kind) üçlüleri, CFG sırasıyla."""
+        off, dst, kind = self.succ_off, self.succ_dst, self.succ_kind
+        for u in range(len(self.labels)):
+            for e in range(off[u], off[u + 1]):
+                yield u, dst[e], kind[e]
+
+    def nbytes(self) -> int:
+        """Dizilerin ham boyutu (etiket stringleri hariç)."""
+        return sum(
+            a.itemsize * len(a) for a in (
+                self.ids, self.succ_off, self.succ_dst, self.succ_kind,
+                self.pred_off, self.pred_src, self.pred_edge,
+            )
+        )
+
+
+def _index_code(n: int) -> str:
+    # en küçük yeterli işaretsiz tür
+    return "H" if n < 1 << 16 else "I" if n < 1 << 32 else "Q"
+
+
+def build_csr(cfg: CFG) -> CSRCFG:
+    """CFG -> CSRCFG, O(V + E): succ'lar tek geçiş, pred'ler sayma sıralaması."""
+    blocks = cfg.blocks
+    n = len(blocks)
+    ids = array("q", blocks)
+    if all(bid == i for i, bid in enumerate(ids)):
+        index = None
+    else:
+        index = {bid: i for i, bid in enumerate(ids)}
+
+    n_edges = 0
+    for b in blocks.values():
+        n_edges += len(b.succs)
+    code = _index_code(max(n, n_edges) + 1)
+
+    labels: List[str] = []
+    off: List[int] = [0]
+    dst: List[int] = []
+    kinds: List[int] = []
+    in_deg = [0] * (n + 1)
+    kind_of = _KIND_OF
+
+    for b in blocks.values():
+        labels.append(b.label)
+        for to, lab in b.succs:
+            v = to if index is None else index[to]
+            dst.append(v)
+            k = kind_of.get(lab)
+            kinds.append(edge_kind(lab) if k is None else k)
+            in_deg[v + 1] += 1
+        off.append(len(dst))
+
+    # pred_off = in-degree önek toplamı; sonra her kenar kendi yuvasına
+    for i in range(n):
+        in_deg[i + 1] += in_deg[i]
+    fill = in_deg[:n]
+    src = [0] * n_edges
+    edge = [0] * n_edges
+    for u in range(n):
+        for e in range(off[u], off[u + 1]):
+            v = dst[e]
+            slot = fill[v]
+            src[slot] = u
+            edge[slot] = e
+            fill[v] = slot + 1
+
+    succ_off = array(code, off)
+    succ_dst = array(code, dst)
+    succ_kind = array("B", kinds)
+    pred_off = array(code, in_deg)
+    pred_src = array(code, src)
+    pred_edge = array(code, edge)
+
+    def idx(bid: int) -> int:
+        if bid < 0:
+            return -1
+        return bid if index is None else index[bid]
+
+    return CSRCFG(
+        name=cfg.name, ids=ids, labels=labels,
+        entry=idx(cfg.entry), exit=idx(cfg.exit),
+        succ_off=succ_off, succ_dst=succ_dst, succ_kind=succ_kind,
+        pred_off=pred_off, pred_src=pred_src, pred_edge=pred_edge,
+    )
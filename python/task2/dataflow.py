@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from task1.ast import Assign, Binary, CallOrIndexer, ExprStmt, Place, Unary, VarDecl
+from task1.visitor import iter_tree
+
+from .builder import expr_str
+from .csr import CSRCFG
+from .graph import csr_postorder
+
+if TYPE_CHECKING:
+    from .analysis import LoopForest
+    from .cfg import CFG
+
+# Bitset tabanlı dataflow. Olgular yoğun bitset'lerdir: Python int'i, bit i =
+# i numaralı değişken / tanım / ifade. Aktarım her blokta OUT = GEN | (IN & KEEP)
+# (KEEP = ~KILL, evrene göre maskelenmiş); birleşim (meet) | ya da &.
+# Çözücü CSR üzerinde öncelikli iş listesidir: sırası en küçük bekleyen düğüm
+# önce işlenir. Sıra döngü-bitişik RPO'dur (priority_order): her döngünün
+# gövdesi, döngüden sonra gelen koddan önce biter; geri problemlerde ters
+# çevrilir. Düz RPO'da while'dan sonraki kod gövdeden önce gelir ve her
+# döngü turunda yeniden işlenir (iç içe döngülerde çarpımsal).
+# Olgu girdisi: CFGBlock.nodes (builder'ın bloğa koyduğu deyim/koşul AST'leri).
+
+
+class Universe:
+    """İsim <-> bit numarası (değişkenler, ifadeler, ...)."""
+
+    def __init__(self, names: Iterable[Any] = ()) -> None:
+        self.names: List[Any] = []
+        self.index: Dict[Any, int] = {}
+        for n in names:
+            self.add(n)
+
+    def add(self, name: Any) -> int:
+        i = self.index.get(name)
+        if i is None:
+            i = self.index[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def mask(self) -> int:
+        return (1 << len(self.names)) - 1
+
+    def bits(self, names: Iterable[Any]) -> int:
+        x = 0
+        index = self.index
+        for n in names:
+            x |= 1 << index[n]
+        return x
+
+    def decode(self, bits: int) -> List[Any]:
+        return [self.names[i] for i in iter_bits(bits)]
+
+
+def iter_bits(x: int) -> Iterator[int]:
+    """Kurulu bitlerin numaraları (artan)."""
+    while x:
+        low = x & -x
+        yield low.bit_length() - 1
+        x ^= low
+
+
+@dataclass
+class DataflowResult:
+    """
+    inp[i] / out[i]: CSR i düğümünün girişindeki / çıkışındaki olgular
+    (yönden bağımsız: geri problemlerde de inp bloğun başıdır).
+    visits: aktarım fonksiyonu kaç kez değerlendirildi.
+    """
+    g: CSRCFG
+    inp: List[int]
+    out: List[int]
+    visits: int
+
+    def in_of(self, block_id: int) -> int:
+        return self.inp[self.g.index_of(block_id)]
+
+    def out_of(self, block_id: int) -> int:
+        return self.out[self.g.index_of(block_id)]
+
+
+def priority_order(g: CSRCFG, loops: Optional[LoopForest] = None) -> List[int]:
+    """
+    ENTRY'den RPO; loops verilirse döngü-bitişik: düğümün anahtarı, dıştan içe
+    onu içeren döngü başlıklarının RPO sıraları + kendi sırasıdır. Erişilemeyen
+    düğümler sonda.
+    """
+    n = g.num_nodes
+    order = csr_postorder(g.entry, g.succ_off, g.succ_dst, n)[::-1] if 0 <= g.entry < n else []
+    if len(order) < n:
+        seen = bytearray(n)
+        for u in order:
+            seen[u] = 1
+        order.extend(u for u in range(n) if not seen[u])
+    if loops is None or not loops.loops:
+        return order
+    rank = [0] * n
+    for k, u in enumerate(order):
+        rank[u] = k
+    heads = [rank[lp.header] for lp in loops.loops]
+    parent = [lp.parent for lp in loops.loops]
+    keys: List[Tuple[int, ...]] = []
+    for v in range(n):
+        chain = [rank[v]]
+        li = loops.loop_of[v]
+        while li >= 0:
+            chain.append(heads[li])
+            li = parent[li]
+        chain.reverse()
+        keys.append(tuple(chain))
+    return sorted(range(n), key=keys.__getitem__)
+
+
+def solve(
+    g: CSRCFG,
+    gen: Sequence[int],
+    kill: Sequence[int],
+    universe: int,
+    forward: bool = True,
+    union: bool = True,
+    boundary: int = 0,
+    order: Optional[Sequence[int]] = None,
+) -> DataflowResult:
+    """
+    Genel iş listesi çözücüsü. universe: tüm bitlerin maskesi (kesişim
+    problemlerinde başlangıç değeri, KILL tümleyeni için). boundary: ileri
+    problemde ENTRY girişi, geri problemde EXIT çıkışı. order: ileri yöndeki
+    öncelik sırası (tüm düğümler; verilmezse düz RPO), geri problemde ters
+    çevrilir. Kökten erişilemeyen düğümler de çözülür.
+    """
+    n = g.num_nodes
+    root = g.entry if forward else g.exit
+    keep = [universe & ~k for k in kill]
+    if forward:
+        in_off, in_src = g.pred_off, g.pred_src
+        out_off, out_dst = g.succ_off, g.succ_dst
+    else:
+        in_off, in_src = g.succ_off, g.succ_dst
+        out_off, out_dst = g.pred_off, g.pred_src
+
+    order = list(order) if order is not None else priority_order(g)
+    if not forward:
+        order.reverse()
+    rank = [0] * n
+    for k, u in enumerate(order):
+        rank[u] = k
+
+    init = 0 if union else universe
+    before = [init] * n             # birleşim tarafı (ileri: IN, geri: OUT)
+    after = [init] * n              # aktarım sonucu (ileri: OUT, geri: IN)
+    if 0 <= root < n:
+        before[root] = boundary
+
+    heap = list(range(n))           # sıralı liste zaten bir heap
+    queued = bytearray(b"\x01") * n
+    visits = 0
+    while heap:
+        u = order[heappop(heap)]
+        queued[u] = 0
+        visits += 1
+        lo, hi = in_off[u], in_off[u + 1]
+        if u == root:
+            x = boundary
+        elif lo == hi:
+            x = init
+        elif union:
+            x = 0
+            for j in range(lo, hi):
+                x |= after[in_src[j]]
+        else:
+            x = universe
+            for j in range(lo, hi):
+                x &= after[in_src[j]]
+        before[u] = x
+        y = gen[u] | (x & keep[u])
+        if y != after[u]:
+            after[u] = y
+            for j in range(out_off[u], out_off[u + 1]):
+                v = out_dst[j]
+                if not queued[v]:
+                    queued[v] = 1
+                    heappush(heap, rank[v])
+
+    if forward:
+        return DataflowResult(g=g, inp=before, out=after, visits=visits)
+    return DataflowResult(g=g, inp=after, out=before, visits=visits)
+
+
+# ---- deyim etkileri (AST'den) ----
+
+@dataclass
+class Effect:
+    uses: List[str]                 # okunan değişkenler (tanımlardan önce değerlendirilir)
+    defs: List[str]                 # tam olarak yazılan değişkenler
+    exprs: List[Tuple[str, Tuple[str, ...]]]    # (ifade metni, okuduğu değişkenler), çağrısız
+
+
+def _raw_effect(node: Any) -> Tuple[List[str], List[str], List[str], List[Tuple[str, Tuple[str, ...]]]]:
+    """(düz kullanımlar, tanımlar, çağrılan isimler, saf ifadeler)."""
+    if isinstance(node, VarDecl):
+        return [], list(node.names), [], []
+    root = node.expr if isinstance(node, ExprStmt) else node
+
+    uses: List[str] = []
+    defs: List[str] = []
+    callees: List[str] = []
+    parent: Dict[int, Any] = {}
+    impure: Set[int] = set()
+    ops: List[Any] = []
+    for cur, par, fname, _i in iter_tree(root):
+        if par is not None:
+            parent[id(cur)] = par
+        if isinstance(cur, Place):
+            if isinstance(par, Assign) and fname == "lhs":
+                # a(i) = ... ise lhs CallOrIndexer'dır: a kısmen yazılır, tanım sayılmaz
+                defs.append(cur.name)
+            elif isinstance(par, CallOrIndexer) and fname == "callee":
+                callees.append(cur.name)
+            else:
+                uses.append(cur.name)
+        elif isinstance(cur, (Binary, Unary)):
+            ops.append(cur)
+        elif isinstance(cur, (CallOrIndexer, Assign)):
+            # yan etkili olabilir: kendisi ve ataları kullanılabilir ifade değil
+            # (CallOrIndexer dizi okuması da olabilir; ihtiyatlı davranılır)
+            p = cur
+            while p is not None and id(p) not in impure:
+                impure.add(id(p))
+                p = parent.get(id(p))
+    exprs: List[Tuple[str, Tuple[str, ...]]] = []
+    for op in ops:
+        if id(op) in impure:
+            continue
+        names = tuple(sorted({c.name for c in _places(op)}))
+        exprs.append((expr_str(op), names))
+    return uses, defs, callees, exprs
+
+
+def _places(e: Any) -> Iterator[Place]:
+    for cur, _par, _f, _i in iter_tree(e):
+        if isinstance(cur, Place):
+            yield cur
+
+
+def block_effects(cfg: CFG) -> List[List[Effect]]:
+    """
+    CSR sırasıyla (cfg.blocks sırası) her bloğun deyim etkileri. Çağrı
+    konumundaki bir isim (f(x) / a(i)) fonksiyonda değişken olarak da geçiyorsa
+    dizi okuması sayılır ve kullanım olur; yoksa fonksiyon çağrısıdır.
+    """
+    raw = [[_raw_effect(nd) for nd in b.nodes] for b in cfg.blocks.values()]
+    variables: Set[str] = set()
+    for effs in raw:
+        for uses, defs, _callees, _exprs in effs:
+            variables.update(uses)
+            variables.update(defs)
+    out: List[List[Effect]] = []
+    for effs in raw:
+        row = []
+        for uses, defs, callees, exprs in effs:
+            arr = [c for c in callees if c in variables]
+            row.append(Effect(uses=uses + arr if arr else uses, defs=defs, exprs=exprs))
+        out.append(row)
+    return out
+
+
+def _variables(effects: List[List[Effect]], extra: Iterable[str] = ()) -> Universe:
+    u = Universe()
+    for effs in effects:
+        for e in effs:
+            for v in e.uses:
+                u.add(v)
+            for v in e.defs:
+                u.add(v)
+    for v in extra:
+        u.add(v)
+    return u
+
+
+# ---- hazır analizler ----
+
+@dataclass
+class Liveness:
+    """Canlı değişkenler (geri, birleşim). Fonksiyon adı (dönüş değeri) EXIT'te canlıdır."""
+    vars: Universe
+    result: DataflowResult
+
+    def live_in(self, block_id: int) -> List[str]:
+        return self.vars.decode(self.result.in_of(block_id))
+
+    def live_out(self, block_id: int) -> List[str]:
+        return self.vars.decode(self.result.out_of(block_id))
+
+
+def liveness(cfg: CFG) -> Liveness:
+    an = cfg.analysis()
+    g, effects = an.csr, an.effects
+    vs = _variables(effects, [cfg.name])
+    index = vs.index
+    gen: List[int] = []
+    kill: List[int] = []
+    for effs in effects:
+        use = 0
+        dfn = 0
+        for e in effs:
+            for v in e.uses:
+                b = 1 << index[v]
+                if not dfn & b:
+                    use |= b
+            for v in e.defs:
+                dfn |= 1 << index[v]
+        gen.append(use)
+        kill.append(dfn)
+    res = solve(g, gen, kill, vs.mask, forward=False, union=True,
+                boundary=1 << index[cfg.name], order=an.dataflow_order)
+    return Liveness(vars=vs, result=res)
+
+
+@dataclass
+class ReachingDefs:
+    """
+    Erişen tanımlar (ileri, birleşim). defs[i] = (blok id, bloktaki deyim sırası,
+    değişken); bit i o tanımdır. dim de tanım sayılır.
+    """
+    defs: List[Tuple[int, int, str]]
+    result: DataflowResult
+
+    def reaching_in(self, block_id: int) -> List[Tuple[int, int, str]]:
+        return [self.defs[i] for i in iter_bits(self.result.in_of(block_id))]
+
+
+def reaching_definitions(cfg: CFG) -> ReachingDefs:
+    an = cfg.analysis()
+    g, effects = an.csr, an.effects
+    defs: List[Tuple[int, int, str]] = []
+    of_var: Dict[str, int] = {}         # değişken -> tüm tanımlarının maskesi
+    block_defs: List[List[Tuple[str, int]]] = []
+    for bid, effs in zip(g.ids, effects):
+        row = []
+        for k, e in enumerate(effs):
+            for v in e.defs:
+                d = len(defs)
+                defs.append((bid, k, v))
+                of_var[v] = of_var.get(v, 0) | (1 << d)
+                row.append((v, d))
+        block_defs.append(row)
+    gen: List[int] = []
+    kill: List[int] = []
+    for row in block_defs:
+        last: Dict[str, int] = {}
+        for v, d in row:
+            last[v] = d                 # bloktaki son tanım dışarı çıkar
+        x = 0
+        for d in last.values():
+            x |= 1 << d
+        k = 0
+        for v in last:
+            k |= of_var[v]
+        gen.append(x)
+        kill.append(k & ~x)
+    res = solve(g, gen, kill, (1 << len(defs)) - 1, forward=True, union=True, order=an.dataflow_order)
+    return ReachingDefs(defs=defs, result=res)
+
+
+@dataclass
+class AvailableExprs:
+    """Kullanılabilir ifadeler (ileri, kesişim). İfadeler metinleriyle (cfg_to_dot biçimi) numaralı."""
+    exprs: Universe
+    result: DataflowResult
+
+    def available_in(self, block_id: int) -> List[str]:
+        return self.exprs.decode(self.result.in_of(block_id))
+
+
+def available_expressions(cfg: CFG) -> AvailableExprs:
+    an = cfg.analysis()
+    g, effects = an.csr, an.effects
+    ex = Universe()
+    uses_var: Dict[str, int] = {}       # değişken -> onu okuyan ifadelerin maskesi
+    for effs in effects:
+        for e in effs:
+            for text, names in e.exprs:
+                if text not in ex.index:
+                    b = 1 << ex.add(text)
+                    for v in names:
+                        uses_var[v] = uses_var.get(v, 0) | b
+    index = ex.index
+    gen: List[int] = []
+    kill: List[int] = []
+    for effs in effects:
+        avail = 0
+        k = 0
+        for e in effs:
+            for text, _names in e.exprs:
+                avail |= 1 << index[text]
+            for v in e.defs:
+                m = uses_var.get(v, 0)
+                avail &= ~m             # x = x + 1: (x + 1) artık geçersiz
+                k |= m
+        gen.append(avail)
+        kill.append(k)
+    res = solve(g, gen, kill, ex.mask, forward=True, union=False, order=an.dataflow_order)
+    return AvailableExprs(exprs=ex, result=res)
@@ -1,13 +1,20 @@
 # src/task2/dot_blockify.py
 from __future__ import annotations
 import argparse
-import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-NODE_RE = re.compile(r'^\s*n(\d+)\s*\[label="(.*)"\];\s*$')
-EDGE_RE = re.compile(r'^\s*n(\d+)\s*->\s*n(\d+)(?:\s*\[label="(True|False)"\])?;\s*$')
+from task1.ast import FuncDef
+from task1.astbin import SUFFIX as AST_SUFFIX, AstFormatError, read_ast
+from task1.parser import BACKENDS, parse_text
+from task1.source import read_source
+
+from .builder import BlockCFGBuilder
+from .dot_parse import load_dot
+from .graph import iter_dfs
+from .render import blocks_to_dot, cfg_blocks_to_dot, run_dot
+from .svg import blocks_to_svg
 
 @dataclass
 class DotCFG:
@@ -15,22 +22,9 @@ class DotCFG:
     edges: List[Tuple[int, int, Optional[str]]]
 
 def parse_dot(path: Path) -> DotCFG:
-    nodes: Dict[int, str] = {}
-    edges: List[Tuple[int, int, Optional[str]]] = []
-
-    for line in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        m = NODE_RE.match(line)
-        if m:
-            nid = int(m.group(1))
-            lab = m.group(2)
-            nodes[nid] = lab
-            continue
-        m = EDGE_RE.match(line)
-        if m:
-            a = int(m.group(1)); b = int(m.group(2))
-            el = m.group(3) if m.group(3) else None
-            edges.append((a, b, el))
-    return DotCFG(nodes=nodes, edges=edges)
+    # etiketler kaçışları çözülmüş metin (çok satırlı olabilir)
+    g = load_dot(path)
+    return DotCFG(nodes=dict(g.labeled_nodes()), edges=g.edges())
 
 def build_maps(cfg: DotCFG):
     out_map: Dict[int, List[Tuple[int, Optional[str]]]] = {k: [] for k in cfg.nodes}
@@ -65,13 +59,14 @@ def blockify(cfg: DotCFG):
         return bid
 
     # simple forward walk from entry over all nodes (deterministic)
-    visited = set()
-
-    def walk(n: int):
-        if n in visited:
-            return
-        visited.add(n)
+    def succ_blocks(last: int) -> Iterator[int]:
+        # kardeşler tembel: bir sonraki ancak öncekinin alt ağacı bitince blok alır
+        for nxt, _ in out_map.get(last, []):
+            if nxt not in block_id_of:
+                start_new_block(nxt)
+            yield nxt
 
+    def walk(n: int) -> Iterator[int]:
         # decide block start
         if n not in block_id_of:
             start_new_block(n)
@@ -95,14 +90,11 @@ def blockify(cfg: DotCFG):
             blocks[bid].append(nxt)
             block_id_of[nxt] = bid
 
-        # recurse to successors of last node in block
-        last = blocks[bid][-1]
-        for nxt, _ in out_map.get(last, []):
-            if nxt not in block_id_of:
-                start_new_block(nxt)
-            walk(nxt)
+        # successors of last node in block (açık yığınlı DFS devam eder)
+        return succ_blocks(blocks[bid][-1])
 
-    walk(entry)
+    for _ in iter_dfs([entry], walk):
+        pass
 
     # build block edges (from last node)
     bedges: List[Tuple[int, int, Optional[str]]] = []
@@ -113,47 +105,67 @@ def blockify(cfg: DotCFG):
 
     return blocks, bedges
 
+def block_lines(cfg: DotCFG, blocks):
+    return [(bid, [ln for n in ns for ln in cfg.nodes.get(n, f"n{n}").split("\n")]) for bid, ns in enumerate(blocks)]
+
 def emit_block_dot(cfg: DotCFG, blocks, bedges, out_path: Path):
-    lines: List[str] = []
-    lines.append('digraph CFG {')
-    lines.append('  node [shape=box];')
-
-    # node labels
-    for bid, ns in enumerate(blocks):
-        body = []
-        for n in ns:
-            body.append(cfg.nodes.get(n, f"n{n}").replace('"', r'\"'))
-        label = "\\l".join(body) + "\\l"
-        lines.append(f'  b{bid} [label="#{bid}\\l{label}"];')
-
-    # edges with "default" and "on condition"
-    for a, b, el in bedges:
-        if el is None:
-            lines.append(f'  b{a} -> b{b} [label="default"];')
-        else:
-            lines.append(f'  b{a} -> b{b} [label="on {el}"];')
-
-    lines.append('}')
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    out_path.write_text(blocks_to_dot(block_lines(cfg, blocks), bedges), encoding="utf-8")
+
+def load_function(path: Path, name: str, backend: str = "lark") -> FuncDef:
+    if path.suffix == AST_SUFFIX:
+        program = read_ast(path)
+    else:
+        res = parse_text(read_source(path), inline=True, backend=backend)
+        if res.errors:
+            e = res.errors[0]
+            raise ValueError(f"parse error: line={e.line} col={e.column}: {e.message}")
+        program = res.program
+    for item in program.items:
+        if isinstance(item, FuncDef) and item.signature.name == name:
+            return item
+    raise ValueError(f"function not found: {name}")
 
 def main():
     ap = argparse.ArgumentParser()
-    ap.add_argument("in_dot", help="input DOT (e.g. out2/graph/main.dot)")
+    ap.add_argument("input", help="input .v3 / .v3ast source, or a task2 DOT (e.g. out2/graph/main.dot)")
     ap.add_argument("out_dot", help="output DOT (e.g. out2/graph/main_bb.dot)")
+    ap.add_argument("--func", default="main", help="function to render (source inputs)")
+    ap.add_argument("--backend", choices=BACKENDS, default="lark", help="parser backend (source inputs)")
     ap.add_argument("--png", action="store_true", help="also render PNG using graphviz dot")
+    ap.add_argument("--svg", action="store_true", help="also write SVG with the built-in layout (no graphviz)")
     args = ap.parse_args()
 
-    in_dot = Path(args.in_dot)
+    inp = Path(args.input)
     out_dot = Path(args.out_dot)
-    cfg = parse_dot(in_dot)
-    blocks, bedges = blockify(cfg)
-    emit_block_dot(cfg, blocks, bedges, out_dot)
+    if inp.suffix == ".dot":
+        # eski yol: deyim düzeyindeki DOT'u geri okuyup birleştirir
+        cfg = parse_dot(inp)
+        blocks, bedges = blockify(cfg)
+        emit_block_dot(cfg, blocks, bedges, out_dot)
+        if args.svg:
+            svg_text = blocks_to_svg(block_lines(cfg, blocks), bedges)
+    else:
+        # temel bloklar doğrudan CFGBuilder'dan: burada sadece çizim
+        try:
+            func = load_function(inp, args.func, args.backend)
+        except (ValueError, AstFormatError) as e:
+            print(f"[error] {inp.name}: {e}")
+            return 2
+        bcfg = BlockCFGBuilder().build_for_func(func)
+        out_dot.write_text(cfg_blocks_to_dot(bcfg), encoding="utf-8")
+        if args.svg:
+            svg_text = blocks_to_svg([(bid, b.stmts or [b.label]) for bid, b in bcfg.blocks.items()],
+                                     [(bid, to, lab) for bid, b in bcfg.blocks.items() for to, lab in b.succs])
+
+    if args.svg:
+        svg = out_dot.with_suffix(".svg")
+        svg.write_text(svg_text, encoding="utf-8")
+        print("SVG:", svg.resolve())
 
     if args.png:
         # requires graphviz 'dot' in PATH
         png = out_dot.with_suffix(".png")
-        import subprocess
-        subprocess.check_call(["dot", "-Tpng", str(out_dot), "-o", str(png)])
+        run_dot(out_dot, png)
         print("PNG:", png.resolve())
 
     print("OK:", out_dot.resolve())
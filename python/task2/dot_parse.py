@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+import io
+import re
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Union
+
+# Araçlarımızın yazdığı DOT alt kümesi için tek geçişli okuyucu (render.py,
+# dot_blockify, call graph çıktıları). Dosya parça parça okunur ve tek bir
+# düzenli ifadeyle belirteçlere bölünür: tırnaklı dizgiler (kaçışlar ve çok
+# satırlı değerler dahil), ID'ler, sayılar, -> / -- ve noktalama; yorumlar
+# (//, /* */, #) atlanır. Bir belirteç parça sınırına denk gelirse tampon
+# büyütülüp yeniden eşlenir, yani satır sınırlarına güvenilmez.
+#
+# Desteklenenler: [strict] graph/digraph, düğüm ve kenar deyimleri (zincir
+# a -> b -> c dahil), öznitelik listeleri, graph/node/edge varsayılanları ve
+# a=b graph öznitelikleri (yok sayılır), "a" + "b" birleştirme. Alt grafikler,
+# portlar ve HTML etiketleri DotSyntaxError verir. Dosyadaki ilk grafik okunur.
+
+PathLike = Union[str, Path]
+
+CHUNK = 1 << 20
+
+_TOKEN_RE = re.compile(
+    r'(?:\s+|//[^\n]*|/\*.*?\*/|#[^\n]*)*'
+    r'("[^"\\]*(?:\\.[^"\\]*)*"|->|--|[\[\]{};=,:+<]|[^\W\d]\w*'
+    r'|-?(?:\.\d+|\d+(?:\.\d*)?))',
+    re.S,
+)
+_TRAILER_RE = re.compile(r'(?:\s+|//[^\n]*|/\*.*?\*/|#[^\n]*)*\Z', re.S)
+# label (escString): \" \\ ve satır sonları (\n, \l, \r); satır devamı (\<LF>) silinir
+_LABEL_ESC_RE = re.compile(r'\\(.)', re.S)
+_LABEL_ESC = {'"': '"', "\\": "\\", "n": "\n", "l": "\n", "r": "\n", "\n": ""}
+# diğer tırnaklı ID'lerde yalnızca \" ve satır devamı kaçıştır
+_ID_ESC_RE = re.compile(r'\\(["\n])')
+
+_PUNCT = frozenset("[]{};=,:+<") | {"->", "--"}
+_KEYWORDS = frozenset({"graph", "digraph", "subgraph", "node", "edge", "strict"})
+
+# hızlı yol: ';' ile biten tek düğüm / tek kenar deyimi, en fazla bir label özniteliği
+_STR = r'[^"\\]*(?:\\.[^"\\]*)*'
+_ID = r'(?:[^\W\d]\w*|"' + _STR + r'"|-?(?:\.\d+|\d+(?:\.\d*)?))'
+_STMT_RE = re.compile(
+    r'\s*(' + _ID + r')\s*(?:(->|--)\s*(' + _ID + r')\s*)?'
+    r'(?:\[\s*label\s*=\s*"(' + _STR + r')"\s*\]\s*)?;',
+    re.S,
+)
+
+
+class DotSyntaxError(ValueError):
+    def __init__(self, message: str, line: int, path: str = "") -> None:
+        self.line = line
+        self.path = path
+        where = f"{path}:{line}" if path else f"line {line}"
+        super().__init__(f"{where}: {message}")
+
+
+def _label_sub(m: "re.Match[str]") -> str:
+    c = m.group(1)
+    return _LABEL_ESC.get(c, m.group(0))
+
+
+def unescape_label(raw: str) -> str:
+    """
+    Tırnaksız label değeri -> metin. Satır sonu kaçışları satırları bitirir:
+    sondaki tek satır sonu atılır ("a\\lb\\l" -> "a\\nb"), bilinmeyen kaçışlar
+    (\\N, \\G, ...) olduğu gibi kalır.
+    """
+    if "\\" not in raw:
+        return raw
+    text = _LABEL_ESC_RE.sub(_label_sub, raw)
+    if raw[-1] in "nlr" and text.endswith("\n"):
+        # sondaki karakter gerçekten kaçış mı (önündeki \ sayısı tek mi)?
+        k = len(raw) - 2
+        while k >= 0 and raw[k] == "\\":
+            k -= 1
+        if (len(raw) - 2 - k) % 2:
+            text = text[:-1]
+    return text
+
+
+def _id_sub(m: "re.Match[str]") -> str:
+    return "" if m.group(1) == "\n" else '"'
+
+
+def _id_text(inner: str) -> str:
+    """Tırnaklı ID'nin içi -> ad (yalnızca \\" ve satır devamı kaçıştır)."""
+    return _ID_ESC_RE.sub(_id_sub, inner) if "\\" in inner else inner
+
+
+class DotTokenizer:
+    """
+    Akış belirteçleyici. token() sıradaki belirteci verir (dosya sonunda None);
+    tırnaklı dizgiler tırnaklarıyla ve kaçışları çözülmeden gelir. buf/pos
+    okunmamış tampon ve konumdur (okuyucunun deyim hızlı yolu doğrudan onları
+    eşler); parça sınırında kalan belirteç için tampon _fill() ile uzatılır.
+    """
+
+    def __init__(self, stream: TextIO, chunk: int = CHUNK, path: str = "") -> None:
+        self.stream = stream
+        self.chunk = chunk
+        self.path = path
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self._base_line = 1         # buf[0]'ın satırı
+
+    def line(self) -> int:
+        """Geçerli konumun satırı (hata iletileri için)."""
+        return self._base_line + self.buf.count("\n", 0, self.pos)
+
+    def error(self, message: str) -> DotSyntaxError:
+        return DotSyntaxError(message, self.line(), self.path)
+
+    def _fill(self) -> bool:
+        more = self.stream.read(self.chunk)
+        if not more:
+            self.eof = True
+            return False
+        buf, pos = self.buf, self.pos
+        self._base_line += buf.count("\n", 0, pos)
+        self.buf = buf[pos:] + more
+        self.pos = 0
+        # uzun bir belirteçte (ör. çok büyük etiket) her parçada baştan taramamak için
+        self.chunk = max(self.chunk, len(self.buf))
+        return True
+
+    def token(self) -> Optional[str]:
+        while True:
+            m = _TOKEN_RE.match(self.buf, self.pos)
+            if m is not None and (self.eof or m.end() < len(self.buf)):
+                self.pos = m.end()
+                return m.group(1)
+            if not self.eof:
+                self._fill()
+                continue
+            if _TRAILER_RE.match(self.buf, self.pos):
+                return None
+            raise self.error(f"unexpected input: {self.buf[self.pos:self.pos + 20]!r}")
+
+    def __iter__(self) -> Iterator[str]:
+        t = self.token()
+        while t is not None:
+            yield t
+            t = self.token()
+
+
+@dataclass
+class DotGraph:
+    """
+    Okunan grafiğin sıkı biçimi. Düğümler ilk görüldükleri sırayla 0..n-1
+    indekslidir: names[i] DOT adı, labels[i] label özniteliği (kaçışları
+    çözülmüş metin; yoksa None). Kenarlar dosya sırasıyla edge_src/edge_dst
+    (düğüm indeksleri) ve edge_labels'tadır.
+    """
+    name: Optional[str] = None
+    directed: bool = True
+    names: List[str] = field(default_factory=list)
+    labels: List[Optional[str]] = field(default_factory=list)
+    edge_src: array = field(default_factory=lambda: array("I"))
+    edge_dst: array = field(default_factory=lambda: array("I"))
+    edge_labels: List[Optional[str]] = field(default_factory=list)
+    index: Dict[str, int] = field(default_factory=dict)     # ad -> indeks
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_src)
+
+    @cached_property
+    def numeric_ids(self) -> List[Optional[int]]:
+        """i -> "n12" biçimli (cfg_to_dot) adların sayısı; başka adlar None."""
+        return [int(name[1:]) if name[:1] == "n" and name[1:].isdecimal() else None for name in self.names]
+
+    def labeled_nodes(self) -> List[Tuple[int, str]]:
+        """(sayısal id, label): label'ı olan, sayısal adlı düğümler."""
+        return [(nid, lab) for nid, lab in zip(self.numeric_ids, self.labels)
+                if nid is not None and lab is not None]
+
+    def edges(self) -> List[Tuple[int, int, Optional[str]]]:
+        """(sayısal kaynak, sayısal hedef, label) dosya sırasıyla; sayısal olmayan uçlar atlanır."""
+        ids = self.numeric_ids
+        out = [(ids[a], ids[b], lab) for a, b, lab in zip(self.edge_src, self.edge_dst, self.edge_labels)]
+        if None in ids:
+            out = [e for e in out if e[0] is not None and e[1] is not None]
+        return out
+
+
+def _read_graph(tok: DotTokenizer) -> DotGraph:
+    g = DotGraph()
+    index = g.index
+    names, labels = g.names, g.labels
+    src_append, dst_append, elab_append = g.edge_src.append, g.edge_dst.append, g.edge_labels.append
+    back: List[str] = []            # geri itilen bakış belirteci (en fazla bir)
+
+    def node(name: str) -> int:
+        i = index.get(name)
+        if i is None:
+            i = index[name] = len(names)
+            names.append(name)
+            labels.append(None)
+        return i
+
+    def take() -> str:
+        if back:
+            return back.pop()
+        t = tok.token()
+        if t is None:
+            raise tok.error("unexpected end of file")
+        return t
+
+    def quoted(t: str) -> str:
+        # "a" + "b" + ...: ham (kaçışlı) içerik
+        s = t[1:-1]
+        t = take()
+        while t == "+":
+            t = take()
+            if t[0] != '"':
+                raise tok.error("expected a string after '+'")
+            s += t[1:-1]
+            t = take()
+        back.append(t)
+        return s
+
+    def ident(t: str) -> str:
+        if t[0] == '"':
+            return _id_text(quoted(t))
+        if t in _PUNCT:
+            if t == "<":
+                raise tok.error("HTML strings are not supported")
+            raise tok.error(f"expected an ID, got {t!r}")
+        return t
+
+    def attrs() -> Tuple[Optional[str], str]:
+        """"[" okunduktan sonra öznitelik listeleri; (ham label, sonraki belirteç)."""
+        label: Optional[str] = None
+        t = "["
+        while t == "[":
+            t = take()
+            while t != "]":
+                key = ident(t)
+                if take() != "=":
+                    raise tok.error(f"expected '=' after attribute {key!r}")
+                t = take()
+                if key == "label":
+                    # escString: kaçışlar unescape_label'da çözülür
+                    label = quoted(t) if t[0] == '"' else ident(t)
+                else:
+                    ident(t)
+                t = take()
+                if t == "," or t == ";":
+                    t = take()
+            t = take()
+        return label, t
+
+    def statement(t: str) -> str:
+        """Genel yol: t ile başlayan deyim; deyimden sonraki belirteci döndürür."""
+        if t == "graph" or t == "node" or t == "edge":
+            if take() != "[":
+                raise tok.error(f"expected '[' after {t!r}")
+            return attrs()[1]       # varsayılan öznitelikler yok sayılır
+        if t == "subgraph" or t == "{":
+            raise tok.error("subgraphs are not supported")
+        name = ident(t)
+        t = take()
+        if t == edge_op:
+            chain = [node(name)]
+            while t == edge_op:
+                chain.append(node(ident(take())))
+                t = take()
+            if t == ":":
+                raise tok.error("node ports are not supported")
+            lab: Optional[str] = None
+            if t == "[":
+                raw, t = attrs()
+                if raw is not None:
+                    lab = unescape_label(raw)
+            for a, b in zip(chain, chain[1:]):
+                src_append(a)
+                dst_append(b)
+                elab_append(lab)
+        elif t == "=":
+            ident(take())           # graph özniteliği (rankdir=LR ...)
+            t = take()
+        elif t == ":":
+            raise tok.error("node ports are not supported")
+        elif t == "->" or t == "--":
+            raise tok.error(f"{t!r} is not valid in a {'digraph' if g.directed else 'graph'}")
+        else:
+            i = node(name)
+            if t == "[":
+                raw, t = attrs()
+                if raw is not None:
+                    labels[i] = unescape_label(raw)
+        return t
+
+    # başlık
+    t = take()
+    if t == "strict":
+        t = take()
+    if t != "digraph" and t != "graph":
+        raise tok.error(f"expected 'graph' or 'digraph', got {t!r}")
+    g.directed = t == "digraph"
+    edge_op = "->" if g.directed else "--"
+    t = take()
+    if t != "{":
+        g.name = ident(t)
+        t = take()
+    if t != "{":
+        raise tok.error("expected '{'")
+
+    # gövde. Hızlı yol: emit ettiğimiz biçimdeki tam deyimler (a [label=".."];
+    # a -> b [label=".."];) tampon üzerinde tek eşlemeyle; gerisi belirteçlerle.
+    stmt = _STMT_RE.match
+    keywords = _KEYWORDS
+    while True:
+        if not back:
+            buf, pos = tok.buf, tok.pos
+            m = stmt(buf, pos)
+            while m is not None:
+                a, op, b, raw = m.groups()
+                if a in keywords or (op is not None and op != edge_op):
+                    break
+                pos = m.end()
+                if a[0] == '"':
+                    a = _id_text(a[1:-1])
+                i = index.get(a)
+                if i is None:
+                    i = index[a] = len(names)
+                    names.append(a)
+                    labels.append(None)
+                if op is None:
+                    if raw is not None:
+                        labels[i] = unescape_label(raw)
+                else:
+                    if b[0] == '"':
+                        b = _id_text(b[1:-1])
+                    j = index.get(b)
+                    if j is None:
+                        j = index[b] = len(names)
+                        names.append(b)
+                        labels.append(None)
+                    src_append(i)
+                    dst_append(j)
+                    elab_append(None if raw is None else unescape_label(raw))
+                m = stmt(buf, pos)
+            tok.pos = pos
+        t = take()
+        if t == "}":
+            break
+        if t == ";":
+            continue
+        t = statement(t)
+        if t == "}":
+            break
+        if t != ";":
+            back.append(t)
+    return g
+
+
+def read_dot(stream: TextIO, path: str = "", chunk: int = CHUNK) -> DotGraph:
+    return _read_graph(DotTokenizer(stream, chunk=chunk, path=path))
+
+
+def load_dot(path: PathLike, chunk: int = CHUNK) -> DotGraph:
+    """DOT dosyasını tek geçişte okur (bellekte en fazla bir parça + son belirteç)."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return read_dot(f, path=str(path), chunk=chunk)
+
+
+def parse_dot_text(text: str) -> DotGraph:
+    return read_dot(io.StringIO(text))
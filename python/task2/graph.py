@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Sequence, Set, Tuple
+
+# Ortak graf gezinmeleri: hepsi açık yığınla, özyinelemesiz (10^6 düğümlü
+# zincirlerde de recursion limit'e takılmaz). Düğümler hashable herhangi bir
+# değer; successor'lar succs(u) ile istenir. Successor iterable'ı tembel
+# tüketilir: bir sonraki kardeşe ancak öncekinin alt ağacı bitince geçilir.
+
+Succs = Callable[[Any], Iterable[Any]]
+
+
+def iter_dfs(roots: Iterable[Hashable], succs: Succs) -> Iterator[Any]:
+    """Preorder DFS; kökler sırayla, daha önce görülenler atlanır."""
+    seen: Set[Any] = set()
+    for r in roots:
+        if r in seen:
+            continue
+        seen.add(r)
+        yield r
+        stack = [iter(succs(r))]
+        while stack:
+            for v in stack[-1]:
+                if v not in seen:
+                    seen.add(v)
+                    yield v
+                    stack.append(iter(succs(v)))
+                    break
+            else:
+                stack.pop()
+
+
+def dfs_preorder(roots: Iterable[Hashable], succs: Succs) -> List[Any]:
+    return list(iter_dfs(roots, succs))
+
+
+def reachable(roots: Iterable[Hashable], succs: Succs) -> Set[Any]:
+    """Köklerden erişilebilen düğümler (sıra önemsiz, DFS'ten ucuz)."""
+    seen: Set[Any] = set()
+    stack: List[Any] = []
+    for r in roots:
+        if r not in seen:
+            seen.add(r)
+            stack.append(r)
+    while stack:
+        for v in succs(stack.pop()):
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return seen
+
+
+@dataclass
+class DFSOrder:
+    """
+    Tek DFS geçişinin numaraları. pre/post: düğüm -> sıra no; back_edges: DFS
+    yığınındaki bir ataya giden (u, v) kenarları (indirgenebilir CFG'de tam
+    olarak döngü geri kenarları).
+    """
+    preorder: List[Any] = field(default_factory=list)
+    postorder: List[Any] = field(default_factory=list)
+    pre: Dict[Any, int] = field(default_factory=dict)
+    post: Dict[Any, int] = field(default_factory=dict)
+    parent: Dict[Any, Any] = field(default_factory=dict)
+    back_edges: List[Tuple[Any, Any]] = field(default_factory=list)
+
+    def rpo(self) -> List[Any]:
+        """Ters postorder (ileri dataflow için doğal ziyaret sırası)."""
+        return self.postorder[::-1]
+
+    def rpo_index(self) -> Dict[Any, int]:
+        n = len(self.postorder)
+        return {u: n - 1 - i for u, i in self.post.items()}
+
+
+def dfs(roots: Iterable[Hashable], succs: Succs) -> DFSOrder:
+    res = DFSOrder()
+    pre, post, parent = res.pre, res.post, res.parent
+    preorder, postorder, back = res.preorder, res.postorder, res.back_edges
+    for r in roots:
+        if r in pre:
+            continue
+        pre[r] = len(preorder)
+        preorder.append(r)
+        parent[r] = None
+        stack = [(r, iter(succs(r)))]
+        while stack:
+            u, it = stack[-1]
+            for v in it:
+                if v not in pre:
+                    pre[v] = len(preorder)
+                    preorder.append(v)
+                    parent[v] = u
+                    stack.append((v, iter(succs(v))))
+                    break
+                if v not in post:
+                    back.append((u, v))     # v hâlâ yığında: ata
+            else:
+                stack.pop()
+                post[u] = len(postorder)
+                postorder.append(u)
+    return res
+
+
+def reverse_postorder(roots: Iterable[Hashable], succs: Succs) -> List[Any]:
+    return dfs(roots, succs).rpo()
+
+
+def back_edges(roots: Iterable[Hashable], succs: Succs) -> List[Tuple[Any, Any]]:
+    return dfs(roots, succs).back_edges
+
+
+def iter_sccs(roots: Iterable[Hashable], succs: Succs) -> Iterator[List[Any]]:
+    """
+    Tarjan SCC'leri, köklerden erişilebilen kısım için. Bileşenler ters
+    topolojik sırayla (önce ardıllar: çağrı grafiğinde aşağıdan yukarı) ve
+    bulundukları anda üretilir; succs(u) yalnızca u'ya ilk varışta çağrılır.
+    Bileşen içi sıra: keşif sırası.
+    """
+    index: Dict[Any, int] = {}
+    low: Dict[Any, int] = {}
+    stack: List[Any] = []
+    on_stack: Set[Any] = set()
+    for r in roots:
+        if r in index:
+            continue
+        index[r] = low[r] = len(index)
+        stack.append(r)
+        on_stack.add(r)
+        work = [(r, iter(succs(r)))]
+        while work:
+            u, it = work[-1]
+            for v in it:
+                if v not in index:
+                    index[v] = low[v] = len(index)
+                    stack.append(v)
+                    on_stack.add(v)
+                    work.append((v, iter(succs(v))))
+                    break
+                if v in on_stack and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                work.pop()
+                if work:
+                    p = work[-1][0]
+                    if low[u] < low[p]:
+                        low[p] = low[u]
+                if low[u] == index[u]:
+                    k = len(stack) - 1
+                    while stack[k] != u:
+                        k -= 1
+                    comp = stack[k:]
+                    del stack[k:]
+                    on_stack.difference_update(comp)
+                    yield comp
+
+
+# ---- CSR (0..n-1 yoğun indeks, offset + hedef dizileri) hızlı yolları ----
+
+def csr_dfs(root: int, off: Sequence[int], dst: Sequence[int], n: int) -> Tuple[List[int], List[int], List[int]]:
+    """Tek kökten preorder: (preorder düğüm listesi, dfn (-1 = erişilemez), DFS ebeveyni)."""
+    dfn = [-1] * n
+    parent = [-1] * n
+    vertex = [root]
+    dfn[root] = 0
+    pos = list(off[:n])
+    stack = [root]
+    while stack:
+        u = stack[-1]
+        p = pos[u]
+        if p < off[u + 1]:
+            pos[u] = p + 1
+            v = dst[p]
+            if dfn[v] < 0:
+                dfn[v] = len(vertex)
+                vertex.append(v)
+                parent[v] = u
+                stack.append(v)
+        else:
+            stack.pop()
+    return vertex, dfn, parent
+
+
+def csr_postorder(root: int, off: Sequence[int], dst: Sequence[int], n: int) -> List[int]:
+    """Tek kökten postorder (ters çevrilince RPO)."""
+    seen = bytearray(n)
+    seen[root] = 1
+    pos = list(off[:n])
+    stack = [root]
+    out: List[int] = []
+    while stack:
+        u = stack[-1]
+        p = pos[u]
+        if p < off[u + 1]:
+            pos[u] = p + 1
+            v = dst[p]
+            if not seen[v]:
+                seen[v] = 1
+                stack.append(v)
+        else:
+            stack.pop()
+            out.append(u)
+    return out
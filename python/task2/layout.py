@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .graph import dfs, iter_dfs
+
+# Graphviz'siz katmanlı (Sugiyama) yerleşim. CFGBuilder çıktısı gibi yapısal
+# graflar için ayarlı; her adım O(V + E) (sıralama adımları O(V log V)):
+#   1) DFS geri kenarları (döngü kapanışları) ters çevrilir -> DAG
+#   2) en uzun yol katmanlaması (RPO sırasıyla tek geçiş); girişi olmayan
+#      düğümler (break sonrası ölü kod vb.) ardıllarının hemen üstüne çekilir
+#   3) birden çok katman atlayan kenarlara ara (sanal) düğümler
+#   4) katman içi sıra: DFS preorder (True kolu solda), sonra barycenter
+#      süpürmeleri; kesişim sayısı artıran süpürme atılır
+#   5) x: komşu ortalamasına, sıra + boşluk kısıtıyla en yakın yerleşim
+#      (ağırlıklı izotonik regresyon, katman başına doğrusal)
+# Kenar yolları sanal düğüm merkezlerinden geçen kırık çizgilerdir.
+
+CHAR_W = 7.0            # 12px monospace karakter genişliği (yaklaşık)
+LINE_H = 15.0
+PAD_X = 8.0
+PAD_Y = 6.0
+NODE_SEP = 18.0
+RANK_SEP = 36.0
+DUMMY_W = 6.0
+MARGIN = 12.0
+LOOP_W = 18.0           # kendine kenar halkasının genişliği
+
+Point = Tuple[float, float]
+
+
+@dataclass
+class Box:
+    key: Hashable
+    lines: List[str]
+    x: float                # merkez
+    y: float                # merkez
+    w: float
+    h: float
+
+
+@dataclass
+class Route:
+    src: Hashable
+    dst: Hashable
+    label: Optional[str]
+    points: List[Point]
+    back: bool = False      # DFS geri kenarı (yukarı doğru çizilir)
+    loop: bool = False      # src == dst
+
+
+@dataclass
+class Layout:
+    width: float
+    height: float
+    boxes: List[Box]
+    routes: List[Route]
+
+
+def _crossings(upper: List[int], lower: List[int], down: List[List[int]], pos: List[int]) -> int:
+    """İki komşu katman arası kesişim sayısı: alt uçların inversiyon sayısı (Fenwick)."""
+    ends: List[int] = []
+    for u in upper:
+        ends.extend(sorted(pos[v] for v in down[u]))
+    size = len(lower)
+    tree = [0] * (size + 1)
+    total = 0
+    seen = 0
+    for p in ends:
+        i = p + 1
+        le = 0
+        while i > 0:
+            le += tree[i]
+            i -= i & -i
+        total += seen - le       # daha önce görülen ve p'den büyük uçlar
+        seen += 1
+        i = p + 1
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+    return total
+
+
+def _reorder(layer: List[int], nbrs: List[List[int]], pos: List[int]) -> None:
+    keys: List[float] = []
+    for i, v in enumerate(layer):
+        ns = nbrs[v]
+        keys.append(sum(pos[u] for u in ns) / len(ns) if ns else float(i))
+    perm = sorted(range(len(layer)), key=keys.__getitem__)
+    layer[:] = [layer[i] for i in perm]
+    for i, v in enumerate(layer):
+        pos[v] = i
+
+
+def _place(layer: List[int], desired: List[float], weight: List[float], width: List[float], x: List[float]) -> None:
+    """
+    Sıra korunarak, aralarında en az NODE_SEP boşluk kalacak şekilde istenen
+    konumlara ağırlıklı en küçük kareler yerleşimi (pool adjacent violators).
+    """
+    off = 0.0
+    prev_w = 0.0
+    # bloklar: [ağırlıklı toplam, ağırlık, eleman sayısı]
+    blocks: List[List[float]] = []
+    offsets: List[float] = []
+    for i, v in enumerate(layer):
+        if i:
+            off += (prev_w + width[v]) / 2 + NODE_SEP
+        prev_w = width[v]
+        offsets.append(off)
+        w = weight[v]
+        blocks.append([(desired[v] - off) * w, w, 1])
+        while len(blocks) > 1 and blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]:
+            s, ww, c = blocks.pop()
+            top = blocks[-1]
+            top[0] += s
+            top[1] += ww
+            top[2] += c
+    i = 0
+    for s, ww, c in blocks:
+        base = s / ww
+        for _ in range(int(c)):
+            x[layer[i]] = base + offsets[i]
+            i += 1
+
+
+def layered_layout(
+    nodes: Sequence[Tuple[Hashable, str]],
+    edges: Sequence[Tuple[Hashable, Hashable, Optional[str]]],
+    roots: Sequence[Hashable] = (),
+    sweeps: int = 2,
+    passes: int = 4,
+) -> Layout:
+    """
+    nodes: (anahtar, etiket; satırlar '\\n' ile), edges: (kaynak, hedef, etiket).
+    roots: DFS ve katmanlama kökleri (CFG'de ENTRY); kalan düğümler sırayla kök olur.
+    """
+    keys = [k for k, _ in nodes]
+    index: Dict[Hashable, int] = {k: i for i, k in enumerate(keys)}
+    n = len(keys)
+    lines = [lab.split("\n") for _, lab in nodes]
+    es = [(index[a], index[b], lab) for a, b, lab in edges]
+
+    out: List[List[int]] = [[] for _ in range(n)]
+    for a, b, _lab in es:
+        out[a].append(b)
+    root_ids = [index[r] for r in roots if r in index]
+    order = dfs(root_ids + list(range(n)), out.__getitem__)
+    back = set(order.back_edges)
+
+    # 1) DAG kenarları (kaynak, hedef, orijinal kenar no)
+    dag: List[Tuple[int, int, int]] = []
+    dag_out: List[List[int]] = [[] for _ in range(n)]
+    has_pred = bytearray(n)
+    for ei, (a, b, _lab) in enumerate(es):
+        if a == b:
+            continue
+        s, t = (b, a) if (a, b) in back else (a, b)
+        dag.append((s, t, ei))
+        dag_out[s].append(t)
+        has_pred[t] = 1
+
+    # 2) katmanlar
+    layer = [0] * n
+    for u in order.rpo():
+        lu = layer[u] + 1
+        for t in dag_out[u]:
+            if layer[t] < lu:
+                layer[t] = lu
+    pinned = set(root_ids)
+    for u in order.postorder:
+        if not has_pred[u] and dag_out[u] and u not in pinned:
+            layer[u] = min(layer[t] for t in dag_out[u]) - 1
+
+    # 3) sanal düğümler; v >= n sanal
+    width = [max(len(s) for s in ls) * CHAR_W + 2 * PAD_X for ls in lines]
+    height = [len(ls) * LINE_H + 2 * PAD_Y for ls in lines]
+    vlayer = layer[:]
+    up: List[List[int]] = [[] for _ in range(n)]
+    down: List[List[int]] = [[] for _ in range(n)]
+    chains: Dict[int, List[int]] = {}
+    for s, t, ei in dag:
+        chain = [s]
+        for L in range(layer[s] + 1, layer[t]):
+            v = len(vlayer)
+            vlayer.append(L)
+            width.append(DUMMY_W)
+            height.append(0.0)
+            up.append([])
+            down.append([])
+            chain.append(v)
+        chain.append(t)
+        for p, q in zip(chain, chain[1:]):
+            down[p].append(q)
+            up[q].append(p)
+        chains[ei] = chain
+    nv = len(vlayer)
+
+    # 4) başlangıç sırası: genişletilmiş grafta DFS preorder
+    n_layers = max(vlayer, default=-1) + 1
+    layers: List[List[int]] = [[] for _ in range(n_layers)]
+    for v in iter_dfs(root_ids + list(range(n)), down.__getitem__):
+        layers[vlayer[v]].append(v)
+    pos = [0] * nv
+    for lay in layers:
+        for i, v in enumerate(lay):
+            pos[v] = i
+
+    def total_crossings() -> int:
+        return sum(_crossings(layers[L], layers[L + 1], down, pos) for L in range(n_layers - 1))
+
+    best = total_crossings()
+    for _ in range(sweeps if best else 0):
+        saved = [lay[:] for lay in layers]
+        for L in range(1, n_layers):
+            _reorder(layers[L], up, pos)
+        for L in range(n_layers - 2, -1, -1):
+            _reorder(layers[L], down, pos)
+        c = total_crossings()
+        if c >= best:
+            layers = saved
+            for lay in layers:
+                for i, v in enumerate(lay):
+                    pos[v] = i
+            break
+        best = c
+
+    # 5) x koordinatları
+    x = [0.0] * nv
+    weight = [1.0] * n + [2.0] * (nv - n)      # uzun kenarlar düz kalsın
+    for lay in layers:
+        _place(lay, x, weight, width, x)
+    desired = [0.0] * nv
+    for p in range(passes):
+        if p % 2 == 0:
+            rng, nbrs = range(1, n_layers), up
+        else:
+            rng, nbrs = range(n_layers - 2, -1, -1), down
+        for L in rng:
+            lay = layers[L]
+            for v in lay:
+                ns = nbrs[v]
+                desired[v] = sum(x[u] for u in ns) / len(ns) if ns else x[v]
+            _place(lay, desired, weight, width, x)
+
+    left = min((x[v] - width[v] / 2 for v in range(nv)), default=0.0)
+    shift = MARGIN - left
+    for v in range(nv):
+        x[v] += shift
+
+    # y: katman yüksekliği en yüksek düğüm kadar
+    ys: List[float] = []
+    top = MARGIN
+    for lay in layers:
+        lh = max((height[v] for v in lay), default=0.0) or LINE_H
+        ys.append(top + lh / 2)
+        top += lh + RANK_SEP
+    y = [ys[vlayer[v]] for v in range(nv)]
+
+    boxes = [Box(key=keys[v], lines=lines[v], x=x[v], y=y[v], w=width[v], h=height[v]) for v in range(n)]
+
+    routes: List[Route] = []
+    for ei, (a, b, lab) in enumerate(es):
+        if a == b:
+            r = x[a] + width[a] / 2
+            routes.append(Route(keys[a], keys[b], lab, [
+                (r, y[a] - height[a] / 4), (r + LOOP_W, y[a] - height[a] / 2),
+                (r + LOOP_W, y[a] + height[a] / 2), (r, y[a] + height[a] / 4),
+            ], loop=True))
+            continue
+        chain = chains[ei]
+        if (a, b) not in back:
+            pts = [(x[a], y[a] + height[a] / 2)]
+            pts.extend((x[v], y[v]) for v in chain[1:-1])
+            pts.append((x[b], y[b] - height[b] / 2))
+            routes.append(Route(keys[a], keys[b], lab, pts))
+            continue
+        # geri kenar: kaynağın ve hedefin yanından (sanal düğümler hangi taraftaysa)
+        mid = chain[-2:0:-1]
+        side_a = 1.0 if not mid or x[mid[0]] >= x[a] else -1.0
+        side_b = 1.0 if not mid or x[mid[-1]] >= x[b] else -1.0
+        pts = [(x[a] + side_a * width[a] / 2, y[a])]
+        pts.extend((x[v], y[v]) for v in mid)
+        pts.append((x[b] + side_b * width[b] / 2, y[b]))
+        routes.append(Route(keys[a], keys[b], lab, pts, back=True))
+
+    right = max((x[v] + width[v] / 2 for v in range(nv)), default=0.0)
+    if any(r.loop for r in routes):
+        right += LOOP_W
+    return Layout(width=right + MARGIN, height=max(top - RANK_SEP, MARGIN) + MARGIN, boxes=boxes, routes=routes)
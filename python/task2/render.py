@@ -1,6 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Iterable, Optional, Set, Tuple
+from typing import Iterable, List, Optional, Sequence, Set, Tuple
 import subprocess
 
 from .cfg import CFG
@@ -16,7 +16,11 @@ def cfg_to_dot(cfg: CFG) -> str:
     lines.append("  node [shape=box];")
 
     for bid, b in cfg.blocks.items():
-        lines.append(f'  n{bid} [label="{_esc(b.label)}"];')
+        label = _esc(b.label)
+        if "\n" in label:
+            # temel blok: deyimler sola hizalı satırlar
+            label = label.replace("\n", "\\l") + "\\l"
+        lines.append(f'  n{bid} [label="{label}"];')
 
     for bid, b in cfg.blocks.items():
         for (to, lab) in b.succs:
@@ -29,23 +33,53 @@ def cfg_to_dot(cfg: CFG) -> str:
     return "\n".join(lines)
 
 
-def call_graph_to_dot(
+def blocks_to_dot(
+    blocks: Sequence[Tuple[int, Sequence[str]]],
+    edges: Iterable[Tuple[int, int, Optional[str]]],
+) -> str:
+    """
+    Temel blok görünümü: (blok no, satırlar) listesi ve (kaynak, hedef, etiket)
+    kenarları. Satırlar sola hizalı; kenarlar "default" / "on <etiket>".
+    """
+    lines: List[str] = []
+    lines.append('digraph CFG {')
+    lines.append('  node [shape=box];')
+
+    for bid, body in blocks:
+        text = "\\l".join(map(_esc, body)) + "\\l"
+        lines.append(f'  b{bid} [label="#{bid}\\l{text}"];')
+
+    for a, b, el in edges:
+        if el is None:
+            lines.append(f'  b{a} -> b{b} [label="default"];')
+        else:
+            lines.append(f'  b{a} -> b{b} [label="on {_esc(el)}"];')
+
+    lines.append('}')
+    return "\n".join(lines)
+
+
+def cfg_blocks_to_dot(cfg: CFG) -> str:
+    """BlockCFGBuilder çıktısı için blocks_to_dot (ENTRY/EXIT tek satırlık bloklar)."""
+    blocks = [(bid, b.stmts or [b.label]) for bid, b in cfg.blocks.items()]
+    edges = [(bid, to, lab) for bid, b in cfg.blocks.items() for to, lab in b.succs]
+    return blocks_to_dot(blocks, edges)
+
+
+def call_graph_nodes(
     edges: Iterable[Tuple[str, str]],
     defined: Set[str],
     no_body: Set[str],
     with_errors: Set[str],
-) -> str:
-    lines = []
-    lines.append('digraph "call_graph" {')
-    lines.append("  rankdir=LR;")
-    lines.append("  node [shape=box];")
-
+) -> List[Tuple[str, List[str]]]:
+    """Çağrı grafiği düğümleri (isim sırasıyla) ve işaretleri (UNDEF / NO_BODY / ERROR)."""
     all_nodes: Set[str] = set()
     for a, b in edges:
         all_nodes.add(a); all_nodes.add(b)
 # defined fonksiyonları da düğüm olarak ekle (edge olmasa bile görünsün)
         all_nodes |= set(defined)
 
+    out = []
     for n in sorted(all_nodes):
         extra = []
         if n not in defined:
@@ -54,7 +88,22 @@ def call_graph_to_dot(
             extra.append("NO_BODY")
         if n in with_errors:
             extra.append("ERROR")
+        out.append((n, extra))
+    return out
+
+
+def call_graph_to_dot(
+    edges: Iterable[Tuple[str, str]],
+    defined: Set[str],
+    no_body: Set[str],
+    with_errors: Set[str],
+) -> str:
+    lines = []
+    lines.append('digraph "call_graph" {')
+    lines.append("  rankdir=LR;")
+    lines.append("  node [shape=box];")
 
+    for n, extra in call_graph_nodes(edges, defined, no_body, with_errors):
         label = n if not extra else f"{n}\\n({', '.join(extra)})"
         lines.append(f'  "{_esc(n)}" [label="{_esc(label)}"];')
 
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Graphviz çağrılarını toplayan zamanlayıcı. run_dot her (grafik, biçim) için ayrı
+# ve bloklayan bir `dot` süreci açar; burada:
+#   * tek çağrıda birden çok biçim:  dot -Tpng -o a.png -Tsvg -o a.svg a.dot
+#   * küçük grafikler ortak çağrıda: dot -Tpng -Tsvg -O a.dot b.dot ...
+#     (-O çıktıları a.dot.png olarak yazar; sonra a.png'ye taşınır)
+#   * en fazla `jobs` eşzamanlı dot süreci (iş parçacığı havuzu; bekleme GIL dışı)
+#   * DOT içeriğinin özeti, dizindeki HASH_FILE'da o görüntü için kayıtlı olanla
+#     aynıysa ve görüntü diskteyse çizim atlanır
+# Çıktı adı her zaman dot_path.with_suffix("." + fmt).
+
+HASH_FILE = ".render-hashes.json"
+
+
+@dataclass
+class RenderResult:
+    dot_path: Path
+    formats: Tuple[str, ...]
+    seconds: float = 0.0                # bu grafiğe düşen dot süresi (ortak çağrıda boyut payı)
+    batch: int = 0                      # aynı dot çağrısındaki grafik sayısı (0 = atlandı)
+    skipped: bool = False
+    error: Optional[Exception] = None
+
+    @property
+    def outputs(self) -> List[Path]:
+        return [self.dot_path.with_suffix("." + fmt) for fmt in self.formats]
+
+
+@dataclass
+class _Item:
+    result: RenderResult
+    size: int
+    digest: str
+
+
+@dataclass
+class _HashStore:
+    """Bir çıktı dizininin görüntü adı -> DOT özeti kaydı."""
+    path: Path
+    hashes: Dict[str, str] = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def load(cls, directory: Path) -> "_HashStore":
+        path = directory / HASH_FILE
+        try:
+            hashes = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            hashes = {}
+        return cls(path=path, hashes=hashes if isinstance(hashes, dict) else {})
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        # geçici dosya + atomik rename: yarıda kalan / eşzamanlı yazım kaydı bozmaz
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(self.hashes, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return                  # cache yazılamadı: bir sonraki çalıştırma yeniden çizer
+        self.dirty = False
+
+
+class RenderQueue:
+    """
+    submit(dot_path[, formats]) ile çizimler sıraya alınır; close() kalanları
+    gönderir, hepsini bekler ve sonuçları submit sırasıyla döndürür.
+    Hatalar yükseltilmez, RenderResult.error'da döner (ortak çağrı hata verirse
+    grafikler tek tek yeniden denenir; yalnızca bozuk olan hatalı sayılır).
+    """
+
+    def __init__(
+        self,
+        formats: Sequence[str] = ("png",),
+        jobs: Optional[int] = None,
+        batch_max: int = 32,
+        batch_bytes: int = 256 * 1024,
+        small_bytes: int = 16 * 1024,
+        cache: bool = True,
+        dot: str = "dot",
+    ) -> None:
+        self.formats = tuple(formats)          # submit'te biçim verilmezse
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.batch_max = batch_max
+        self.batch_bytes = batch_bytes
+        self.small_bytes = small_bytes
+        self.cache = cache
+        self.dot = dot
+        self.invocations = 0
+        self._pool = ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="dot")
+        self._results: List[RenderResult] = []
+        self._futures: List[Future] = []
+        self._pending: Dict[Tuple[str, ...], List[_Item]] = {}
+        self._pending_bytes: Dict[Tuple[str, ...], int] = {}
+        self._stores: Dict[Path, _HashStore] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RenderQueue":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _store(self, directory: Path) -> _HashStore:
+        st = self._stores.get(directory)
+        if st is None:
+            st = self._stores[directory] = _HashStore.load(directory)
+        return st
+
+    def submit(self, dot_path: Path, formats: Optional[Sequence[str]] = None) -> RenderResult:
+        dot_path = Path(dot_path)
+        formats = self.formats if formats is None else tuple(formats)
+        res = RenderResult(dot_path=dot_path, formats=formats)
+        self._results.append(res)
+        if not formats:
+            res.skipped = True
+            return res
+
+        data = dot_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if self.cache:
+            with self._lock:
+                hashes = dict(self._store(dot_path.parent).hashes)
+            if all(hashes.get(p.name) == digest and p.exists() for p in res.outputs):
+                res.skipped = True
+                return res
+
+        item = _Item(result=res, size=len(data), digest=digest)
+        if item.size > self.small_bytes or self.batch_max <= 1:
+            self._launch([item])
+            return res
+        group = self._pending.setdefault(formats, [])
+        group.append(item)
+        total = self._pending_bytes.get(formats, 0) + item.size
+        self._pending_bytes[formats] = total
+        if len(group) >= self.batch_max or total >= self.batch_bytes:
+            self._flush(formats)
+        return res
+
+    def _flush(self, formats: Tuple[str, ...]) -> None:
+        group = self._pending.pop(formats, None)
+        self._pending_bytes.pop(formats, None)
+        if group:
+            self._launch(group)
+
+    def _launch(self, items: List[_Item]) -> None:
+        self._futures.append(self._pool.submit(self._render, items))
+
+    def close(self) -> List[RenderResult]:
+        for formats in list(self._pending):
+            self._flush(formats)
+        for fut in self._futures:
+            fut.result()
+        self._futures.clear()
+        self._pool.shutdown(wait=True)
+        for st in self._stores.values():
+            st.save()
+        return self._results
+
+    # ---- iş parçacığı tarafı ----
+
+    def _argv_single(self, res: RenderResult) -> List[str]:
+        argv = [self.dot]
+        for fmt, out in zip(res.formats, res.outputs):
+            argv += [f"-T{fmt}", "-o", str(out)]
+        argv.append(str(res.dot_path))
+        return argv
+
+    def _argv_batch(self, items: List[_Item]) -> List[str]:
+        argv = [self.dot]
+        argv += [f"-T{fmt}" for fmt in items[0].result.formats]
+        argv.append("-O")
+        argv += [str(it.result.dot_path) for it in items]
+        return argv
+
+    def _run(self, argv: List[str]) -> float:
+        with self._lock:
+            self.invocations += 1
+        t0 = time.perf_counter()
+        subprocess.run(argv, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        return time.perf_counter() - t0
+
+    def _render(self, items: List[_Item]) -> None:
+        if len(items) == 1:
+            self._render_one(items[0])
+            return
+        try:
+            dt = self._run(self._argv_batch(items))
+            for it in items:
+                res = it.result
+                for fmt, out in zip(res.formats, res.outputs):
+                    os.replace(f"{res.dot_path}.{fmt}", out)
+        except (OSError, subprocess.CalledProcessError) as e:
+            if isinstance(e, FileNotFoundError) and e.filename == self.dot:
+                for it in items:        # dot kurulu değil: tek tek denemenin anlamı yok
+                    it.result.error = e
+                return
+            # hangi grafiğin bozuk olduğunu (ya da taşınamayan çıktıyı) bulmak için tek tek
+            for it in items:
+                self._render_one(it)
+            return
+        total = sum(it.size for it in items) or 1
+        for it in items:
+            it.result.seconds = dt * it.size / total
+            it.result.batch = len(items)
+            self._record(it)
+
+    def _render_one(self, it: _Item) -> None:
+        res = it.result
+        res.batch = 1
+        try:
+            res.seconds = self._run(self._argv_single(res))
+        except (OSError, subprocess.CalledProcessError) as e:
+            res.error = e
+            return
+        self._record(it)
+
+    def _record(self, it: _Item) -> None:
+        if not self.cache:
+            return
+        with self._lock:
+            st = self._store(it.result.dot_path.parent)
+            for out in it.result.outputs:
+                st.hashes[out.name] = it.digest
+            st.dirty = True
+
+
+def format_report(results: Sequence[RenderResult]) -> str:
+    """Grafik başına çizim süresi (TSV): dot_path, biçimler, ms, ortak çağrı boyu, durum."""
+    lines = ["dot\tformats\tms\tbatch\tstatus"]
+    for r in results:
+        status = "skipped" if r.skipped else "error" if r.error is not None else "ok"
+        lines.append(f"{r.dot_path}\t{','.join(r.formats)}\t{r.seconds * 1e3:.1f}\t{r.batch}\t{status}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+from xml.sax.saxutils import escape
+
+from .cfg import CFG
+from .layout import LINE_H, PAD_X, PAD_Y, Layout, Point, layered_layout
+from .render import call_graph_nodes
+
+# task2.layout yerleşiminden doğrudan SVG (Graphviz/alt süreç yok).
+# Çıktı render.py'deki DOT görünümlerinin karşılığıdır: kutu düğümler,
+# çok satırlı etiketler sola hizalı, kenar etiketleri kaynağa yakın.
+
+_STYLE = (
+    "text{font-family:monospace;font-size:12px;fill:#000}"
+    ".node rect{fill:#fff;stroke:#000}"
+    ".edge path{fill:none;stroke:#000}"
+    ".edge.back path{stroke-dasharray:4 2}"
+    ".edge text{font-size:10px}"
+)
+
+
+def _f(v: float) -> str:
+    return f"{v:.1f}"
+
+
+def _path(points: Sequence[Point], loop: bool) -> str:
+    if loop:
+        (x0, y0), c1, c2, (x1, y1) = points
+        return f"M{_f(x0)},{_f(y0)} C{_f(c1[0])},{_f(c1[1])} {_f(c2[0])},{_f(c2[1])} {_f(x1)},{_f(y1)}"
+    x0, y0 = points[0]
+    d = [f"M{_f(x0)},{_f(y0)}"]
+    last = len(points) - 1
+    if last == 1:
+        d.append(f"L{_f(points[1][0])},{_f(points[1][1])}")
+        return " ".join(d)
+    # ara noktalar kontrol noktası, segment ortaları geçiş noktası (yumuşak kırık çizgi)
+    for i in range(1, last):
+        x, y = points[i]
+        nx, ny = points[i + 1]
+        if i < last - 1:
+            nx, ny = (x + nx) / 2, (y + ny) / 2
+        d.append(f"Q{_f(x)},{_f(y)} {_f(nx)},{_f(ny)}")
+    return " ".join(d)
+
+
+def layout_to_svg(layout: Layout, title: str = "") -> str:
+    out: List[str] = []
+    w, h = _f(layout.width), _f(layout.height)
+    out.append(f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">')
+    if title:
+        out.append(f"<title>{escape(title)}</title>")
+    out.append(
+        '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="8" markerHeight="8" '
+        'orient="auto"><path d="M0,0 L10,5 L0,10 z"/></marker></defs>'
+    )
+    out.append(f"<style>{_STYLE}</style>")
+
+    for r in layout.routes:
+        cls = "edge back" if r.back else "edge"
+        out.append(f'<g class="{cls}"><path d="{_path(r.points, r.loop)}" marker-end="url(#arrow)"/>')
+        if r.label is not None:
+            (x0, y0), (x1, y1) = r.points[0], r.points[1]
+            lx, ly = x0 + (x1 - x0) * 0.4 + 4, y0 + (y1 - y0) * 0.4
+            out.append(f'<text x="{_f(lx)}" y="{_f(ly)}">{escape(str(r.label))}</text>')
+        out.append("</g>")
+
+    for b in layout.boxes:
+        left, top = b.x - b.w / 2, b.y - b.h / 2
+        out.append(f'<g class="node"><title>{escape(str(b.key))}</title>')
+        out.append(f'<rect x="{_f(left)}" y="{_f(top)}" width="{_f(b.w)}" height="{_f(b.h)}"/>')
+        base = top + PAD_Y + LINE_H * 0.8
+        if len(b.lines) == 1:
+            out.append(f'<text x="{_f(b.x)}" y="{_f(base)}" text-anchor="middle">{escape(b.lines[0])}</text>')
+        else:
+            tx = _f(left + PAD_X)
+            spans = "".join(
+                f'<tspan x="{tx}" y="{_f(base + i * LINE_H)}">{escape(s)}</tspan>' for i, s in enumerate(b.lines)
+            )
+            out.append(f"<text>{spans}</text>")
+        out.append("</g>")
+
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+def graph_to_svg(
+    nodes: Sequence[Tuple[Hashable, str]],
+    edges: Sequence[Tuple[Hashable, Hashable, Optional[str]]],
+    roots: Sequence[Hashable] = (),
+    title: str = "",
+) -> str:
+    return layout_to_svg(layered_layout(nodes, edges, roots), title=title)
+
+
+def cfg_to_svg(cfg: CFG) -> str:
+    """cfg_to_dot'un SVG karşılığı (CFGBuilder ve BlockCFGBuilder çıktıları)."""
+    nodes = [(bid, b.label) for bid, b in cfg.blocks.items()]
+    edges = [(bid, to, lab) for bid, b in cfg.blocks.items() for to, lab in b.succs]
+    roots = [cfg.entry] if cfg.entry >= 0 else []
+    return graph_to_svg(nodes, edges, roots, title=cfg.name)
+
+
+def blocks_to_svg(
+    blocks: Sequence[Tuple[int, Sequence[str]]],
+    edges: Iterable[Tuple[int, int, Optional[str]]],
+) -> str:
+    """blocks_to_dot'un SVG karşılığı: '#<no>' başlıklı bloklar, 'default' / 'on <etiket>' kenarlar."""
+    nodes = [(bid, "\n".join([f"#{bid}", *body])) for bid, body in blocks]
+    es = [(a, b, "default" if el is None else f"on {el}") for a, b, el in edges]
+    return graph_to_svg(nodes, es, [blocks[0][0]] if blocks else [], title="CFG")
+
+
+def call_graph_to_svg(
+    edges: Iterable[Tuple[str, str]],
+    defined: Set[str],
+    no_body: Set[str],
+    with_errors: Set[str],
+) -> str:
+    edges = list(edges)
+    nodes = [(n, n if not extra else f"{n}\n({', '.join(extra)})")
+             for n, extra in call_graph_nodes(edges, defined, no_body, with_errors)]
+    roots = ["main"] if "main" in defined else []
+    return graph_to_svg(nodes, [(a, b, None) for a, b in edges], roots, title="call_graph")
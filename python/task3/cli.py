@@ -3,40 +3,63 @@ from __future__ import annotations
 
 import argparse
 import sys
-import subprocess
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from .dot_to_asm_2addr import generate_from_dot
-
-
-def _run_task2_make_cfg(inp: Path, out_dir: Path) -> None:
-    """
-    Runs: python -m task2.cli <input.v3> <out_dir> --png
-    Note: we do NOT use --no-png (because your task2.cli doesn't have it).
-    """
-    cmd = [
-        sys.executable, "-m", "task2.cli",
-        str(inp), str(out_dir),
-        "--png",
-    ]
-    # Print the command for clarity in defense
-    print("[task3] running:", " ".join(cmd))
-    r = subprocess.run(cmd, capture_output=True, text=True)
-    # Always show outputs (teacher likes proofs)
-    if r.stdout:
-        print(r.stdout.strip())
-    if r.stderr:
-        print(r.stderr.strip(), file=sys.stderr)
-    if r.returncode != 0:
-        raise RuntimeError(f"task2.cli failed with code={r.returncode}")
+from task1.ast import FuncDef, Program
+from task1.astbin import SUFFIX as AST_SUFFIX, AstFormatError, read_ast
+from task1.parser import BACKENDS, parse_text
+from task1.source import read_source
+from task2.builder import CFGBuilder
+from task2.cfg import CFG
+from task2.render import cfg_to_dot
+from task2.render_queue import RenderQueue
+
+from .dot_to_asm_2addr import generate_from_cfg, generate_from_dot
+
+
+def load_program(inp: Path, backend: str = "lark") -> Tuple[Optional[Program], List[str]]:
+    """Kaynak (.v3) ya da ikili AST (.v3ast) -> Program; hata varsa (None, mesajlar)."""
+    if inp.suffix == AST_SUFFIX:
+        try:
+            return read_ast(inp), []
+        except AstFormatError as e:
+            return None, [f"[io error] {inp.name}: {e}"]
+    res = parse_text(read_source(inp), inline=True, backend=backend)
+    errs = [f"[parse error] {inp.name}: line={e.line} col={e.column}: {e.message}" for e in res.errors]
+    if res.program is None and not errs:
+        errs.append(f"[parse error] {inp.name}: program is None")
+    return (None if errs else res.program), errs
+
+
+def write_cfg_artifacts(cfgs: Dict[str, CFG], out_dir: Path, png: bool = False) -> Path:
+    """task2 düzeninde out_dir/graph/<func>.dot (+ .png) yazar; graph dizinini döndürür."""
+    out_graph = out_dir / "graph"
+    out_graph.mkdir(parents=True, exist_ok=True)
+    renderer = RenderQueue(("png",)) if png else None
+    for name, cfg in cfgs.items():
+        dot_path = out_graph / f"{name}.dot"
+        dot_path.write_text(cfg_to_dot(cfg), encoding="utf-8")
+        if renderer is not None:
+            renderer.submit(dot_path)
+    if renderer is not None:
+        for r in renderer.close():
+            if r.error is not None:
+                print(f"[task3] WARNING: PNG render failed for {r.dot_path.stem}: {r.error}", file=sys.stderr)
+    return out_graph
 
 
 def main() -> int:
     p = argparse.ArgumentParser(prog="task3")
-    p.add_argument("input", help="Input .v3 source file")
+    p.add_argument("input", help="Input .v3 source file (or .v3ast binary AST)")
     p.add_argument("out_dir", help="Output directory")
     p.add_argument("--asm", required=True, help="Path to output asm listing file")
-    p.add_argument("--keep-cfg", action="store_true", help="Generate/keep task2 CFG artifacts in out_dir")
+    p.add_argument("--keep-cfg", action="store_true",
+                   help="also write the CFG of every function as out_dir/graph/<func>.dot")
+    p.add_argument("--png", action="store_true", help="also render kept CFG DOT files to PNG (implies --keep-cfg)")
+    p.add_argument("--from-dot", action="store_true",
+                   help="do not compile input; generate ASM from an existing out_dir/graph/main.dot")
+    p.add_argument("--backend", choices=BACKENDS, default="lark", help="parser backend")
     args = p.parse_args()
 
     inp = Path(args.input)
@@ -46,37 +69,54 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
     asm_path.parent.mkdir(parents=True, exist_ok=True)
 
+    if args.from_dot:
+        # eski yol: task2'nin yazdığı DOT'u geri okur
+        dot_path = out_dir / "graph" / "main.dot"
+        if not dot_path.exists():
+            print(f"[task3] ERROR: DOT not found: {dot_path}")
+            print("[task3] Tip: generate DOT with task2 first, or drop --from-dot.")
+            return 4
+        generate_from_dot(dot_path, asm_path)
+        print(f"OK. out_dir={out_dir.resolve()}")
+        print(f"OK. dot_used={dot_path.resolve()}")
+        print(f"OK. asm_written={asm_path.resolve()}")
+        return 0
+
     if not inp.exists():
         print(f"[task3] ERROR: input file not found: {inp}")
         return 2
 
-    dot_path = out_dir / "graph" / "main.dot"
-
-    # If asked, try to generate CFG via task2 first
-    if args.keep_cfg:
-        try:
-            _run_task2_make_cfg(inp, out_dir)
-        except Exception as e:
-            # If DOT already exists, we can continue safely
-            if dot_path.exists():
-                print(f"[task3] WARNING: task2 failed but DOT exists, continuing. Reason: {e}")
-            else:
-                print(f"[task3] ERROR: task2 failed and DOT not found. Reason: {e}")
-                return 3
-
-    # Require DOT to exist now
-    if not dot_path.exists():
-        print(f"[task3] ERROR: DOT not found: {dot_path}")
-        print("[task3] Tip: run with --keep-cfg, or generate DOT with task2 manually.")
+    # parse -> CFG -> ASM tek süreçte; CFG bellekte aktarılır
+    program, errs = load_program(inp, args.backend)
+    if program is None:
+        for e in errs:
+            print(f"[task3] ERROR: {e}")
+        return 3
+
+    funcs: Dict[str, FuncDef] = {}
+    for item in program.items:
+        if isinstance(item, FuncDef):
+            funcs[item.signature.name] = item
+    if "main" not in funcs:
+        print(f"[task3] ERROR: function 'main' not found in {inp}")
         return 4
 
-    # DOT -> ASM (REAL)
-    generate_from_dot(dot_path, asm_path)
+    builder = CFGBuilder()
+    if args.keep_cfg or args.png:
+        cfgs = {name: builder.build_for_func(f) for name, f in funcs.items()}
+        out_graph = write_cfg_artifacts(cfgs, out_dir, png=args.png)
+        cfg = cfgs["main"]
+        cfg_used = str((out_graph / "main.dot").resolve())
+    else:
+        cfg = builder.build_for_func(funcs["main"])
+        cfg_used = "in-memory (main)"
+
+    generate_from_cfg(cfg, asm_path)
 
     print(f"OK. out_dir={out_dir.resolve()}")
-    print(f"OK. dot_used={dot_path.resolve()}")
+    print(f"OK. cfg_used={cfg_used}")
     print(f"OK. asm_written={asm_path.resolve()}")
-    print("NOTE: DOT(CFG) -> Linear ASM generation completed (2-addr).")
+    print("NOTE: CFG -> Linear ASM generation completed (2-addr).")
     return 0
 
 
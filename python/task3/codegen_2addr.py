@@ -5,6 +5,9 @@ from typing import Dict, List, Tuple, Optional, Any
 import re
 from pathlib import Path
 
+from task2.callgraph import iter_reachable_sccs
+from task2.dot_parse import load_dot
+from task2.graph import dfs_preorder
 from task3.emit_asm_2addr import AsmProgram, emit_prolog, emit_epilog
 
 WORD = 4
@@ -62,36 +65,15 @@ def emit_jlf(p: AsmProgram, label: str) -> None:
 
 # ----------------- DOT parsing -----------------
 
-_NODE_RE = re.compile(r'^\s*(n(\d+))\s+\[label="(.*)"\];\s*$')
-_EDGE_RE = re.compile(r'^\s*n(\d+)\s*->\s*n(\d+)(?:\s*\[label="(.*)"\])?;\s*$')
-
-def _unescape_dot_label(s: str) -> str:
-    # DOT label may contain escaped sequences like \n
-    return s.replace(r"\n", "\n").replace('\\"', '"')
-
 def parse_dot_cfg(dot_path: Path) -> DotCFG:
-    text = dot_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    g = load_dot(dot_path)
 
     name = dot_path.stem
     blocks: Dict[int, DotCFGBlock] = {}
-    edges: List[Tuple[int,int,Optional[str]]] = []
-
-    for line in text:
-        m = _NODE_RE.match(line)
-        if m:
-            nid = int(m.group(2))
-            label = _unescape_dot_label(m.group(3))
-            blocks[nid] = DotCFGBlock(id=nid, label=label, succs=[])
-            continue
-        m = _EDGE_RE.match(line)
-        if m:
-            a = int(m.group(1))
-            b = int(m.group(2))
-            lab = m.group(3)
-            edges.append((a,b,lab))
-            continue
+    for nid, label in g.labeled_nodes():
+        blocks[nid] = DotCFGBlock(id=nid, label=label, succs=[])
 
-    for a,b,lab in edges:
+    for a, b, lab in g.edges():
         if a in blocks:
             blocks[a].succs.append((b, lab))
 
@@ -231,23 +213,8 @@ def block_label_name(func: str, bid: int) -> str:
     return f"{func}_b{bid}"
 
 def dfs_order(cfg: DotCFG) -> List[int]:
-    seen = set()
-    order: List[int] = []
-
-    def go(u: int):
-        if u in seen:
-            return
-        seen.add(u)
-        order.append(u)
-        for v,_lab in cfg.blocks[u].succs:
-            go(v)
-
-    go(cfg.entry)
-    # include any disconnected blocks
-    for bid in sorted(cfg.blocks.keys()):
-        if bid not in seen:
-            go(bid)
-    return order
+    # entry'den DFS; bağlantısız bloklar da (artan id sırasıyla) dahil
+    return dfs_preorder([cfg.entry, *sorted(cfg.blocks)], lambda u: [v for v, _lab in cfg.blocks[u].succs])
 
 def emit_condition_and_branches(
     p: AsmProgram,
@@ -374,13 +341,42 @@ def codegen_one_cfg(p: AsmProgram, cfg: DotCFG, func_index: int) -> None:
     p.add("ret")
 
 
-def generate_from_task2_dot_dir(dot_dir: str, output_path: str) -> None:
+_CALL_RE = re.compile(r"([A-Za-z_][A-Za-z_0-9]*)\s*\(")
+
+def called_functions(cfg: DotCFG, known: Any) -> List[str]:
+    # etiketlerdeki "isim(" çağrıları; sadece known içindeki fonksiyon adları
+    out: List[str] = []
+    for bid in sorted(cfg.blocks):
+        for m in _CALL_RE.finditer(cfg.blocks[bid].label):
+            name = m.group(1)
+            if name in known and name not in out:
+                out.append(name)
+    return out
+
+def generate_from_task2_dot_dir(dot_dir: str, output_path: str, entry: Optional[str] = None) -> None:
+    """
+    entry=None: dizindeki tüm .dot'lar (ad sırasıyla). entry verilirse yalnızca
+    ondan erişilebilen fonksiyonlar, aşağıdan yukarı SCC sırasıyla (çağrılanlar
+    önce); erişilemeyen .dot dosyaları okunmaz bile.
+    """
     dot_path = Path(dot_dir)
     dots = sorted(dot_path.glob("*.dot"))
     if not dots:
         raise RuntimeError(f"No .dot files found in: {dot_path}")
 
-    cfgs: List[DotCFG] = [parse_dot_cfg(p) for p in dots]
+    if entry is None:
+        cfgs: List[DotCFG] = [parse_dot_cfg(p) for p in dots]
+    else:
+        by_name = {p.stem: p for p in dots}
+        if entry not in by_name:
+            raise RuntimeError(f"Entry function {entry!r} not found in: {dot_path}")
+        parsed: Dict[str, DotCFG] = {}
+
+        def calls_of(name: str) -> List[str]:
+            cfg = parsed[name] = parse_dot_cfg(by_name[name])
+            return called_functions(cfg, by_name)
+
+        cfgs = [parsed[name] for comp in iter_reachable_sccs([entry], calls_of) for name in comp]
 
     prog = AsmProgram(lines=[])
     emit_prolog(prog)
@@ -2,7 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import re
+
+from task2.dot_parse import load_dot
 
 
 @dataclass
@@ -19,50 +20,19 @@ class DotCFG:
     entry: Optional[int] = None
 
 
-_NODE_RE = re.compile(r'^\s*(n\d+)\s*\[\s*label\s*=\s*"(.+)"\s*\]\s*;\s*$')
-_EDGE_RE = re.compile(r'^\s*(n\d+)\s*->\s*(n\d+)\s*(?:\[\s*label\s*=\s*"([^"]+)"\s*\])?\s*;\s*$')
-_GRAPH_RE = re.compile(r'^\s*digraph\s+"([^"]+)"\s*\{\s*$')
-
-
-def _nid_to_int(nid: str) -> int:
-    # "n14" -> 14
-    return int(nid[1:])
-
-
 def load_cfg_from_dot(dot_path: Path) -> DotCFG:
-    text = dot_path.read_text(encoding="utf-8", errors="replace").splitlines()
-
-    gname = dot_path.stem
-    for ln in text:
-        m = _GRAPH_RE.match(ln)
-        if m:
-            gname = m.group(1)
-            break
-
-    cfg = DotCFG(name=gname)
+    g = load_dot(dot_path)
+    cfg = DotCFG(name=g.name or dot_path.stem)
 
-    # 1) nodes
-    for ln in text:
-        m = _NODE_RE.match(ln)
-        if not m:
-            continue
-        nid, raw_label = m.group(1), m.group(2)
-        bid = _nid_to_int(nid)
-        label = raw_label.replace(r"\n", "\n")
+    # etiketler dot_parse'ta çözülür (\n, \l, \" ...)
+    for bid, label in g.labeled_nodes():
         cfg.blocks[bid] = DotCFGBlock(id=bid, label=label)
 
-    # 2) edges
-    for ln in text:
-        m = _EDGE_RE.match(ln)
-        if not m:
-            continue
-        src, dst, elab = m.group(1), m.group(2), m.group(3)
-        sid = _nid_to_int(src)
-        did = _nid_to_int(dst)
+    for sid, did, elab in g.edges():
         if sid in cfg.blocks:
             cfg.blocks[sid].succs.append((did, elab))
 
-    # 3) entry: label=="ENTRY" varsa onu al, yoksa en küçük id
+    # entry: label=="ENTRY" varsa onu al, yoksa en küçük id
     for bid, b in cfg.blocks.items():
         if b.label.strip() == "ENTRY":
             cfg.entry = bid
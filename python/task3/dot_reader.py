@@ -1,10 +1,14 @@
 # src/task3/dot_reader.py
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from task2.dot_parse import load_dot
+
+if TYPE_CHECKING:
+    from task2.cfg import CFG
 
 
 @dataclass
@@ -17,42 +21,26 @@ class DotCFG:
     def succs(self, nid: int) -> List[Tuple[int, Optional[str]]]:
         return self.edges.get(nid, [])
 
-
-_NODE_RE = re.compile(r'^\s*n(\d+)\s*\[\s*label\s*=\s*"(.*?)"\s*\]\s*;\s*$')
-# Examples:
-#   n4 -> n5 [label="True"];
-#   n12 -> n13;
-_EDGE_RE = re.compile(
-    r'^\s*n(\d+)\s*->\s*n(\d+)\s*(?:\[\s*label\s*=\s*"(.*?)"\s*\])?\s*;\s*$'
-)
+    @classmethod
+    def from_cfg(cls, cfg: "CFG") -> "DotCFG":
+        """
+        task2 CFG nesnesinden, DOT'a yazıp geri okumadan aynı görünümü kurar.
+        Etiketler kaçışsız (ham) gelir; successor listeleri kopyalanmaz.
+        """
+        nodes = {bid: b.label for bid, b in cfg.blocks.items()}
+        edges = {bid: b.succs for bid, b in cfg.blocks.items() if b.succs}
+        return cls(nodes=nodes, edges=edges)
 
 
 def parse_dot(path: str | Path) -> DotCFG:
-    p = Path(path)
-    text = p.read_text(encoding="utf-8", errors="replace").splitlines()
-
-    nodes: Dict[int, str] = {}
+    """task2.dot_parse ile tek geçişte okur; etiketler kaçışları çözülmüş gelir (from_cfg gibi)."""
+    g = load_dot(path)
     edges: Dict[int, List[Tuple[int, Optional[str]]]] = {}
-
-    for line in text:
-        m = _NODE_RE.match(line)
-        if m:
-            nid = int(m.group(1))
-            label = m.group(2)
-            nodes[nid] = label
-            continue
-
-        m = _EDGE_RE.match(line)
-        if m:
-            src = int(m.group(1))
-            dst = int(m.group(2))
-            lab = m.group(3)
-            if src not in edges:
-                edges[src] = []
-            edges[src].append((dst, lab))
-            continue
-
-    return DotCFG(nodes=nodes, edges=edges)
+    for src, dst, lab in g.edges():
+        if src not in edges:
+            edges[src] = []
+        edges[src].append((dst, lab))
+    return DotCFG(nodes=dict(g.labeled_nodes()), edges=edges)
 
 
 def find_node_by_label(cfg: DotCFG, wanted: str) -> Optional[int]:
@@ -4,11 +4,16 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from task2.graph import dfs_preorder
 
 from .dot_reader import DotCFG, parse_dot, find_node_by_label
 from .emit_asm_2addr import AsmProgram, emit_prolog, emit_epilog
 
+if TYPE_CHECKING:
+    from task2.cfg import CFG
+
 WORD = 4
 
 
@@ -203,19 +208,7 @@ def _label(nid: int) -> str:
 
 
 def _reachable(cfg: DotCFG, entry: int) -> List[int]:
-    seen: Set[int] = set()
-    order: List[int] = []
-
-    def dfs(u: int) -> None:
-        if u in seen:
-            return
-        seen.add(u)
-        order.append(u)
-        for v, _ in cfg.succs(u):
-            dfs(v)
-
-    dfs(entry)
-    return order
+    return dfs_preorder([entry], lambda u: [v for v, _ in cfg.succs(u)])
 
 
 def _choose_vars_from_cfg(cfg: DotCFG) -> List[str]:
@@ -327,15 +320,28 @@ def _emit_cond_branch(
 
 
 # -------------------------
-# Main entry: DOT -> ASM
+# Main entry: CFG -> ASM
 # -------------------------
 def generate_from_dot(dot_path: str | Path, asm_path: str | Path) -> None:
-    cfg = parse_dot(dot_path)
+    generate_asm(parse_dot(dot_path)).save(str(_prepare_out(asm_path)))
+
+
+def generate_from_cfg(cfg: "CFG", asm_path: str | Path) -> None:
+    """task2 CFG nesnesinden doğrudan ASM: DOT yazma/okuma turu yok."""
+    generate_asm(DotCFG.from_cfg(cfg)).save(str(_prepare_out(asm_path)))
+
+
+def _prepare_out(asm_path: str | Path) -> Path:
+    path = Path(asm_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
 
+def generate_asm(cfg: DotCFG) -> AsmProgram:
     entry = find_node_by_label(cfg, "ENTRY")
     exitn = find_node_by_label(cfg, "EXIT")
     if entry is None or exitn is None:
-        raise RuntimeError("DOT must contain ENTRY and EXIT nodes")
+        raise RuntimeError("CFG must contain ENTRY and EXIT nodes")
 
     vars_ = _choose_vars_from_cfg(cfg)
     mem = _alloc_layout(vars_ if vars_ else ["x"])
@@ -450,5 +456,4 @@ def generate_from_dot(dot_path: str | Path, asm_path: str | Path) -> None:
             emit_jmp(p, _label(succs[0][0]))
 
     emit_epilog(p)
-    Path(asm_path).parent.mkdir(parents=True, exist_ok=True)
-    p.save(str(asm_path))
+    return p
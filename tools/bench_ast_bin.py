@@ -0,0 +1,61 @@
+"""
+İkili AST formatı (.v3ast): büyük üretilmiş kaynakta parse_text (lark/pratt)
+ile dump_ast / load_ast sürelerini ve boyutları karşılaştırır.
+
+Kullanım (repo kökünden):
+  python tools/bench_ast_bin.py --funcs 2000 --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.ast import FuncDef  # noqa: E402
+from task1.astbin import dump_ast, load_ast  # noqa: E402
+from task1.parser import get_parser, parse_text  # noqa: E402
+
+
+def best_of(fn, repeat: int) -> tuple[object, float]:
+    best = float("inf")
+    out = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return out, best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--funcs", type=int, default=2000, help="generated function count")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    text = generate(args.funcs)
+    get_parser(inline=True)  # parser kurulumu ölçüme girmesin
+
+    res, t_lark = best_of(lambda: parse_text(text, inline=True), args.repeat)
+    _, t_pratt = best_of(lambda: parse_text(text, inline=True, backend="pratt"), args.repeat)
+    program = res.program
+    blob, t_dump = best_of(lambda: dump_ast(program), args.repeat)
+    loaded, t_load = best_of(lambda: load_ast(blob), args.repeat)
+    funcs = [x for x in program.items if isinstance(x, FuncDef)]   # NEWLINE ayırıcıları yazılmaz
+    assert loaded.items == funcs, "round-trip mismatch"
+
+    src_bytes = len(text.encode("utf-8"))
+    print(f"source: {src_bytes} bytes, {len(funcs)} functions")
+    print(f"  .v3ast size        {len(blob):10d} bytes ({len(blob) / src_bytes:.2f}x source)")
+    print(f"  parse_text (lark)  {t_lark * 1e3:10.1f} ms")
+    print(f"  parse_text (pratt) {t_pratt * 1e3:10.1f} ms")
+    print(f"  dump_ast           {t_dump * 1e3:10.1f} ms")
+    print(f"  load_ast           {t_load * 1e3:10.1f} ms  ({t_lark / t_load:.1f}x vs lark, {t_pratt / t_load:.1f}x vs pratt)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+"""
+task1.ast düğümlerinin bellek maliyeti: düğüm başına byte (nesne + varsa __dict__)
+ve tracemalloc ile AST'nin toplam tepe belleği.
+
+Kullanım (repo kökünden):
+  python tools/bench_ast_memory.py --funcs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.parser import get_parser, parse_text  # noqa: E402
+
+
+def node_bytes(root) -> tuple[int, int]:
+    count = 0
+    total = 0
+    seen = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, list):
+            total += sys.getsizeof(obj)
+            stack.extend(obj)
+            continue
+        if not is_dataclass(obj):
+            continue
+        count += 1
+        total += sys.getsizeof(obj)
+        d = getattr(obj, "__dict__", None)
+        if d is not None:
+            total += sys.getsizeof(d)
+        for f in fields(obj):
+            v = getattr(obj, f.name)
+            if isinstance(v, str):
+                if id(v) not in seen:
+                    seen.add(id(v))
+                    total += sys.getsizeof(v)
+            else:
+                stack.append(v)
+    return count, total
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--funcs", type=int, default=2000, help="generated function count")
+    args = ap.parse_args()
+
+    text = generate(args.funcs)
+    get_parser(inline=True, positions=False)
+
+    gc.collect()
+    tracemalloc.start()
+    res = parse_text(text, inline=True)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert not res.errors, res.errors
+
+    count, total = node_bytes(res.program)
+    print(f"source     : {len(text)} chars")
+    print(f"nodes      : {count}")
+    print(f"bytes/node : {total / count:.1f} (objects + __dict__ + unique strings + lists)")
+    print(f"AST held   : {held / 1e6:.2f} MB (tracemalloc, after parse)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""
+Erişilebilirlik budaması: küçük bir uygulama (main + --app fonksiyon) büyük bir
+"kütüphane" dosyasıyla (--lib fonksiyon, main'den hiç çağrılmaz) birlikte
+derlenir. task2.cli tam çalıştırma ile --prune (yalnızca main'den erişilebilen
+CFG'ler, aşağıdan yukarı SCC sırasıyla) ve codegen_2addr.generate_from_task2_dot_dir
+tüm dizin ile entry="main" karşılaştırılır.
+
+Kullanım (repo kökünden):
+  python tools/bench_callgraph_prune.py --app 20 --lib 2000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PY_DIR = Path(__file__).resolve().parents[1] / "python"
+sys.path.insert(0, str(PY_DIR))
+
+from gen_big_v3 import generate  # noqa: E402
+from task3.codegen_2addr import generate_from_task2_dot_dir  # noqa: E402
+
+
+def library_source(n_funcs: int) -> str:
+    # main'siz, f -> lib adlı fonksiyonlar (uygulamadaki adlarla çakışmaz)
+    text = generate(n_funcs)
+    text = text[:text.index("function main")]
+    return re.sub(r"\bf(\d+)", r"lib\1", text)
+
+
+def run_task2(files: list, out: Path, extra: list) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PY_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "task2.cli", *map(str, files), str(out), "--backend", "pratt", *extra],
+                   env=env, cwd=PY_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - t0
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--app", type=int, default=20, help="functions in the application file (all reachable)")
+    ap.add_argument("--lib", type=int, default=2000, help="functions in the unused library file")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        app, lib = tmp / "app.v3", tmp / "lib.v3"
+        app.write_text(generate(args.app), encoding="utf-8")
+        lib.write_text(library_source(args.lib), encoding="utf-8")
+
+        t_full = run_task2([app, lib], tmp / "full", [])
+        t_prune = run_task2([app, lib], tmp / "pruned", ["--prune"])
+        n_full = len(list((tmp / "full" / "graph").glob("*.dot")))
+        n_prune = len(list((tmp / "pruned" / "graph").glob("*.dot")))
+
+        graph = tmp / "full" / "graph"
+        c_full = timed(lambda: generate_from_task2_dot_dir(str(graph), str(tmp / "full.asm")))
+        c_prune = timed(lambda: generate_from_task2_dot_dir(str(graph), str(tmp / "pruned.asm"), entry="main"))
+
+        print(f"app={args.app} lib={args.lib}")
+        print(f"  task2 all functions   {t_full * 1e3:9.1f} ms  CFGs {n_full}")
+        print(f"  task2 --prune         {t_prune * 1e3:9.1f} ms  CFGs {n_prune}  speedup {t_full / t_prune:5.2f}x")
+        print(f"  codegen whole dir     {c_full * 1e3:9.1f} ms")
+        print(f"  codegen entry=main    {c_prune * 1e3:9.1f} ms  speedup {c_full / c_prune:5.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
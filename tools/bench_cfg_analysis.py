@@ -0,0 +1,65 @@
+"""
+task2.analysis: büyük tek fonksiyonlu CFG'de dominatör, post-dominatör ve
+döngü iç içelik ormanı süreleri; ikinci erişimin önbellekten geldiği de görülür.
+
+Kullanım (repo kökünden):
+  python tools/bench_cfg_analysis.py --stmts 40000 --nest 4
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from bench_cfg_csr import make_source  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+from task2.builder import CFGBuilder  # noqa: E402
+
+
+def nested_source(chunks: int, nest: int) -> str:
+    # her parça `nest` kat iç içe while içinde: döngü ormanı derinliği
+    head = "".join(f"while x > {k}\n" for k in range(nest))
+    tail = "wend\n" * nest
+    body = make_source(1).split("\n", 2)[2].rsplit("end function", 1)[0]
+    return ("function big(a as int, b as int) as int\ndim x, y as int\n"
+            + (head + body + tail) * chunks + "end function\n")
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--stmts", type=int, default=40000, help="approximate statement count")
+    ap.add_argument("--nest", type=int, default=4, help="extra while nesting around each chunk")
+    args = ap.parse_args()
+
+    text = nested_source(max(1, args.stmts // (8 + args.nest)), args.nest)
+    func = parse_text(text, inline=True, backend="pratt").program.items[0]
+    cfg = CFGBuilder().build_for_func(func)
+    a = cfg.analysis()
+
+    csr, t_csr = timed(lambda: a.csr)
+    dom, t_dom = timed(lambda: a.dom)
+    pdom, t_pdom = timed(lambda: a.pdom)
+    forest, t_loops = timed(lambda: a.loops)
+    _, t_again = timed(lambda: (a.dom, a.pdom, a.loops))
+
+    depth = max((lp.depth for lp in forest.loops), default=0)
+    print(f"nodes={csr.num_nodes} edges={csr.num_edges} loops={len(forest.loops)} max depth={depth}")
+    print(f"  CSR            {t_csr * 1e3:9.1f} ms")
+    print(f"  dominators     {t_dom * 1e3:9.1f} ms")
+    print(f"  postdominators {t_pdom * 1e3:9.1f} ms")
+    print(f"  loop forest    {t_loops * 1e3:9.1f} ms")
+    print(f"  cached again   {t_again * 1e6:9.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,111 @@
+"""
+task2.csr: dict + CFGBlock tabanlı CFG ile dizi tabanlı CSRCFG karşılaştırması
+(tek büyük fonksiyon). Bellek (tracemalloc), CFG -> CSR dönüşüm süresi, tüm
+kenarları gezme ve öncel/in-degree sorgusu maliyeti ölçülür.
+
+Kullanım (repo kökünden):
+  python tools/bench_cfg_csr.py --stmts 20000
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from task1.parser import parse_text  # noqa: E402
+from task2.builder import CFGBuilder  # noqa: E402
+from task2.csr import build_csr  # noqa: E402
+
+_CHUNK = """x = a + b * 2;
+if x > 0 then
+  y = x * 2;
+else
+  y = 0;
+end if
+while y > 0
+  y = y - 1;
+wend
+do
+  x = x + 1;
+  break
+loop until x > 10
+"""
+
+
+def make_source(chunks: int) -> str:
+    return "function big(a as int, b as int) as int\ndim x, y as int\n" + _CHUNK * chunks + "end function\n"
+
+
+def measured(fn):
+    # süre ve bellek ayrı çalıştırmalarda: tracemalloc süreyi şişirir
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    gc.collect()
+    tracemalloc.start()
+    out = fn()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, dt, size
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--stmts", type=int, default=20000, help="approximate statement count")
+    args = ap.parse_args()
+
+    text = make_source(max(1, args.stmts // 8))
+    func = parse_text(text, inline=True, backend="pratt").program.items[0]
+    builder = CFGBuilder()
+
+    cfg, t_cfg, b_cfg = measured(lambda: builder.build_for_func(func))
+    csr, t_csr, b_csr = measured(lambda: build_csr(cfg))
+    n, e = csr.num_nodes, csr.num_edges
+
+    def dict_edges() -> int:
+        k = 0
+        for b in cfg.blocks.values():
+            for _to, _lab in b.succs:
+                k += 1
+        return k
+
+    def csr_edges() -> int:
+        k = 0
+        dst = csr.succ_dst
+        for _v in dst:
+            k += 1
+        return k
+
+    def dict_preds() -> dict:
+        # CSR'sız analizlerin her seferinde yaptığı: in-degree / öncel haritası
+        preds = {bid: [] for bid in cfg.blocks}
+        for bid, b in cfg.blocks.items():
+            for to, _lab in b.succs:
+                preds[to].append(bid)
+        return preds
+
+    def csr_preds() -> int:
+        return sum(csr.in_degree(i) for i in range(n))
+
+    print(f"nodes={n} edges={e}")
+    print(f"  build CFG (dict)     {t_cfg * 1e3:9.1f} ms  traced {b_cfg / 1024:9.1f} KiB (incl. labels)")
+    print(f"  CFG -> CSR           {t_csr * 1e3:9.1f} ms  traced {b_csr / 1024:9.1f} KiB "
+          f"(arrays {csr.nbytes() / 1024:.1f} KiB; labels shared)")
+    print(f"  iterate edges        dict {timed(dict_edges) * 1e3:8.1f} ms   csr {timed(csr_edges) * 1e3:8.1f} ms")
+    print(f"  preds / in-degree    dict {timed(dict_preds) * 1e3:8.1f} ms   csr {timed(csr_preds) * 1e3:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
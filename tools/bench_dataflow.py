@@ -0,0 +1,103 @@
+"""
+task2.dataflow ölçeklenme ölçümü: binlerce değişkenli ve on binlerce deyimli
+tek bir fonksiyon üretilir (iç içe if / while / do içinde rastgele
+`vI = vJ op vK;` atamaları), CFG bir kez kurulur ve canlılık, erişen tanımlar
+ve kullanılabilir ifadeler ayrı ayrı zamanlanır (ayrıştırma, CFG kurma ve
+ortak hazırlık — deyim etkileri, döngü ormanı, öncelik sırası — ayrı satırda).
+visits/n: aktarım değerlendirmesi / düğüm sayısı (iş listesinin verimi).
+
+Kullanım (repo kökünden):
+  python tools/bench_dataflow.py --stmts 5000 20000 --vars 2000
+  python tools/bench_dataflow.py --stmts 20000 --vars 2000 --blocks
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from task1.parser import parse_text  # noqa: E402
+from task2.builder import BlockCFGBuilder, CFGBuilder  # noqa: E402
+from task2.dataflow import available_expressions, liveness, reaching_definitions  # noqa: E402
+
+
+def make_function(n_stmts: int, n_vars: int, seed: int = 1) -> str:
+    rnd = random.Random(seed)
+
+    def var() -> str:
+        return f"v{rnd.randrange(n_vars)}"
+
+    def assign() -> str:
+        return f"{var()} = {var()} {rnd.choice('+-*')} {var()};"
+
+    lines = ["function big(v0 as int) as int", f"dim {', '.join(f'v{i}' for i in range(1, n_vars))} as int"]
+    left = n_stmts
+    depth = 0
+    closers = []
+    while left > 0:
+        r = rnd.random()
+        if depth < 6 and r < 0.06:
+            lines.append(f"if {var()} > {var()} then")
+            closers.append("end if")
+            depth += 1
+        elif depth < 6 and r < 0.09:
+            lines.append(f"while {var()} < {var()}")
+            closers.append("wend")
+            depth += 1
+        elif depth < 6 and r < 0.10:
+            lines.append("do")
+            closers.append(f"loop until {var()} > {var()}")
+            depth += 1
+        elif depth and r < 0.18:
+            lines.append(closers.pop())
+            depth -= 1
+        else:
+            lines.append(assign())
+        left -= 1
+    lines.extend(reversed(closers))
+    lines.append("big = v0;")
+    lines.append("end function")
+    return "\n".join(lines) + "\n"
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    res = fn()
+    return res, time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--stmts", type=int, nargs="+", default=[5000, 20000])
+    ap.add_argument("--vars", type=int, default=2000)
+    ap.add_argument("--blocks", action="store_true", help="basic-block CFGs (BlockCFGBuilder)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    builder = BlockCFGBuilder() if args.blocks else CFGBuilder()
+    print(f"{'stmts':>7s} {'nodes':>7s} {'analysis':>10s} {'bits':>7s} {'time':>10s} {'visits/n':>8s}")
+    for stmts in args.stmts:
+        res = parse_text(make_function(stmts, args.vars, args.seed), inline=True, backend="pratt")
+        cfg = builder.build_for_func(res.program.items[0])
+        an = cfg.analysis()
+        n = an.csr.num_nodes
+
+        # ortak ön hazırlık: deyim etkileri, döngü ormanı ve öncelik sırası (önbellekli)
+        _, dt = timed(lambda: (an.effects, an.dataflow_order))
+        print(f"{stmts:7d} {n:7d} {'prepare':>10s} {'':>7s} {dt * 1e3:7.0f} ms")
+        for name, run, width in (
+            ("liveness", lambda: liveness(cfg), lambda r: len(r.vars)),
+            ("reaching", lambda: reaching_definitions(cfg), lambda r: len(r.defs)),
+            ("available", lambda: available_expressions(cfg), lambda r: len(r.exprs)),
+        ):
+            r, dt = timed(run)
+            print(f"{stmts:7d} {n:7d} {name:>10s} {width(r):7d} {dt * 1e3:7.0f} ms {r.result.visits / n:8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""
+DOT okuma verimi: büyük bir fonksiyonun CFG'si (deyim düzeyi ya da --blocks ile
+temel blok düzeyi) cfg_to_dot ile birkaç MB'lık bir .dot dosyasına yazılır ve
+task2.dot_parse.load_dot ile onu kullanan dört okuyucu (dot_blockify,
+dot_reader, dot_cfg_loader, codegen_2addr) zamanlanır. Karşılaştırma için
+satır satır regex ile okuyan eski yöntemin sadeleştirilmiş hali de ("regex
+lines") ölçülür. Sütunlar: en iyi süre ve MB/s.
+
+Kullanım (repo kökünden):
+  python tools/bench_dot_parse.py --chunks 2000 8000
+  python tools/bench_dot_parse.py --chunks 8000 --blocks
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from bench_cfg_csr import make_source  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+from task2 import dot_blockify  # noqa: E402
+from task2.builder import BlockCFGBuilder, CFGBuilder  # noqa: E402
+from task2.dot_parse import load_dot  # noqa: E402
+from task2.render import cfg_to_dot  # noqa: E402
+from task3 import codegen_2addr, dot_cfg_loader, dot_reader  # noqa: E402
+
+_NODE_RE = re.compile(r'^\s*n(\d+)\s*\[label="(.*)"\];\s*$')
+_EDGE_RE = re.compile(r'^\s*n(\d+)\s*->\s*n(\d+)(?:\s*\[label="([^"]*)"\])?;\s*$')
+
+
+def regex_lines(path: Path):
+    # eski okuyucuların yaptığı: satır başına iki regex, kaçışlar çözülmez
+    nodes, edges = {}, []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            m = _NODE_RE.match(line)
+            if m:
+                nodes[int(m.group(1))] = m.group(2)
+                continue
+            m = _EDGE_RE.match(line)
+            if m:
+                edges.append((int(m.group(1)), int(m.group(2)), m.group(3)))
+    return nodes, edges
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--chunks", type=int, nargs="+", default=[2000, 8000])
+    ap.add_argument("--blocks", action="store_true", help="basic-block CFGs (BlockCFGBuilder)")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    builder = BlockCFGBuilder() if args.blocks else CFGBuilder()
+    readers = (
+        ("regex lines", regex_lines),
+        ("load_dot", load_dot),
+        ("dot_blockify", dot_blockify.parse_dot),
+        ("dot_reader", dot_reader.parse_dot),
+        ("dot_cfg_loader", dot_cfg_loader.load_cfg_from_dot),
+        ("codegen_2addr", codegen_2addr.parse_dot_cfg),
+    )
+    with tempfile.TemporaryDirectory() as d:
+        for chunks in args.chunks:
+            res = parse_text(make_source(chunks), inline=True, backend="pratt")
+            cfg = builder.build_for_func(res.program.items[0])
+            path = Path(d) / f"big{chunks}.dot"
+            path.write_text(cfg_to_dot(cfg), encoding="utf-8")
+            mb = path.stat().st_size / 1e6
+            g = load_dot(path)
+            print(f"chunks={chunks} nodes={g.num_nodes} edges={g.num_edges} size={mb:.1f} MB")
+            for name, fn in readers:
+                dt = best_of(lambda: fn(path), args.repeat)
+                print(f"  {name:15s} {dt * 1e3:9.1f} ms {mb / dt:8.1f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
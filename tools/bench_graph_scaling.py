@@ -0,0 +1,91 @@
+"""
+task2.graph ölçekleme: 10^3..10^6 düğümlü zincir (en derin DFS) ve döngülü
+merdiven graflarında özyinelemesiz DFS / numaralandırma / erişilebilirlik
+süreleri; ayrıca ona geçirilen çağrı yerleri (dot_to_asm_2addr._reachable,
+codegen_2addr.dfs_order, dot_blockify.blockify) aynı boyutlarda çalıştırılır.
+Eski özyinelemeli sürümler ~1000 düğümde RecursionError veriyordu.
+
+Kullanım (repo kökünden):
+  python tools/bench_graph_scaling.py --max-exp 6
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from task2 import dot_blockify  # noqa: E402
+from task2.graph import csr_postorder, dfs, iter_dfs, reachable  # noqa: E402
+from task3 import codegen_2addr, dot_reader, dot_to_asm_2addr  # noqa: E402
+
+
+def chain(n: int) -> list:
+    # 0 -> 1 -> ... -> n-1
+    return [[i + 1] if i + 1 < n else [] for i in range(n)]
+
+
+def ladder(n: int) -> list:
+    # her 4 düğümde bir koşul + geri kenar (while benzeri)
+    succ = [[] for _ in range(n)]
+    for i in range(n - 1):
+        succ[i].append(i + 1)
+        if i % 4 == 3:
+            succ[i].append(i - 3)
+    return succ
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--max-exp", type=int, default=6, help="largest graph is 10^max_exp nodes")
+    args = ap.parse_args()
+
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'graph':>7s} {'n':>8s} {'iter_dfs':>9s} {'dfs+num':>9s} {'reach':>9s} {'csr_post':>9s}"
+          f" {'_reachable':>10s} {'dfs_order':>9s} {'blockify':>9s}   (ms)")
+    for exp in range(3, args.max_exp + 1):
+        n = 10 ** exp
+        for kind, succ in (("chain", chain(n)), ("ladder", ladder(n))):
+            get = succ.__getitem__
+            order, t_iter = timed(lambda: list(iter_dfs([0], get)))
+            num, t_dfs = timed(lambda: dfs([0], get))
+            seen, t_reach = timed(lambda: reachable([0], get))
+            assert len(order) == len(num.postorder) == len(seen) == n
+            assert len(num.back_edges) == (0 if kind == "chain" else (n - 1) // 4)
+
+            off = [0]
+            dst = []
+            for s in succ:
+                dst.extend(s)
+                off.append(len(dst))
+            post, t_post = timed(lambda: csr_postorder(0, off, dst, n))
+            assert len(post) == n
+
+            # çağrı yerleri: aynı graf, her birinin kendi CFG görünümüyle
+            labels = {i: "x = 1;" for i in range(n)}
+            labels[0] = "ENTRY"
+            edges = {i: [(v, None) for v in s] for i, s in enumerate(succ) if s}
+            d2a = dot_reader.DotCFG(nodes=labels, edges=edges)
+            _, t_r = timed(lambda: dot_to_asm_2addr._reachable(d2a, 0))
+            blocks = {i: codegen_2addr.DotCFGBlock(id=i, label=labels[i], succs=edges.get(i, []))
+                      for i in range(n)}
+            cg = codegen_2addr.DotCFG(name="g", blocks=blocks, entry=0, exit=n - 1)
+            _, t_o = timed(lambda: codegen_2addr.dfs_order(cg))
+            bl = dot_blockify.DotCFG(nodes=labels, edges=[(u, v, None) for u, s in enumerate(succ) for v in s])
+            _, t_b = timed(lambda: dot_blockify.blockify(bl))
+
+            print(f"{kind:>7s} {n:8d} {t_iter * 1e3:9.1f} {t_dfs * 1e3:9.1f} {t_reach * 1e3:9.1f}"
+                  f" {t_post * 1e3:9.1f} {t_r * 1e3:10.1f} {t_o * 1e3:9.1f} {t_b * 1e3:9.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
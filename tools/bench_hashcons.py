@@ -0,0 +1,68 @@
+"""
+Hash-consing (task1.hashcons.ExprTable): paylaşımlı ifade düğümleriyle
+AST'deki tekil nesne sayısı / bellek, parse süresi ve ifade eşitlik kontrolü
+maliyeti (yapısal == ile paylaşımlı `is`) karşılaştırması.
+
+Kullanım (repo kökünden):
+  python tools/bench_hashcons.py --funcs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from bench_ast_memory import node_bytes  # noqa: E402
+from gen_big_v3 import generate  # noqa: E402
+from task1.ast import Expr  # noqa: E402
+from task1.hashcons import ExprTable  # noqa: E402
+from task1.parser import get_parser, parse_text  # noqa: E402
+from task1.visitor import walk  # noqa: E402
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return out, time.perf_counter() - t0
+
+
+def expr_roots(program) -> list:
+    return [n for n in walk(program) if isinstance(n, Expr)]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--funcs", type=int, default=2000, help="generated function count")
+    args = ap.parse_args()
+
+    text = generate(args.funcs)
+    get_parser(inline=True)
+
+    for backend in ("lark", "pratt"):
+        plain, t_plain = timed(lambda: parse_text(text, inline=True, backend=backend).program)
+        table = ExprTable()
+        consed, t_cons = timed(lambda: parse_text(text, inline=True, backend=backend, exprs=table).program)
+        assert consed == plain, "hash-consed AST differs"
+
+        n_plain, b_plain = node_bytes(plain)
+        n_cons, b_cons = node_bytes(consed)
+        print(f"{backend}:")
+        print(f"  parse          plain {t_plain * 1e3:8.1f} ms   hash-consed {t_cons * 1e3:8.1f} ms")
+        print(f"  unique nodes   plain {n_plain:8d}      hash-consed {n_cons:8d}  ({len(table)} shared exprs)")
+        print(f"  AST bytes      plain {b_plain:8d}      hash-consed {b_cons:8d}  ({b_cons / b_plain:.2f}x)")
+
+    # eşitlik: her ifadeyi bir sonrakiyle karşılaştır
+    a = expr_roots(plain)
+    b = expr_roots(consed)
+    _, t_eq = timed(lambda: sum(1 for x, y in zip(a, a[1:]) if x == y))
+    _, t_is = timed(lambda: sum(1 for x, y in zip(b, b[1:]) if x is y))
+    _, t_key = timed(lambda: [table.id_of(x) for x in b])
+    print(f"equality over {len(a)} expr pairs: == {t_eq * 1e3:.1f} ms, is {t_is * 1e3:.1f} ms; id_of() {t_key * 1e3:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
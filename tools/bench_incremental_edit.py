@@ -0,0 +1,67 @@
+"""
+Editör senaryosu: büyük bir kaynakta tek karakterlik düzenlemeden sonra
+IncrementalParser.edit() gecikmesi, tam parse ile karşılaştırmalı. Son
+düzenlemeden sonraki AST tam parse ile karşılaştırılır. treesitter backend'i
+ilk kullanımda derlenir; süreler ısınmadan (parser yükleme) sonra ölçülür.
+
+Kullanım (repo kökünden):
+  python tools/bench_incremental_edit.py --funcs 2000 --edits 200
+  python tools/bench_incremental_edit.py --backends treesitter
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.ast import FuncDef  # noqa: E402
+from task1.incremental import IncrementalParser  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--funcs", type=int, default=2000)
+    ap.add_argument("--edits", type=int, default=200)
+    ap.add_argument("--backends", nargs="+", default=["lark", "pratt", "treesitter"])
+    args = ap.parse_args()
+
+    text = generate(args.funcs)
+    # "x = a + b * 2;" satırlarındaki "2" rakamını değiştir: AST değişir, sözdizimi bozulmaz
+    sites = [i + len("x = a + b * ") for i in range(len(text)) if text.startswith("x = a + b * 2;", i)]
+    print(f"source: {len(text)} chars, {args.funcs} functions")
+
+    for backend in args.backends:
+        parse_text("", inline=True, backend=backend)
+        t0 = time.perf_counter()
+        parse_text(text, inline=True, backend=backend)
+        full = time.perf_counter() - t0
+
+        ip = IncrementalParser(backend=backend)
+        ip.parse(text)
+        rnd = random.Random(0)
+        lat = []
+        cur = text
+        for _ in range(args.edits):
+            pos = rnd.choice(sites)
+            digit = str(rnd.randrange(10))
+            t0 = time.perf_counter()
+            res = ip.edit(pos, pos + 1, digit)
+            lat.append(time.perf_counter() - t0)
+            assert not res.errors and res.reparsed <= 1
+            cur = cur[:pos] + digit + cur[pos + 1:]
+        ref = parse_text(cur, inline=True)
+        assert res.program.items == [f for f in ref.program.items if isinstance(f, FuncDef)]
+        print(f"  {backend:10s} full parse {full * 1000:9.1f} ms | edit median {statistics.median(lat) * 1000:7.3f} ms"
+              f"  p95 {sorted(lat)[int(len(lat) * 0.95)] * 1000:7.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
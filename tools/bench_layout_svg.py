@@ -0,0 +1,73 @@
+"""
+Büyük fonksiyon CFG'lerinde SVG üretimi: task2.svg (yerleşik katmanlı yerleşim,
+süreç içi) ile Graphviz `dot -Tsvg` karşılaştırması. Her boyut için düğüm
+sayısı, süre ve düğüm başına süre yazdırılır (yerleşik motorda düğüm başına
+sürenin sabit kalması yaklaşık doğrusal ölçeklenme demektir).
+
+`dot` PATH'te yoksa ya da --dot-timeout aşılırsa o sütun "n/a" / "timeout" olur.
+
+Kullanım (repo kökünden):
+  python tools/bench_layout_svg.py --stmts 1000 4000 16000
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from bench_cfg_csr import make_source  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+from task2.builder import BlockCFGBuilder, CFGBuilder  # noqa: E402
+from task2.render import cfg_to_dot  # noqa: E402
+from task2.svg import cfg_to_svg  # noqa: E402
+
+
+def time_dot(dot_text: str, timeout: float) -> str:
+    with tempfile.TemporaryDirectory() as d:
+        src = Path(d) / "g.dot"
+        src.write_text(dot_text, encoding="utf-8")
+        t0 = time.perf_counter()
+        try:
+            subprocess.run(["dot", "-Tsvg", str(src), "-o", str(Path(d) / "g.svg")],
+                           check=True, timeout=timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except subprocess.TimeoutExpired:
+            return "timeout"
+        except subprocess.CalledProcessError:
+            return "error"
+        return f"{(time.perf_counter() - t0) * 1e3:.0f} ms"
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--stmts", type=int, nargs="+", default=[1000, 4000, 16000],
+                    help="approximate statement counts of the generated function")
+    ap.add_argument("--blocks", action="store_true", help="basic-block CFGs (BlockCFGBuilder)")
+    ap.add_argument("--dot-timeout", type=float, default=300.0, help="seconds")
+    args = ap.parse_args()
+
+    have_dot = shutil.which("dot") is not None
+    builder = BlockCFGBuilder() if args.blocks else CFGBuilder()
+    print(f"{'nodes':>8s} {'edges':>8s} {'builtin':>10s} {'us/node':>8s} {'svg KiB':>8s} {'dot -Tsvg':>10s}")
+    for stmts in args.stmts:
+        func = parse_text(make_source(max(1, stmts // 8)), inline=True, backend="pratt").program.items[0]
+        cfg = builder.build_for_func(func)
+        n = len(cfg.blocks)
+        e = sum(len(b.succs) for b in cfg.blocks.values())
+
+        t0 = time.perf_counter()
+        svg = cfg_to_svg(cfg)
+        dt = time.perf_counter() - t0
+
+        dot = time_dot(cfg_to_dot(cfg), args.dot_timeout) if have_dot else "n/a"
+        print(f"{n:8d} {e:8d} {dt * 1e3:7.0f} ms {dt / n * 1e6:8.1f} {len(svg) / 1024:8.0f} {dot:>10s}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
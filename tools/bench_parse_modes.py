@@ -0,0 +1,63 @@
+"""
+task1: iki geçişli parse (tree + AstBuilder.transform) ile inline (tree-less)
+parse'ın süre ve tepe bellek karşılaştırması.
+
+Kullanım (repo kökünden):
+  python tools/bench_parse_modes.py --funcs 2000 --runs 3
+  python tools/bench_parse_modes.py --input examples_v1/calls_demo_fib.v3
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.parser import get_parser, parse_text  # noqa: E402
+
+
+def measure(text: str, inline: bool, positions: bool, runs: int):
+    get_parser(inline=inline, positions=positions)  # tablolar ölçüme dahil değil
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        res = parse_text(text, inline=inline, positions=positions)
+        best = min(best, time.perf_counter() - t0)
+        assert not res.errors, res.errors
+    tracemalloc.start()
+    parse_text(text, inline=inline, positions=positions)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--input", help="Input .v3 file (default: generated)")
+    ap.add_argument("--funcs", type=int, default=2000, help="generated function count")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    text = Path(args.input).read_text(encoding="utf-8") if args.input else generate(args.funcs)
+    print(f"source: {len(text)} chars")
+
+    rows = [
+        ("two-pass (tree, positions)", False, True),
+        ("inline   (positions)", True, True),
+        ("inline   (no positions)", True, False),
+    ]
+    base_t = None
+    for name, inline, positions in rows:
+        t, peak = measure(text, inline, positions, args.runs)
+        if base_t is None:
+            base_t = t
+        print(f"{name:28s} time={t * 1000:9.1f} ms  peak={peak / 1e6:8.1f} MB  speedup=x{base_t / t:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,62 @@
+"""
+task1 parser cold/warm başlangıç süresi karşılaştırması.
+
+  cold   : V3_PARSER_CACHE=0  -> her süreçte LALR tabloları sıfırdan
+  first  : boş cache dizini   -> tablolar üretilir + diske yazılır
+  warm   : dolu cache dizini  -> tablolar diskten yüklenir
+
+Kullanım (repo kökünden):
+  python tools/bench_parser_startup.py examples_v1/ok_all_constructs.v3 --runs 10
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PY_DIR = Path(__file__).resolve().parents[1] / "python"
+
+SNIPPET = (
+    "import sys\n"
+    "from task1.parser import parse_text\n"
+    "res = parse_text(open(sys.argv[1], encoding='utf-8').read())\n"
+    "sys.exit(1 if res.errors else 0)\n"
+)
+
+
+def run_once(src: Path, cache_value: str) -> float:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PY_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    env["V3_PARSER_CACHE"] = cache_value
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-c", SNIPPET, str(src)], env=env, check=True)
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("input", help="Input .v3 source file")
+    ap.add_argument("--runs", type=int, default=10)
+    args = ap.parse_args()
+
+    src = Path(args.input)
+    with tempfile.TemporaryDirectory() as d:
+        cold = [run_once(src, "0") for _ in range(args.runs)]
+        first = run_once(src, d)
+        warm = [run_once(src, d) for _ in range(args.runs)]
+
+    print(f"runs={args.runs} input={src}")
+    print(f"cold  (no cache)  : median={statistics.median(cold) * 1000:8.1f} ms")
+    print(f"first (write)     : {first * 1000:8.1f} ms")
+    print(f"warm  (from cache): median={statistics.median(warm) * 1000:8.1f} ms")
+    print(f"speedup           : x{statistics.median(cold) / statistics.median(warm):.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
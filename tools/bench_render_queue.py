@@ -0,0 +1,89 @@
+"""
+Graphviz çizim maliyeti: grafik ve biçim başına bir `dot` süreci (task2.render.run_dot,
+eski --png --svg yolu) ile task2.render_queue.RenderQueue (biçimler tek çağrıda,
+küçük grafikler ortak çağrıda, sınırlı eşzamanlılık) karşılaştırması. Üçüncü
+satır ikinci çalıştırmadır: DOT içeriği değişmediği için tüm çizimler atlanır.
+
+Girdi: gen_big_v3 ile üretilen programın fonksiyon CFG'leri (tek dizinde .dot).
+`dot` bulunamazsa ölçüm yapılmaz (çıkış kodu 2).
+
+Kullanım (repo kökünden):
+  python tools/bench_render_queue.py --funcs 300 --jobs 4
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.ast import FuncDef  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+from task2.builder import CFGBuilder  # noqa: E402
+from task2.render import cfg_to_dot, run_dot  # noqa: E402
+from task2.render_queue import RenderQueue  # noqa: E402
+
+
+def write_dots(n_funcs: int, out: Path) -> list:
+    prog = parse_text(generate(n_funcs), inline=True, backend="pratt").program
+    builder = CFGBuilder()
+    paths = []
+    for func in (x for x in prog.items if isinstance(x, FuncDef)):
+        p = out / f"{func.signature.name}.dot"
+        p.write_text(cfg_to_dot(builder.build_for_func(func)), encoding="utf-8")
+        paths.append(p)
+    return paths
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--funcs", type=int, default=300)
+    ap.add_argument("--jobs", type=int, default=None, help="RenderQueue concurrency (default: CPU count)")
+    ap.add_argument("--formats", default="png,svg")
+    args = ap.parse_args()
+
+    if shutil.which("dot") is None:
+        print("'dot' not found on PATH; install Graphviz to run this benchmark", file=sys.stderr)
+        return 2
+    formats = args.formats.split(",")
+
+    with tempfile.TemporaryDirectory() as d:
+        old_dir, new_dir = Path(d) / "old", Path(d) / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        old = write_dots(args.funcs, old_dir)
+        new = write_dots(args.funcs, new_dir)
+
+        t0 = time.perf_counter()
+        for p in old:
+            for fmt in formats:
+                run_dot(p, p.with_suffix("." + fmt))
+        t_old = time.perf_counter() - t0
+        calls_old = len(old) * len(formats)
+
+        rows = []
+        for run in ("cold", "warm"):
+            q = RenderQueue(formats, jobs=args.jobs)
+            t0 = time.perf_counter()
+            for p in new:
+                q.submit(p)
+            results = q.close()
+            dt = time.perf_counter() - t0
+            failed = sum(r.error is not None for r in results)
+            rows.append((run, dt, q.invocations, sum(r.skipped for r in results), failed))
+
+        print(f"graphs={len(old)} formats={','.join(formats)}")
+        print(f"  {'run_dot (serial)':22s} {t_old * 1e3:9.1f} ms  dot calls {calls_old}")
+        for run, dt, calls, skipped, failed in rows:
+            print(f"  {'RenderQueue ' + run:22s} {dt * 1e3:9.1f} ms  dot calls {calls:<5d} "
+                  f"speedup {t_old / dt:6.2f}x  skipped {skipped}  failed {failed}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,66 @@
+"""
+task2: tüm dosyayı parse eden normal mod ile --stream modunun tepe RSS karşılaştırması.
+Üretilen kaynak boyutu arttıkça normal mod büyür, --stream yaklaşık sabit kalmalı.
+
+Kullanım (repo kökünden, Linux/macOS):
+  python tools/bench_stream_memory.py --sizes 500 2000 8000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from gen_big_v3 import generate
+
+PY_DIR = Path(__file__).resolve().parents[1] / "python"
+
+# ayrı bir ara süreç: RUSAGE_CHILDREN sadece bu çocuğun tepe değerini görsün
+WRAPPER = (
+    "import resource, subprocess, sys\n"
+    "subprocess.run(sys.argv[1:], check=True, stdout=subprocess.DEVNULL)\n"
+    "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)\n"
+)
+
+
+def peak_rss_kb(src: Path, out_dir: Path, stream: bool) -> tuple[int, float]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PY_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    cmd = [sys.executable, "-m", "task2.cli", str(src), str(out_dir)]
+    if stream:
+        cmd.append("--stream")
+    t0 = time.perf_counter()
+    r = subprocess.run([sys.executable, "-c", WRAPPER, *cmd], env=env, check=True,
+                       capture_output=True, text=True)
+    dt = time.perf_counter() - t0
+    rss = int(r.stdout.strip().splitlines()[-1])
+    if sys.platform == "darwin":
+        rss //= 1024  # macOS: byte
+    return rss, dt
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 8000],
+                    help="generated function counts")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as d:
+        d = Path(d)
+        for n in args.sizes:
+            src = d / f"big_{n}.v3"
+            src.write_text(generate(n), encoding="utf-8")
+            mb = src.stat().st_size / 1e6
+            full, t_full = peak_rss_kb(src, d / f"full_{n}", stream=False)
+            strm, t_strm = peak_rss_kb(src, d / f"stream_{n}", stream=True)
+            print(f"funcs={n:6d} src={mb:7.2f} MB | full: {full / 1024:7.1f} MB {t_full:6.1f}s"
+                  f" | stream: {strm / 1024:7.1f} MB {t_strm:6.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,87 @@
+"""
+task2.cli --jobs: seri çalıştırma ile süreç havuzu karşılaştırması. gen_big_v3
+ile N dosyalık bir korpus üretilir, her --jobs değeri için duvar saati ölçülür
+ve çıktı dizinlerinin seri çıktıyla bayt bayt aynı olduğu doğrulanır
+(PYTHONHASHSEED sabitlenir: call_graph kenar sırası set sırasına bağlı).
+
+Kullanım (repo kökünden):
+  python tools/bench_task2_jobs.py --files 16 --funcs 200 --jobs 1 2 4 8
+  python tools/bench_task2_jobs.py --files 1 --funcs 3000 --jobs 1 4   # tek büyük dosya
+"""
+from __future__ import annotations
+
+import argparse
+import filecmp
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PY_DIR = Path(__file__).resolve().parents[1] / "python"
+sys.path.insert(0, str(PY_DIR))
+
+from gen_big_v3 import generate  # noqa: E402
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PY_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    env["PYTHONHASHSEED"] = "0"
+    return env
+
+
+def run(files: list, out: Path, jobs: int, extra: list, env: dict) -> float:
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "task2.cli", *map(str, files), str(out), "--jobs", str(jobs), *extra],
+                   env=env, cwd=PY_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    return time.perf_counter() - t0
+
+
+def same_tree(a: Path, b: Path) -> bool:
+    cmp = filecmp.dircmp(a, b)
+    if cmp.left_only or cmp.right_only or cmp.funny_files:
+        return False
+    _, mismatch, errors = filecmp.cmpfiles(a, b, cmp.common_files, shallow=False)
+    if mismatch or errors:
+        return False
+    return all(same_tree(a / d, b / d) for d in cmp.common_dirs)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--files", type=int, default=16, help="number of generated input files")
+    ap.add_argument("--funcs", type=int, default=200, help="functions per file")
+    ap.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    ap.add_argument("--runs", type=int, default=3)
+    ap.add_argument("--sema", action="store_true", help="also pass --sema")
+    args = ap.parse_args()
+
+    env = _env()
+    extra = ["--sema"] if args.sema else []
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        files = []
+        for i in range(args.files):
+            f = tmp / f"in{i:03d}.v3"
+            f.write_text(generate(args.funcs), encoding="utf-8")
+            files.append(f)
+
+        ref = tmp / "out_serial"
+        t_ref = statistics.median(run(files, ref, 1, extra, env) for _ in range(args.runs))
+        print(f"files={args.files} funcs/file={args.funcs} cpus={os.cpu_count()} runs={args.runs} (median)")
+        print(f"{'jobs':>5s} {'wall ms':>10s} {'speedup':>8s}  output")
+        print(f"{1:5d} {t_ref * 1e3:10.1f} {1.0:7.2f}x  reference")
+        for jobs in args.jobs:
+            if jobs <= 1:
+                continue
+            out = tmp / f"out_j{jobs}"
+            t = statistics.median(run(files, out, jobs, extra, env) for _ in range(args.runs))
+            print(f"{jobs:5d} {t * 1e3:10.1f} {t_ref / t:7.2f}x  {'same' if same_tree(ref, out) else 'DIFF'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+"""
+task3 uçtan uca gecikme: eski yol (task2.cli alt süreci DOT yazar, task3 DOT'u
+regex ile geri okur) ile tek süreçli yol (parse_text -> CFGBuilder -> codegen,
+CFG bellekte) karşılaştırması. Her girdi için üretilen ASM'lerin aynı olduğu da
+doğrulanır ("no asm": iki yol da ASM üretemedi, örn. sözdizimi hatası ya da
+codegen'in desteklemediği çağrılar — üretilmiş --funcs girdisi de böyledir,
+orada ölçülen parse + CFG + başarısız codegen süresidir).
+
+  subprocess : python -m task2.cli IN OUT  +  python -m task3.cli ... --from-dot
+  in-process : python -m task3.cli IN OUT --asm ...
+
+Kullanım (repo kökünden):
+  python tools/bench_task3_pipeline.py examples_v1/*.v3 --runs 5
+  python tools/bench_task3_pipeline.py --funcs 500 --runs 3
+"""
+from __future__ import annotations
+
+import argparse
+import filecmp
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PY_DIR = Path(__file__).resolve().parents[1] / "python"
+sys.path.insert(0, str(PY_DIR))
+
+from gen_big_v3 import generate  # noqa: E402
+
+
+def _env() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(PY_DIR) + os.pathsep + env.get("PYTHONPATH", "")
+    return env
+
+
+def _run(args: list, env: dict) -> int:
+    return subprocess.run([sys.executable, "-m", *args], env=env, cwd=PY_DIR,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode
+
+
+def run_subprocess_path(src: Path, work: Path, env: dict) -> float:
+    asm = work / "old.asm"
+    t0 = time.perf_counter()
+    _run(["task2.cli", str(src), str(work / "old")], env)
+    _run(["task3.cli", str(src), str(work / "old"), "--asm", str(asm), "--from-dot"], env)
+    return time.perf_counter() - t0
+
+
+def run_inprocess_path(src: Path, work: Path, env: dict) -> float:
+    asm = work / "new.asm"
+    t0 = time.perf_counter()
+    _run(["task3.cli", str(src), str(work / "new"), "--asm", str(asm)], env)
+    return time.perf_counter() - t0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("inputs", nargs="*", help="Input .v3 source files")
+    ap.add_argument("--funcs", type=int, default=0, help="also bench a generated input with N functions")
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    env = _env()
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        inputs = [Path(p).resolve() for p in args.inputs]
+        if args.funcs:
+            big = tmp / f"gen_{args.funcs}.v3"
+            big.write_text(generate(args.funcs), encoding="utf-8")
+            inputs.append(big)
+        if not inputs:
+            ap.error("no inputs (give .v3 files and/or --funcs N)")
+
+        print(f"runs={args.runs} (median, ms)")
+        print(f"{'input':32s} {'subprocess':>11s} {'in-process':>11s} {'speedup':>8s}  asm")
+        for src in inputs:
+            work = tmp / src.stem
+            work.mkdir()
+            old = [run_subprocess_path(src, work, env) for _ in range(args.runs)]
+            new = [run_inprocess_path(src, work, env) for _ in range(args.runs)]
+            old_asm, new_asm = work / "old.asm", work / "new.asm"
+            if not old_asm.exists() and not new_asm.exists():
+                same = "no asm"
+            elif old_asm.exists() and new_asm.exists() and filecmp.cmp(old_asm, new_asm, shallow=False):
+                same = "same"
+            else:
+                same = "DIFF"
+            t_old = statistics.median(old)
+            t_new = statistics.median(new)
+            print(f"{src.name:32s} {t_old * 1e3:11.1f} {t_new * 1e3:11.1f} {t_old / t_new:7.2f}x  {same}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""
+AST gezinme/dispatch maliyeti (düğüm başına ns): eski tarz yansıma
+(is_dataclass/fields) ve isinstance zinciri ile task1.visitor'ın tip anahtarlı
+Visitor'ı ve açık yığınlı walk()'u karşılaştırır.
+
+İki şekil ölçülür:
+  deep: --depth derinliğinde iç içe Binary zinciri
+  wide: --width elemanlı tek seviyeli çağrı argümanları + üretilmiş büyük program
+
+Kullanım (repo kökünden):
+  python tools/bench_visitor.py --depth 2000 --width 20000 --funcs 500
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.ast import Assign, Binary, CallOrIndexer, Literal, Place, Unary  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+from task1.visitor import Visitor, walk  # noqa: E402
+
+
+def reflect_count(obj) -> int:
+    # eski dot_export.walk deseni: her düğümde is_dataclass + fields()
+    n = 1
+    for f in fields(obj):
+        val = getattr(obj, f.name)
+        if isinstance(val, list):
+            for item in val:
+                if is_dataclass(item):
+                    n += reflect_count(item)
+        elif is_dataclass(val):
+            n += reflect_count(val)
+    return n
+
+
+def chain_count(e) -> int:
+    # eski CFGBuilder._collect_calls deseni: isinstance zinciri
+    if isinstance(e, CallOrIndexer):
+        return 1 + chain_count(e.callee) + sum(chain_count(a) for a in e.args)
+    if isinstance(e, Unary):
+        return 1 + chain_count(e.rhs)
+    if isinstance(e, Binary):
+        return 1 + chain_count(e.lhs) + chain_count(e.rhs)
+    if isinstance(e, Assign):
+        return 1 + chain_count(e.lhs) + chain_count(e.rhs)
+    return 1
+
+
+class _Counter(Visitor):
+    def __init__(self) -> None:
+        self.n = 0
+
+    def generic_visit(self, node) -> None:
+        self.n += 1
+        Visitor.generic_visit(self, node)
+
+
+def visitor_count(root) -> int:
+    v = _Counter()
+    v.visit(root)
+    return v.n
+
+
+def walk_count(root) -> int:
+    n = 0
+    for _ in walk(root):
+        n += 1
+    return n
+
+
+def deep_tree(depth: int):
+    e = Place(name="x")
+    for i in range(depth):
+        e = Binary(op="+", lhs=e, rhs=Literal(kind="dec", value=str(i)))
+    return e
+
+
+def wide_tree(width: int):
+    return CallOrIndexer(callee=Place(name="f"), args=[Place(name=f"a{i}") for i in range(width)])
+
+
+def bench(fn, root, repeat: int) -> tuple[int, float]:
+    best = float("inf")
+    n = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        n = fn(root)
+        best = min(best, time.perf_counter() - t0)
+    return n, best
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--depth", type=int, default=2000, help="deep tree depth")
+    ap.add_argument("--width", type=int, default=20000, help="wide tree argument count")
+    ap.add_argument("--funcs", type=int, default=500, help="generated program size")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    # özyinelemeli gezinmeler için (walk() buna ihtiyaç duymaz)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), args.depth * 4 + 1000))
+
+    program = parse_text(generate(args.funcs), inline=True).program
+    shapes = [
+        ("deep", deep_tree(args.depth), True),
+        ("wide", wide_tree(args.width), True),
+        ("program", program, False),
+    ]
+    walkers = [
+        ("reflection", reflect_count),
+        ("isinstance", chain_count),
+        ("Visitor", visitor_count),
+        ("walk()", walk_count),
+    ]
+
+    for shape, root, expr_only in shapes:
+        for name, fn in walkers:
+            if name == "isinstance" and not expr_only:
+                continue
+            n, t = bench(fn, root, args.repeat)
+            print(f"  {shape:8s} {name:11s} nodes={n:7d}  {t * 1e3:8.2f} ms  {t / n * 1e9:7.1f} ns/node")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,97 @@
+"""
+task1 parse backend'lerinin uyumluluk kontrolü ve hız karşılaştırması.
+
+  1) examples_v1/*.v3 ve aşağıdaki kısa kaynaklar üzerinde her backend'in (iki
+     geçişli lark dahil) AST'si ve hata konumları (line/col) referans lark
+     inline backend'i ile birebir aynı olmalı.
+  2) Üretilmiş büyük kaynakta parse süreleri.
+
+treesitter backend'i ilk kullanımda C parser'ını derler (cc gerekir); bu
+süre ölçüme dahil değildir.
+
+Kullanım (repo kökünden):
+  python tools/compare_backends.py --backends pratt --funcs 2000
+  python tools/compare_backends.py --backends treesitter --funcs 0
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "python"))
+
+from gen_big_v3 import generate  # noqa: E402
+from task1.parser import parse_text  # noqa: E402
+
+
+# yerleşik tip adıyla başlayan özel tipler ve tip/ad sınırları
+SNIPPETS = {
+    "type integer": "function f()\ndim x as integer\nend function\n",
+    "type stringy": "function f()\ndim s as stringy\nend function\n",
+    "arg byteArr": "function f(a as byteArr)\nend function\n",
+    "ret integer": "function f() as integer\nend function\n",
+    "builtins": "function f(a as int, b as string, c as uint) as long\ndim d as char\nend function\n",
+    "ident integer": "function f()\ninteger = 5;\nend function\n",
+    # dizi boyutu = virgül sayısı + 1; iki geçişli ve inline aynı sayıyı vermeli
+    "array ranks": "function f(a as int(,), b as T(,,)(,,,)) as int()\ndim x as char(,,,,)\nend function\n",
+    # ASCII dışı metin: tree-sitter byte ofsetleri karakter ofsetine çevrilmeli
+    "non-ascii": "function f() // çalışır\ns = \"ğüş\";\nc = 'ö';\nend function\n",
+}
+
+
+def _key(res):
+    return res.program, [(e.line, e.column) for e in res.errors]
+
+
+def check(backends: list[str]) -> int:
+    # referans: lark inline; iki geçişli lark da aynı AST'yi vermeli
+    rows = [("two-pass", dict(inline=False))] + [(b, dict(backend=b)) for b in backends]
+    cases = [(src.name, src.read_text(encoding="utf-8")) for src in sorted((ROOT / "examples_v1").glob("*.v3"))]
+    cases += SNIPPETS.items()
+    bad = 0
+    for name, text in cases:
+        ref = _key(parse_text(text, inline=True))
+        for b, kw in rows:
+            ok = _key(parse_text(text, **kw)) == ref
+            bad += not ok
+            print(f"  {name:28s} {b:12s} {'OK' if ok else 'MISMATCH'}")
+    return bad
+
+
+def bench(backends: list[str], text: str, runs: int) -> None:
+    rows = [("lark (two-pass)", dict(inline=False)), ("lark (inline)", dict(inline=True))]
+    rows += [(b, dict(backend=b)) for b in backends]
+    base = None
+    for name, kw in rows:
+        parse_text("", **kw)  # parser/tablo hazırlığı ölçüme dahil değil
+        best = float("inf")
+        for _ in range(runs):
+            t0 = time.perf_counter()
+            res = parse_text(text, **kw)
+            best = min(best, time.perf_counter() - t0)
+            assert not res.errors, res.errors[0].message
+        base = base or best
+        print(f"  {name:18s} {best * 1000:9.1f} ms  x{base / best:.2f}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--backends", nargs="+", default=["pratt", "treesitter"])
+    ap.add_argument("--funcs", type=int, default=2000, help="generated function count (0 = skip benchmark)")
+    ap.add_argument("--runs", type=int, default=3)
+    args = ap.parse_args()
+
+    print("conformance (examples_v1 vs lark inline):")
+    bad = check(args.backends)
+    if args.funcs:
+        text = generate(args.funcs)
+        print(f"benchmark ({len(text)} chars, best of {args.runs}):")
+        bench(args.backends, text, args.runs)
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
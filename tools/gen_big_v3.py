@@ -0,0 +1,63 @@
+"""
+Benchmark'lar için büyük, sözdizimi doğru .v3 kaynağı üretir.
+
+  python tools/gen_big_v3.py 5000 out/big.v3
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+_FUNC = """function f{i}(a as int, b as int) as int
+dim x, y, c as int
+x = a + b * 2;
+c = (x == 32) or (x == 9);
+if x > 0 then
+  y = x * 2;
+else
+  y = 0;
+end if
+while y > 0
+  y = y - 1;
+  x = f{callee}(x, y - 1);
+wend
+do
+  x = x + 1;
+  break
+loop until x > 10
+f{i} = x;
+end function
+
+"""
+
+_MAIN = """function main(a as int, b as int) as int
+dim r as int
+r = f0(a, b);
+main = r;
+end function
+"""
+
+
+def generate(n_funcs: int) -> str:
+    parts = []
+    for i in range(n_funcs):
+        callee = (i * 7 + 1) % max(n_funcs, 1)
+        parts.append(_FUNC.format(i=i, callee=callee))
+    parts.append(_MAIN)
+    return "".join(parts)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("n_funcs", type=int)
+    ap.add_argument("output")
+    args = ap.parse_args()
+    out = Path(args.output)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(generate(args.n_funcs), encoding="utf-8")
+    print(f"OK: {out.resolve()} ({out.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())